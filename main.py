@@ -22,23 +22,56 @@ if __name__ == '__main__':
                         dest='date_range')
     parser.add_argument('--update_to_current', help='Update up to today\'s date from the last collected date.',
                         dest='update_to_current', action='store_true')
+    parser.add_argument('--workers', help='(int) Number of days fetched at the same time with --with_date_range.',
+                        dest='workers', type=int)
+    parser.add_argument('--requests_per_second', help='(float) Maximum request rate with --with_date_range.',
+                        dest='requests_per_second', type=float)
+    parser.add_argument('--no_cache', help='(bool) Indicates if the scraper response cache should not be used.',
+                        dest='no_cache', action='store_true')
+    parser.add_argument('--no_calendar', help='(bool) Indicates if every day should be searched instead of only '
+                                              'the days with scheduled games.',
+                        dest='no_calendar', action='store_true')
+    parser.add_argument('--data_path', help='Path of the player box score csv, or of a box score store directory.',
+                        dest='data_path')
+    parser.add_argument('--append_only', help='(bool) Indicates if new rows should only be appended to the data '
+                                              'instead of rewriting it.',
+                        dest='append_only', action='store_true')
+    parser.add_argument('--daemon', help='(bool) Indicates if the application should keep running, keeping the data '
+                                          'in memory and polling for new games.',
+                        dest='daemon', action='store_true')
+    parser.add_argument('--poll_seconds', help='(int) Seconds between polls on game nights with --daemon.',
+                        dest='poll_seconds', type=int)
+    parser.add_argument('--max_poll_seconds', help='(int) Maximum seconds between polls on game nights with --daemon.',
+                        dest='max_poll_seconds', type=int)
+    parser.add_argument('--idle_seconds', help='(int) Seconds between polls on other days with --daemon.',
+                        dest='idle_seconds', type=int)
     parser.set_defaults(yesterday=False, log=False, plot=False, gather_new=False, date_range='',
-                        update_to_current=False)
+                        update_to_current=False, no_cache=False, no_calendar=False, append_only=False, workers=4,
+                        requests_per_second=1.0, data_path='player_box_scores.csv', daemon=False, poll_seconds=900,
+                        max_poll_seconds=3600, idle_seconds=21600)
     args = parser.parse_args()
 
     date = datetime.datetime.now()
     if args.yesterday:
         date -= datetime.timedelta(days=1)
 
-    app = application.Application()
-    if args.date_range == '':
+    app = application.Application(cache_dir=None if args.no_cache else 'response_cache',
+                                  calendar_path=None if args.no_calendar else 'game_calendar.json',
+                                  data_path=args.data_path)
+    if args.daemon:
+        app.run_daemon(poll_seconds=args.poll_seconds, max_poll_seconds=args.max_poll_seconds,
+                       idle_seconds=args.idle_seconds, should_log=args.log, max_workers=args.workers,
+                       requests_per_second=args.requests_per_second)
+    elif args.date_range == '':
         gather_new = args.gather_new
         if args.update_to_current:
             gather_new = 'update_to_current'
-        app.run(date=date, should_log=args.log, plot=args.plot, gather_new=gather_new)
+        app.run(date=date, should_log=args.log, plot=args.plot, gather_new=gather_new,
+                append_only=args.append_only)
     else:
         dates = args.date_range.split('*')
-        app.run_with_date_range(start_date=dates[0], end_date=dates[1])
+        app.run_with_date_range(start_date=dates[0], end_date=dates[1], max_workers=args.workers,
+                                requests_per_second=args.requests_per_second)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -6,6 +6,7 @@
 import datetime
 import os
 import io
+import weakref
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
@@ -18,40 +19,121 @@ from basketball_reference_web_scraper import client
 # relative imports
 from .constants import Vars
 from .team_box_score import TeamBoxScore
+from .storage import BoxScoreStore
+from . import backfill
+from . import schema
+from .metrics import MetricRegistry
+from .query import BoxScoreQuery
+from .game_results import GameResults
+from .player_index import PlayerIndex
+from .filters import BoxScoreFilter
+from . import top_k
+from . import ingest
+
+# optional on disk cache used by the fetch functions, see `set_response_cache`
+response_cache = None
+# names of every player loaded or fetched, see `resolve_player_name`
+player_index = PlayerIndex()
+# optional in memory cache of plots rendered to a buffer, see `set_plot_cache`
+plot_cache = None
+# save paths that return the plot instead of writing a file
+BUFFER_PATHS = ['svg_buffer', 'png_buffer']
+# game results of the last data frame looked up, see `get_game_results`
+game_results_cache = None
+
+
+def set_response_cache(cache):
+    """
+    Sets the response cache used in front of the scraper client. Passing None disables caching.
+
+    :param src.cache.ResponseCache cache: The cache to use.
+    """
+    global response_cache
+    response_cache = cache
+
+
+def set_plot_cache(cache):
+    """
+    Sets the cache of plots rendered to a buffer. Passing None disables caching.
+
+    :param src.plot_cache.PlotCache cache: The cache to use.
+    """
+    global plot_cache
+    plot_cache = cache
+
+
+def fetch_player_box_scores(date_obj, rate_limiter=None):
+    """
+    Gets every player box score for a single day, using the response cache if one is set.
+
+    :param datetime.datetime date_obj: The date to fetch.
+    :param src.backfill.RateLimiter rate_limiter: Optional limiter to wait on before a request is made.
+    :return: Player box score dictionaries from the scraper client.
+    :rtype: list
+    """
+    def fetch():
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        return client.player_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
+    if response_cache is None:
+        box_scores = fetch()
+    else:
+        box_scores = response_cache.fetch('player_box_scores', date_obj, fetch)
+    player_index.add([box_score['name'] for box_score in box_scores])
+    return box_scores
+
+
+def fetch_team_box_scores(date_obj, rate_limiter=None):
+    """
+    Gets every team box score for a single day, using the response cache if one is set.
 
+    :param datetime.datetime date_obj: The date to fetch.
+    :param src.backfill.RateLimiter rate_limiter: Optional limiter to wait on before a request is made.
+    :return: Team box score dictionaries from the scraper client.
+    :rtype: list
+    """
+    def fetch():
+        if rate_limiter is not None:
+            rate_limiter.wait()
+        return client.team_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
+    if response_cache is None:
+        return fetch()
+    return response_cache.fetch('team_box_scores', date_obj, fetch)
 
-def get_player_box_score(name, logger, date_obj=None, timeout=3):
+
+def get_player_box_score(name, logger, date_obj=None, timeout=3, calendar=None):
     """
-    Gets the box score for the desired player.
+    Gets the box score for the desired player. Names are compared without accents or case, ex: Luka Doncic finds
+    Luka Dončić.
 
     :param str name: Name of the player to search for.
     :param logger: Logging object.
     :param datetime.datetime date_obj: Datetime object for starting day to search.
     :param int timeout: Number of days to search before giving up.
+    :param src.schedule.GameCalendar calendar: Optional game calendar, when provided only game days are searched
+        and the timeout counts game days.
     :return: Box score for the player if found.
     :rtype: dict
     """
-    name = name.lower()
+    name = PlayerIndex.normalize(name)
     if date_obj is None:
         date_obj = datetime.datetime.today()
     bs = None
-    while True:
-        if timeout > 0:
-            logger.info('Attempting date: %s' % date_obj.strftime('%y-%m-%d'))
-            found = False
-            box_scores = client.player_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
-            for box_score in box_scores:
-                if name in box_score['name'].lower():
-                    bs = box_score
-                    found = True
-                    break
-            if found:
+    search_dates = get_search_dates(date_obj, timeout, calendar=calendar)
+    for search_date in search_dates:
+        logger.info('Attempting date: %s' % search_date.strftime('%y-%m-%d'))
+        box_scores = fetch_player_box_scores(search_date)
+        for box_score in box_scores:
+            if name in PlayerIndex.normalize(box_score['name']):
+                bs = box_score
                 break
-            date_obj -= datetime.timedelta(days=1)
-            timeout -= 1
-        else:
-            logger.info("Timeout reached.")
+        if bs is not None:
+            date_obj = search_date
             break
+    else:
+        logger.info("Timeout reached.")
+        if search_dates:
+            date_obj = search_dates[-1] - datetime.timedelta(days=1)
     return bs, date_obj
 
 
@@ -69,7 +151,7 @@ def get_team_box_score(team, date_obj=None, timeout=3):
     team_bs = None
     while True:
         if timeout > 0:
-            team_bs = client.team_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
+            team_bs = fetch_team_box_scores(date_obj)
             # todo
             date_obj -= datetime.timedelta(days=1)
             timeout -= 1
@@ -78,35 +160,58 @@ def get_team_box_score(team, date_obj=None, timeout=3):
     return team_bs
 
 
-def get_daily_box_scores(date_obj=None, timeout=1):
+def get_daily_box_scores(date_obj=None, timeout=1, single_request=False, calendar=None):
     """
     Gets all player box scores for a specific day. The default for this is only the one date specified.
 
     :param datetime.datetime date_obj: Datetime object for starting day to search.
     :param int timeout: Number of days to search before giving up.
+    :param bool single_request: Indicates if the teams should be taken from the player box scores instead of
+        requesting the team box scores, halving the number of requests per day.
+    :param src.schedule.GameCalendar calendar: Optional game calendar, when provided only game days are searched
+        and the timeout counts game days.
     :return: All box scores sorted by team.
     :rtype: OrderedDict
     """
     team_dict = OrderedDict()
     if date_obj is None:
         date_obj = datetime.datetime.today()
-    while True:
-        if timeout > 0:
-            teams = get_teams_played_on_date(date_obj=date_obj)
+    search_dates = get_search_dates(date_obj, timeout, calendar=calendar)
+    for search_date in search_dates:
+        if single_request:
+            all_box_scores = fetch_player_box_scores(search_date)
+            if len(all_box_scores) > 0:
+                team_dict = group_box_scores_by_game(all_box_scores)
+                return team_dict, search_date
+        else:
+            teams = get_teams_played_on_date(date_obj=search_date)
             if len(teams) > 0:
-                all_box_scores = client.player_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
+                all_box_scores = fetch_player_box_scores(search_date)
                 for team in teams:
                     team_dict[team] = []
                 for player in all_box_scores:
                     team_dict[player['team'].name].append(player)
-                break
-            date_obj -= datetime.timedelta(days=1)
-            timeout -= 1
-        else:
-            break
+                return team_dict, search_date
+    if search_dates:
+        date_obj = search_dates[-1] - datetime.timedelta(days=1)
     return team_dict, date_obj
 
 
+def get_search_dates(date_obj, timeout, calendar=None):
+    """
+    Gets the dates to search, most recent first, when looking backwards from a date.
+
+    :param datetime.datetime date_obj: Datetime object for starting day to search.
+    :param int timeout: Number of days to search.
+    :param src.schedule.GameCalendar calendar: Optional game calendar used to skip days without games.
+    :return: The dates to search
+    :rtype: list
+    """
+    if calendar is not None:
+        return calendar.get_previous_game_dates(date_obj, timeout)
+    return [date_obj - datetime.timedelta(days=days) for days in range(max(0, timeout))]
+
+
 def get_teams_played_on_date(date_obj=None, timeout=1):
     """
     Gets a list of all teams that played on the provided date.
@@ -121,7 +226,7 @@ def get_teams_played_on_date(date_obj=None, timeout=1):
         date_obj = datetime.datetime.today()
     while True:
         if timeout > 0:
-            team_box_scores = client.team_box_scores(day=date_obj.day, month=date_obj.month, year=date_obj.year)
+            team_box_scores = fetch_team_box_scores(date_obj)
             if len(team_box_scores) > 1:
                 teams = [entry['team'].name for entry in team_box_scores]
                 break
@@ -140,8 +245,18 @@ def convert_to_minutes(seconds_played):
     :return: Minutes played
     :rtype: float
     """
-    minutes = seconds_played / 60.0
-    return round(minutes, 2)
+    return float(convert_to_minutes_array(seconds_played))
+
+
+def convert_to_minutes_array(seconds_played):
+    """
+    Converts a column of seconds into minutes.
+
+    :param seconds_played: Seconds played, an array, series or number.
+    :return: Minutes played, rounded to two decimals
+    :rtype: numpy.ndarray
+    """
+    return np.round(np.asarray(seconds_played, dtype=np.float64) / 60.0, 2)
 
 
 def get_true_shooting(points, fga, tpfga, fta):
@@ -155,11 +270,26 @@ def get_true_shooting(points, fga, tpfga, fta):
     :return:  True shooting percentage
     :rtype: float
     """
-    try:
-        ts = points / (2.0 * ((fga + tpfga) + 0.44 * fta))
-    except ZeroDivisionError:
-        ts = 0
-    return round(ts, 3)
+    return float(get_true_shooting_array(points, fga, tpfga, fta))
+
+
+def get_true_shooting_array(points, fga, tpfga, fta):
+    """
+    Calculates true shooting percentage of whole columns. Rows without any attempts are 0.
+
+    :param points: Points
+    :param fga: Field goals attempted
+    :param tpfga: Three point field goals attempted
+    :param fta: Free throws attempted
+    :return: True shooting percentages, rounded to three decimals
+    :rtype: numpy.ndarray
+    """
+    points = np.asarray(points, dtype=np.float64)
+    attempts = 2.0 * ((np.asarray(fga, dtype=np.float64) + np.asarray(tpfga, dtype=np.float64)) +
+                      0.44 * np.asarray(fta, dtype=np.float64))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ts = np.where(attempts == 0, 0.0, points / attempts)
+    return np.round(ts, 3)
 
 
 def get_assist_turnover_ratio(assists, turnovers):
@@ -171,11 +301,101 @@ def get_assist_turnover_ratio(assists, turnovers):
     :return: The ratio
     :rtype: float
     """
-    try:
-        ratio = float(assists) / turnovers
-    except ZeroDivisionError:
-        ratio = float(assists)
-    return round(ratio, 2)
+    return float(get_assist_turnover_ratio_array(assists, turnovers))
+
+
+def get_assist_turnover_ratio_array(assists, turnovers):
+    """
+    Calculates the ratio of assists to turnovers of whole columns. Rows without turnovers are the number of assists.
+
+    :param assists: Number of assists.
+    :param turnovers: Number of turnovers.
+    :return: The ratios, rounded to two decimals
+    :rtype: numpy.ndarray
+    """
+    assists = np.asarray(assists, dtype=np.float64)
+    turnovers = np.asarray(turnovers, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = np.where(turnovers == 0, assists, assists / turnovers)
+    return np.round(ratio, 2)
+
+
+def get_effective_field_goal_array(fgm, tpfgm, fga):
+    """
+    Calculates effective field goal percentage of whole columns, counting a made three as one and a half field goals.
+    Rows without attempts are 0.
+
+    :param fgm: Field goals made
+    :param tpfgm: Three point field goals made
+    :param fga: Field goals attempted
+    :return: Effective field goal percentages, rounded to three decimals
+    :rtype: numpy.ndarray
+    """
+    fga = np.asarray(fga, dtype=np.float64)
+    made = np.asarray(fgm, dtype=np.float64) + 0.5 * np.asarray(tpfgm, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        efg = np.where(fga == 0, 0.0, made / fga)
+    return np.round(efg, 3)
+
+
+def get_per_36_array(stat, seconds_played):
+    """
+    Calculates a stat per 36 minutes played of whole columns. Rows without playing time are 0.
+
+    :param stat: The stat values.
+    :param seconds_played: Seconds played.
+    :return: The stat per 36 minutes, rounded to two decimals
+    :rtype: numpy.ndarray
+    """
+    seconds_played = np.asarray(seconds_played, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.where(seconds_played == 0, 0.0, np.asarray(stat, dtype=np.float64) * 2160.0 / seconds_played)
+    return np.round(rate, 2)
+
+
+def create_metric_registry():
+    """
+    Creates a registry holding the derived stats added to every player box score.
+
+    :return: The metric registry
+    :rtype: MetricRegistry
+    """
+    registry = MetricRegistry()
+    registry.register('minutes_played', lambda df: convert_to_minutes_array(df['seconds_played']),
+                      ['seconds_played'])
+    registry.register('true_shooting',
+                      lambda df: get_true_shooting_array(df['points'],
+                                                         df['attempted_field_goals'],
+                                                         df['attempted_three_point_field_goals'],
+                                                         df['attempted_free_throws']),
+                      ['points', 'attempted_field_goals', 'attempted_three_point_field_goals',
+                       'attempted_free_throws'])
+    registry.register('assist_turnover_ratio',
+                      lambda df: get_assist_turnover_ratio_array(df['assists'], df['turnovers']),
+                      ['assists', 'turnovers'])
+    registry.register('effective_field_goal',
+                      lambda df: get_effective_field_goal_array(df['made_field_goals'],
+                                                                df['made_three_point_field_goals'],
+                                                                df['attempted_field_goals']),
+                      ['made_field_goals', 'made_three_point_field_goals', 'attempted_field_goals'])
+    # possessions a player used: shots, trips to the line and turnovers
+    registry.register('usage_proxy',
+                      lambda df: np.round(df['attempted_field_goals'].to_numpy(dtype=np.float64) +
+                                          0.44 * df['attempted_free_throws'].to_numpy(dtype=np.float64) +
+                                          df['turnovers'].to_numpy(dtype=np.float64), 2),
+                      ['attempted_field_goals', 'attempted_free_throws', 'turnovers'])
+    for stat in ['points', 'rebounds', 'assists']:
+        registry.register('%s_per_36' % stat,
+                          lambda df, stat=stat: get_per_36_array(df[stat], df['seconds_played']),
+                          [stat, 'seconds_played'])
+    registry.register('stocks',
+                      lambda df: df['steals'].to_numpy(dtype=np.float64) + df['blocks'].to_numpy(dtype=np.float64),
+                      ['steals', 'blocks'])
+    return registry
+
+
+# derived stats added by `add_derived_stats`, register a metric here to add a column
+metric_registry = create_metric_registry()
 
 
 def check_supported_stats(stats):
@@ -204,37 +424,88 @@ def convert_team_name(team):
     return team.title().replace('_', ' ')
 
 
+def resolve_player_name(name, df=None, fuzzy=True):
+    """
+    Resolves a player name typed by a user into a stored player name, ignoring accents and case and allowing
+    prefixes and misspellings, see `PlayerIndex.resolve`.
+
+    :param str name: The name to look up, ex: luka doncic.
+    :param df: Optional pandas.DataFrame or BoxScoreQuery to resolve against, the names of every player loaded or
+        fetched otherwise.
+    :param bool fuzzy: Indicates if prefix and fuzzy matches are allowed, only normalized exact matches otherwise.
+    :return: The player name, None if nothing matches
+    :rtype: str
+    """
+    if isinstance(df, BoxScoreQuery):
+        return df.get_player_index().resolve(name, fuzzy=fuzzy)
+    if df is not None:
+        return PlayerIndex(df.index.unique()).resolve(name, fuzzy=fuzzy)
+    return player_index.resolve(name, fuzzy=fuzzy)
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 # Pandas interactions
 # ----------------------------------------------------------------------------------------------------------------------
-def get_existing_data_frame(csv_path, logger):
+def get_existing_data_frame(csv_path, logger, compact=False):
     """
     Determines if a data frame already exists, and returns the data frame if true. Returns None if does not exist.
 
-    :param str csv_path: Path of the csv file.
+    :param str csv_path: Path of the csv file, or of a box score store directory.
     :param logger: Instance of logger object.
+    :param bool compact: Indicates if the data should be loaded in the compact schema, see `schema.to_compact`.
     :return: Data frame if exists, None otherwise
     :rtype: pd.DataFrame
     """
     df = None
-    if os.path.exists(csv_path):
+    if BoxScoreStore.is_store(csv_path):
+        df = BoxScoreStore(csv_path).read()
+        if df is not None:
+            logger.info("Existing box score store found.")
+            if compact:
+                df = schema.to_compact(df)
+    elif os.path.exists(csv_path):
         logger.info("Existing data frame found.")
-        df = pd.read_csv(csv_path, index_col=0)
+        if compact:
+            df = schema.read_csv(csv_path)
+        else:
+            df = pd.read_csv(csv_path, index_col=0)
+    if df is not None:
+        player_index.add(df.index.unique())
     return df
 
 
-def gather_new_on_date(date, csv, logger):
+def save_data_frame(df, csv_path, dates=None):
+    """
+    Saves a data frame to a csv file or a box score store.
+
+    :param pandas.DataFrame df: The data frame to save.
+    :param str csv_path: Path of the csv file, or of a box score store directory.
+    :param list dates: Optional 'year_month_day' dates that changed. A store only rewrites those partitions, a csv
+        is always rewritten in full.
+    """
+    if BoxScoreStore.is_store(csv_path):
+        BoxScoreStore(csv_path).write(df, dates=dates)
+    elif schema.is_compact(df):
+        schema.to_legacy(df).to_csv(csv_path)
+    else:
+        df.to_csv(csv_path)
+
+
+def gather_new_on_date(date, csv, logger, append_only=False):
     """
     Gathers new player box score data from a specific date and updates the given csv if provided.
 
     :param datetime.datetime date: The date to search on
-    :param str csv: The path to the csv
+    :param str csv: The path to the csv, or to a box score store directory
     :param logger: Logging object
-    :return: The pandas.DataFrame object
+    :param bool append_only: Indicates if only the new rows should be appended, without loading the existing data
+    :return: The pandas.DataFrame object, only the appended rows if append_only is set
     """
     team_box_scores = []
-    df = get_existing_data_frame(csv, logger=logger)
-    daily_box_scores, found_date = get_daily_box_scores(date_obj=date)
+    df = None
+    if not append_only:
+        df = get_existing_data_frame(csv, logger=logger)
+    daily_box_scores, found_date = get_daily_box_scores(date_obj=date, single_request=True)
     for team in daily_box_scores.keys():
         team_box_scores.append(TeamBoxScore(box_scores=daily_box_scores[team],
                                             team_box_score=[],
@@ -242,32 +513,306 @@ def gather_new_on_date(date, csv, logger):
                                             date=found_date))
 
     new_df = create_data_frame_from_team_box_scores(team_box_scores=team_box_scores, logger=logger)
+    if append_only:
+        if new_df.shape[0] > 0:
+            add_derived_stats(new_df)
+        return append_new_data_frame(new_df, csv, logger)
+    return save_merged_data_frame(df, new_df, csv, logger)
+
+
+def gather_new_on_dates(dates, csv, logger, df=None, max_workers=4, requests_per_second=1.0, append_only=False):
+    """
+    Gathers new player box score data from many dates, then merges and updates the given csv only once.
+
+    :param list dates: The datetime.datetime objects to search on
+    :param str csv: The path to the csv, or to a box score store directory
+    :param logger: Logging object
+    :param pandas.DataFrame df: The existing data, read from the csv if not provided unless append_only is set
+    :param int max_workers: Maximum number of dates fetched at the same time
+    :param float requests_per_second: Maximum request rate to basketball reference
+    :param bool append_only: Indicates if only the new rows should be appended to the csv or store
+    :return: The pandas.DataFrame object. With append_only and no existing data, only the appended rows.
+    """
+    if df is None and not append_only:
+        df = get_existing_data_frame(csv, logger=logger)
+    daily_box_scores, failed = backfill.fetch_days(dates, fetch_player_box_scores, logger,
+                                                   max_workers=max_workers,
+                                                   requests_per_second=requests_per_second)
+    for date_obj in failed:
+        logger.info('Could not gather date: %s' % date_obj.strftime('%y_%m_%d'))
+    new_df = create_data_frame_from_daily_box_scores(daily_box_scores, logger)
+    if new_df.shape[0] == 0:
+        logger.info('No new box scores found.')
+        return df
+    if append_only:
+        appended_df = append_new_data_frame(new_df, csv, logger)
+        if df is None:
+            return appended_df
+        return pd.concat([df, appended_df], sort=False)
+    return save_merged_data_frame(df, new_df, csv, logger)
+
+
+def save_merged_data_frame(df, new_df, csv, logger):
+    """
+    Merges new player box scores into the existing data and saves the result. Only the new dates are rewritten in a
+    box score store, unless a derived stat had to be calculated for every row.
+
+    :param pandas.DataFrame df: The existing data, or None if there is none
+    :param pandas.DataFrame new_df: The new data
+    :param str csv: The path to the csv, or to a box score store directory
+    :param logger: Logging object
+    :return: The merged pandas.DataFrame object
+    """
+    versions = metric_registry.load_versions(csv)
+    stale = metric_registry.get_stale(df, versions) if df is not None else []
+    df = merge_new_data_frame(df, new_df, logger, versions=versions)
+    save_data_frame(df, csv, dates=None if stale else list(new_df['date'].unique()))
+    metric_registry.save_versions(csv)
+    return df
+
+
+def append_new_data_frame(new_df, csv, logger):
+    """
+    Appends new player box scores to a csv or box score store, skipping rows whose (player, date) key is already
+    stored. The existing rows are never rewritten.
+
+    :param pandas.DataFrame new_df: The new data, including derived stats
+    :param str csv: The path to the csv, or to a box score store directory
+    :param logger: Logging object
+    :return: The rows that were appended
+    :rtype: pd.DataFrame
+    """
+    if BoxScoreStore.is_store(csv):
+        appended_df = BoxScoreStore(csv).append(new_df)
+    else:
+        appended_df = append_to_csv(new_df, csv)
+    logger.info('Appended %s new rows, skipped %s existing' % (appended_df.shape[0],
+                                                               new_df.shape[0] - appended_df.shape[0]))
+    return appended_df
+
+
+def truncate_partial_line(csv_path):
+    """
+    Truncates a csv back to the end of its last complete line, removing a row left partly written by a crash.
+
+    :param str csv_path: Path of the csv file
+    :return: Number of bytes removed
+    :rtype: int
+    """
+    with open(csv_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        end = size
+        # search backwards for the last newline
+        while end > 0:
+            start = max(0, end - 4096)
+            f.seek(start)
+            newline = f.read(end - start).rfind(b'\n')
+            if newline >= 0:
+                end = start + newline + 1
+                break
+            end = start
+        if end == 0 or end == size:
+            # no complete line, or nothing to remove
+            return 0
+        f.truncate(end)
+        f.flush()
+        os.fsync(f.fileno())
+    return size - end
+
+
+def append_to_csv(new_df, csv_path):
+    """
+    Appends player box scores to the end of a csv, skipping rows whose (player, date) key is already in the csv.
+    Only the name and date columns of the existing csv are read. A row left partly written by an earlier crash is
+    removed first. If the write fails the csv is truncated back to its previous size. Columns that are not in the
+    csv header are not written.
+
+    :param pandas.DataFrame new_df: The new data
+    :param str csv_path: Path of the csv file
+    :return: The rows that were appended
+    :rtype: pd.DataFrame
+    """
+    new_keys = pd.MultiIndex.from_arrays([new_df.index, new_df['date']])
+    if not os.path.exists(csv_path):
+        new_rows = new_df[~new_keys.duplicated()]
+        new_rows.to_csv(csv_path)
+        return new_rows
+    truncate_partial_line(csv_path)
+    header = pd.read_csv(csv_path, index_col=0, nrows=0).columns
+    keys_df = pd.read_csv(csv_path, usecols=[0, header.get_loc('date') + 1])
+    existing_keys = pd.MultiIndex.from_arrays([keys_df.iloc[:, 0], keys_df['date']])
+    new_rows = new_df[~new_keys.isin(existing_keys) & ~new_keys.duplicated()]
+    if new_rows.shape[0] == 0:
+        return new_rows
+    text = new_rows.reindex(columns=header).to_csv(header=False)
+    with open(csv_path, 'rb+') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size > 0:
+            f.seek(size - 1)
+            if f.read(1) != b'\n':
+                text = '\n' + text
+        try:
+            f.write(text.encode('utf-8'))
+            f.flush()
+            os.fsync(f.fileno())
+        except Exception:
+            f.truncate(size)
+            raise
+    return new_rows
+
+
+def merge_new_data_frame(df, new_df, logger, versions=None):
+    """
+    Merges newly gathered player box scores into the existing data, see `upsert_data_frame`. Derived stats are only
+    calculated for the new rows, and for existing rows of stats that are new or changed version.
+
+    :param pandas.DataFrame df: The existing data, or None if there is none
+    :param pandas.DataFrame new_df: The new data
+    :param logger: Logging object
+    :param dict versions: Versions of the derived stats in the existing data, see `MetricRegistry.load_versions`
+    :return: The merged pandas.DataFrame object
+    """
+    add_derived_stats(new_df, versions=metric_registry.get_versions())
     if df is None:
         logger.info('There was not an existing data frame.')
-        df = new_df
-    else:
-        logger.info('Appending new data frame of shape: %s' % (new_df.shape,))
-        temp_df = df.append(new_df, sort=False)
-        temp_size = temp_df.shape[0]
-        # add new columns with ops from existing data
-        temp_df['minutes_played'] = temp_df['seconds_played'].apply(convert_to_minutes)
-        temp_df['true_shooting'] = temp_df.apply(
-            lambda x: get_true_shooting(x['points'],
-                                        x['attempted_field_goals'],
-                                        x['attempted_three_point_field_goals'],
-                                        x['attempted_free_throws']),
-            axis=1)
-        temp_df['assist_turnover_ratio'] = temp_df.apply(
-            lambda x: get_assist_turnover_ratio(x['assists'],
-                                                x['turnovers']),
-            axis=1)
-        temp_df.drop_duplicates(inplace=True)
-        temp_size = temp_size - temp_df.shape[0]
-        logger.info('Dropped %s duplicates' % temp_size)
-        logger.info('Dropped %s duplicates' % temp_size)
-        df = temp_df
-        logger.info('Shape of DataFrame object: %s' % (df.shape,))
-    df.to_csv(csv)
+        return new_df
+    logger.info('Appending new data frame of shape: %s' % (new_df.shape,))
+    if schema.is_compact(df):
+        new_df = schema.to_compact(new_df)
+    stale = metric_registry.materialize(df, versions=versions if versions is not None else {})
+    if stale:
+        logger.info('Calculated derived stats for every row: %s' % ', '.join(stale))
+    temp_df, inserted, updated = upsert_data_frame(df, new_df)
+    logger.info('Inserted %s rows, updated %s rows' % (inserted, updated))
+    logger.info('Shape of DataFrame object: %s' % (temp_df.shape,))
+    return temp_df
+
+
+def get_row_keys(df):
+    """
+    Gets the key of every player box score row, the player name, date and team.
+
+    :param pandas.DataFrame df: The player box scores, indexed by player name.
+    :return: The keys, looked up through a hash table
+    :rtype: pd.MultiIndex
+    """
+    return pd.MultiIndex.from_arrays([df.index, df['date'], df['team']])
+
+
+def upsert_data_frame(df, new_df):
+    """
+    Inserts new player box scores, or replaces the existing row with the same (player, date, team) key in place, ex: a
+    stat corrected after the game. When the new data has the same key more than once the last row is kept.
+
+    :param pandas.DataFrame df: The existing data
+    :param pandas.DataFrame new_df: The new data
+    :return: The updated data frame, the number of rows inserted and the number of rows updated
+    :rtype: tuple
+    """
+    keys = get_row_keys(df)
+    if not keys.is_unique:
+        df = df[~keys.duplicated(keep='last')]
+        keys = get_row_keys(df)
+    new_df = new_df[~get_row_keys(new_df).duplicated(keep='last')]
+    positions = keys.get_indexer(get_row_keys(new_df))
+    found = positions >= 0
+    df = df.copy()
+    for column in new_df.columns:
+        if column not in df.columns:
+            df[column] = np.nan
+    if found.any():
+        rows = positions[found]
+        for column in new_df.columns:
+            df.iloc[rows, df.columns.get_loc(column)] = new_df[column].to_numpy()[found]
+    inserted_df = new_df[~found]
+    if inserted_df.shape[0] > 0:
+        df = pd.concat([df, inserted_df], sort=False)
+    return df, int(inserted_df.shape[0]), int(found.sum())
+
+
+def get_changed_row_count(df, new_df):
+    """
+    Counts the new player box scores that are not already in the existing data with the same stats, ex: rows of a
+    game in progress fetched again before any stat changed are not counted.
+
+    :param pandas.DataFrame df: The existing data, or None if there is none
+    :param pandas.DataFrame new_df: The new data
+    :return: Number of rows that would be inserted or updated
+    :rtype: int
+    """
+    if df is None or df.shape[0] == 0:
+        return int(new_df.shape[0])
+    if schema.is_compact(df):
+        df = schema.to_legacy(df)
+    columns = [stat for stat in Vars.supported_stats if stat in df.columns and stat in new_df.columns]
+    existing_df = df[df['date'].isin(new_df['date'].unique())]
+
+    def get_row_hashes(frame):
+        # numbers are compared as floats, the csv and the scraper do not always agree on integer types
+        frame = pd.DataFrame({column: frame[column].astype(np.float64)
+                              if pd.api.types.is_numeric_dtype(frame[column]) else frame[column].astype(str)
+                              for column in columns}, index=frame.index)
+        return pd.util.hash_pandas_object(frame, index=True).to_numpy()
+
+    return int(np.count_nonzero(~np.isin(get_row_hashes(new_df), get_row_hashes(existing_df))))
+
+
+def add_derived_stats(df, versions=None):
+    """
+    Adds the columns of the registered derived stats to a data frame, in place. See `metric_registry`.
+
+    :param pandas.DataFrame df: The data frame to update.
+    :param dict versions: Versions of the derived stats already in the data frame. Up to date stats are only
+        calculated for the rows missing them. None calculates every stat for every row.
+    :return: The updated data frame
+    :rtype: pd.DataFrame
+    """
+    metric_registry.materialize(df, versions=versions)
+    return df
+
+
+def group_box_scores_by_game(box_scores):
+    """
+    Groups player box scores by team, with the away team of each game directly followed by its home team.
+    This matches the team order of the team box scores without having to request them.
+
+    :param list box_scores: Player box score dictionaries from the scraper client.
+    :return: Player box scores keyed by team name.
+    :rtype: OrderedDict
+    """
+    team_dict = OrderedDict()
+    for player in box_scores:
+        team = player['team'].name
+        if team not in team_dict:
+            opponent = player['opponent'].name
+            if player['location'].name == 'AWAY':
+                team_dict[team] = []
+                team_dict.setdefault(opponent, [])
+            else:
+                team_dict.setdefault(opponent, [])
+                team_dict[team] = []
+        team_dict[team].append(player)
+    return team_dict
+
+
+def create_data_frame_from_daily_box_scores(daily_box_scores, logger):
+    """
+    Creates a pandas data frame object, including derived stats, from player box scores of many days.
+
+    The scraper results are converted straight into column arrays, see `ingest.create_data_frame`, without creating
+    BoxScore or TeamBoxScore objects. The rows are the same as `create_data_frame_from_team_box_scores`.
+
+    :param dict daily_box_scores: Player box score dictionaries keyed by datetime.datetime date.
+    :param logger: Instance of logger object
+    :return: Pandas data frame
+    :rtype: pd.DataFrame
+    """
+    logger.info(" Creating new data frame from %s days" % len(daily_box_scores))
+    df = ingest.create_data_frame(daily_box_scores)
+    if df.shape[0] > 0:
+        add_derived_stats(df)
     return df
 
 
@@ -285,32 +830,14 @@ def create_data_frame_from_team_box_scores(team_box_scores, logger):
     index = []
     for stat in Vars.supported_stats:
         data[stat] = []
-    for tbs in team_box_scores:
-        index.extend(tbs.get_players())
-        data['points'].extend(tbs.get_points())
-        data['rebounds'].extend(tbs.get_rebounds())
-        data['assists'].extend(tbs.get_assists())
-        data['made_field_goals'].extend(tbs.get_made_field_goals())
-        data['made_three_point_field_goals'].extend(tbs.get_made_three_point_field_goals())
-        data['made_free_throws'].extend(tbs.get_made_free_throws())
-        data['offensive_rebounds'].extend(tbs.get_offensive_rebounds())
-        data['defensive_rebounds'].extend(tbs.get_defensive_rebounds())
-        data['team'].extend(tbs.get_teams())
-        data['location'].extend(tbs.get_locations())
-        data['opponent'].extend(tbs.get_opponents())
-        data['outcome'].extend(tbs.get_outcomes())
-        data['seconds_played'].extend(tbs.get_seconds_played())
-        data['attempted_three_point_field_goals'].extend(tbs.get_attempted_three_point_field_goals())
-        data['attempted_free_throws'].extend(tbs.get_attempted_free_throws())
-        data['attempted_field_goals'].extend(tbs.get_attempted_field_goals())
-        data['steals'].extend(tbs.get_steals())
-        data['blocks'].extend(tbs.get_blocks())
-        data['turnovers'].extend(tbs.get_turnovers())
-        data['personal_fouls'].extend(tbs.get_personal_fouls())
-        data['game_score'].extend(tbs.get_game_scores())
-        data['date'].extend(tbs.get_dates())
-
-    if data['team']:
+    # every team is sorted once, then each column is joined in one step
+    columns = [tbs.to_columns() for tbs in team_box_scores if tbs.player_box_scores]
+    if columns:
+        index = np.concatenate([team_columns['player'] for team_columns in columns])
+        for stat in Vars.supported_stats:
+            data[stat] = np.concatenate([team_columns[stat] for team_columns in columns])
+
+    if len(data['team']) > 0:
         teams = list(set(data['team']))
         for team in teams:
             logger.info('    %s' % team)
@@ -322,14 +849,16 @@ def get_team_date_df(df, team, date):
     """
     Attempts to make a pandas data frame of all player box scores on a certain day.
 
-    :param pandas.DataFrame df: The data frame to search.
+    :param df: The pandas.DataFrame to search, or a BoxScoreQuery to look the rows up in its indexes.
     :param str team: The team to search for.
     :param datetime.datetime date: The date to search on.
     :return: Team data frame if found
     """
     team_df = None
-    if isinstance(date, datetime.datetime):
-        converted_date = date.strftime('%y_%m_%d')
+    if isinstance(date, datetime.datetime) and isinstance(df, BoxScoreQuery):
+        team_df = df.select(team=team, date=date)
+    elif isinstance(date, datetime.datetime):
+        converted_date = schema.convert_date(date, schema.is_compact(df))
         team_df = df[(df['date'] == converted_date) & (df['team'] == team)]
     return team_df
 
@@ -338,15 +867,35 @@ def filter_df_on_team_names(df, teams):
     """
     Returns a new data frame object only containing rows where the team matches any of the provided team names.
 
-    :param pandas.DataFrame df: The data frame to search.
+    :param df: The pandas.DataFrame to search, or a BoxScoreQuery to look the rows up in its indexes.
     :param list teams: The teams to filter on.
     :return: Team filtered data frame, or the original if none of the specified teams are found.
     """
+    if isinstance(df, BoxScoreQuery):
+        return df.select(teams=teams)
     teams = [entry.upper().replace(' ', '_') for entry in teams]
     team_df = df[df['team'].isin(teams)]
     return team_df
 
 
+def add_seconds_filter(box_filter, min_seconds=None, max_seconds=None):
+    """
+    Adds playing time limits to a filter. Limits of 60 or more are compared to seconds played, smaller limits to
+    minutes played.
+
+    :param BoxScoreFilter box_filter: The filter to add to.
+    :param int min_seconds: Optional minimum playing time.
+    :param int max_seconds: Optional maximum playing time.
+    :return: The filter, for chaining
+    :rtype: BoxScoreFilter
+    """
+    if min_seconds is not None and isinstance(min_seconds, int):
+        box_filter.where('seconds_played' if min_seconds >= 60 else 'minutes_played', '>=', min_seconds)
+    if max_seconds is not None and isinstance(max_seconds, int):
+        box_filter.where('seconds_played' if max_seconds >= 60 else 'minutes_played', '<=', max_seconds)
+    return box_filter
+
+
 def get_most_recent_update_date(df, date_col='date'):
     """
     Gets the most recent date from the pandas.DataFrame provided.
@@ -361,22 +910,200 @@ def get_most_recent_update_date(df, date_col='date'):
     return datetime.datetime(year=int(temp_date[0]), month=int(temp_date[1]), day=int(temp_date[2]))
 
 
+def get_game_results(df):
+    """
+    Gets the game results of a data frame. The results of the last data frame are kept and reused until a different
+    data frame, or the same one with a different number of rows, is given. Use a GameResults directly to follow
+    changes made in place.
+
+    :param pandas.DataFrame df: The player box scores.
+    :return: The game results
+    :rtype: GameResults
+    """
+    global game_results_cache
+    if game_results_cache is not None:
+        frame_ref, rows, game_results = game_results_cache
+        if frame_ref() is df and rows == df.shape[0]:
+            return game_results
+    game_results = GameResults(df)
+    game_results_cache = (weakref.ref(df), df.shape[0], game_results)
+    return game_results
+
+
 def get_team_result_on_date(team, date, df):
     """
-    Calculates the team scores on a particular date.
+    Gets the team scores on a particular date.
 
     :param str team: Team to search for
     :param datetime.datetime date: The date to search on
-    :param pandas.DataFrame df: The data set to search in
-    :return: The score as a string, ex: 97-88. The desired team's score will always be first.
+    :param df: The pandas.DataFrame to search in, or the GameResults, or a BoxScoreQuery to use its GameResults.
+    :return: The score as a string, ex: 97-88. The desired team's score will always be first. None if the team did
+        not play on the date.
+    """
+    if isinstance(df, BoxScoreQuery):
+        df = df.get_game_results()
+    elif not isinstance(df, GameResults):
+        df = get_game_results(df)
+    return df.get_result(team, date)
+
+
+def save_plot(save_path, file_name, add_date=True):
+    """
+    Saves the current plot.
+
+    :param str save_path: A directory to save a png in its plots folder, 'svg_buffer' to get the svg text,
+        'png_buffer' to get the png bytes, or the path of the file to save.
+    :param str file_name: Name of the png saved in a directory.
+    :param bool add_date: Indicates if today's date is appended to the name of a png saved in a directory.
+    :return: The path of the saved plot, the svg text or the png bytes, None if save_path is None
+    """
+    plot_path = None
+    if save_path is not None:
+        if os.path.isdir(save_path):
+            if not os.path.exists(os.path.join(save_path, 'plots')):
+                os.mkdir(os.path.join(save_path, 'plots'))
+            if add_date:
+                ymd = datetime.datetime.now().strftime("%y%m%d")
+                file_name = '%s_%s' % (file_name, ymd)
+            plot_path = os.path.join(save_path, 'plots', file_name)
+            plt.savefig(plot_path)
+        else:
+            if save_path == 'svg_buffer':
+                fig_file = io.StringIO()
+                plt.savefig(fig_file, format='svg', bbox_inches='tight')
+                fig_data_svg = '<svg' + fig_file.getvalue().split('<svg')[1]
+                fig_file.close()
+                plot_path = fig_data_svg
+            elif save_path == 'png_buffer':
+                fig_file = io.BytesIO()
+                plt.savefig(fig_file, format='png')
+                plot_path = fig_file.getvalue()
+                fig_file.close()
+            else:
+                # save at the path given
+                plt.savefig(save_path)
+                plot_path = save_path
+            plt.clf()
+            plt.cla()
+            plt.close('all')
+    return plot_path
+
+
+def get_plot_cache_key(name, df, kwargs):
+    """
+    Gets the plot cache key of a plot, if it can be cached.
+
+    :param str name: Name of the plot and of its positional arguments.
+    :param pandas.DataFrame df: The plotted data, after filtering.
+    :param dict kwargs: The keyword arguments of the plot.
+    :return: The key, None if no cache is set or the plot is not rendered to a buffer
+    :rtype: str
+    """
+    if plot_cache is None or kwargs.get('save_path', None) not in BUFFER_PATHS or kwargs.get('show_plot', False):
+        return None
+    return plot_cache.get_key(name, df, kwargs)
+
+
+def get_datetimes(dates):
+    """
+    Converts a date column into datetime values, parsing every distinct date once.
+
+    :param pandas.Series dates: 'year_month_day' strings, or datetime64 values of the compact schema.
+    :return: The dates
+    :rtype: pd.DatetimeIndex
+    """
+    if pd.api.types.is_datetime64_dtype(dates):
+        return pd.DatetimeIndex(dates)
+    codes, uniques = pd.factorize(dates)
+    return pd.DatetimeIndex(pd.to_datetime(uniques, format='%y_%m_%d')[codes])
+
+
+def get_time_series(df, stats, players=None, teams=None, by='player', min_seconds=None, max_seconds=None):
+    """
+    Gets the date indexed series of stats of many players or teams, filtering and parsing dates in a single pass.
+
+    :param df: The pandas.DataFrame, or a BoxScoreQuery to filter through its indexes.
+    :param list stats: The stat columns to get, ex: ['points', 'rebounds'].
+    :param list players: Optional player names to keep.
+    :param list teams: Optional team names to keep, ex: to get every player of a roster.
+    :param str by: 'player' for a series per player, 'team' for a series per team summing its players per date.
+    :param int min_seconds: Optional minimum playing time, see `add_seconds_filter`.
+    :param int max_seconds: Optional maximum playing time, see `add_seconds_filter`.
+    :return: Data frames indexed by date with a column per stat, keyed by player or team name. Players are in the
+        order given, otherwise in order of first appearance.
+    :rtype: OrderedDict
     """
-    converted_team = team.replace(' ', '_').upper()
-    converted_date = date.strftime('%y_%m_%d')
-    team_df = df[(df['team'] == converted_team) & (df['date'] == converted_date) & (df['points'] > 0)]
-    opp_team = team_df['opponent'].values[0]
-    opp_df = df[(df['team'] == opp_team) & (df['date'] == converted_date) & (df['points'] > 0)]
-    res = '%s-%s' % (int(np.sum(team_df['points'])), int(np.sum(opp_df['points'])))
-    return res
+    box_filter = BoxScoreFilter()
+    if players is not None:
+        box_filter.players(players)
+    if teams is not None:
+        box_filter.teams(teams)
+    add_seconds_filter(box_filter, min_seconds, max_seconds)
+    rows = box_filter.apply(df)
+    data = pd.DataFrame({stat: rows[stat].to_numpy() for stat in stats},
+                        index=get_datetimes(rows['date']).rename('datetime'), columns=stats)
+    groups = BoxScoreQuery(rows).get_index('player' if by == 'player' else 'team')
+    keys = list(groups.keys())
+    if by == 'player' and players is not None:
+        keys = [player for player in players if player in groups]
+    time_series = OrderedDict()
+    for key in keys:
+        series_df = data.take(groups[key]).sort_index(kind='mergesort')
+        if by == 'team':
+            series_df = series_df.groupby(level=0).sum()
+        time_series[str(key)] = series_df
+    return time_series
+
+
+def create_time_series_plot(time_series, y_key, **kwargs):
+    """
+    Creates a plot with a line per player or team from the result of `get_time_series`.
+
+    :param dict time_series: Data frames indexed by date, keyed by name.
+    :param str y_key: The stat to plot.
+
+    Supported kwargs:
+        save_path: The path to save the plot to or the type of plot to save, see `save_plot`
+        show_plot: Determines if the plot should be shown to the user
+        grid: Determines if a grid should be shown
+        title: Optional title of the plot
+
+    :return: The path of the created plot
+    :rtype: str
+    """
+    save_path = kwargs.get('save_path', None)
+    show_plot = kwargs.get('show_plot', False)
+    grid = kwargs.get('grid', True)
+    title = kwargs.get('title', y_key.title().replace('_', ' '))
+    plotted_df = pd.DataFrame()
+    if time_series:
+        plotted_df = pd.concat([series_df[[y_key]] for series_df in time_series.values()],
+                               keys=[str(name) for name in time_series.keys()])
+    cache_key = get_plot_cache_key('time_series_%s' % y_key, plotted_df, kwargs)
+    if cache_key is not None:
+        plot_path = plot_cache.get(cache_key)
+        if plot_path is not None:
+            return plot_path
+
+    fig, ax = plt.subplots(figsize=(10, 6))
+    for name, series_df in time_series.items():
+        ax.plot(series_df.index, series_df[y_key], marker='.', ms=8, label=name)
+    ax.set_xlabel('Date (month-day)')
+    ax.set_ylabel(y_key.title().replace('_', ' '))
+    ax.xaxis.set_major_formatter(plt_dates.DateFormatter('%m-%d'))
+    if time_series:
+        plt.legend(loc='best')
+    if grid:
+        ax.grid()
+    plt.title(title)
+    plt.tight_layout()
+
+    plot_path = save_plot(save_path, 'datetime_VS_%s' % y_key)
+    if cache_key is not None:
+        plot_cache.put(cache_key, plot_path)
+    if show_plot:
+        plt.show()
+    return plot_path
 
 
 def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
@@ -385,7 +1112,7 @@ def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
 
     :param str x_key: The column name in the data frame to use for the x axis.
     :param str y_key: The column name in the data frame to use for the x axis.
-    :param pandas.DataFrame df: The data frame object.
+    :param df: The pandas.DataFrame object, or a BoxScoreQuery to filter through its indexes.
 
     Supported kwargs:
         bool grid: Indicates if a grid should be added to the plot.
@@ -396,6 +1123,11 @@ def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
         str save_path: The path to save the png file created.
         bool show_plot: Indicates if the png should be shown during execution.
         bool trend_line: Indicates if a trend line should be shown.
+        str mode: 'scatter' to draw a marker per row, or 'density' to draw a 2-D histogram of the rows that are not
+            outliers.
+        int max_points: Number of rows above which the scatter mode draws a random sample of the rows that are not
+            outliers, None draws every row. Outliers and the trend line always use every row.
+        int bins: Number of bins per axis of the density mode.
 
     :return: The save path of the created png, the outlier DataFrame, the filtered DataFrame.
     :rtype: tuple
@@ -408,29 +1140,22 @@ def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
     num_outliers = kwargs.get('num_outliers', 5)
     grid = kwargs.get('grid', True)
     trend_line = kwargs.get('trend_line', True)
+    mode = kwargs.get('mode', 'scatter')
+    max_points = kwargs.get('max_points', 50000)
+    bins = kwargs.get('bins', 60)
 
-    if num_outliers > 15:
-        num_outliers = 15
-
-    # filters
+    # filters, selected together
+    box_filter = BoxScoreFilter()
     if teams is not None and isinstance(teams, list):
-        df = filter_df_on_team_names(df, teams)
-    if min_seconds is not None and isinstance(min_seconds, int):
-        if min_seconds >= 60:
-            df = df[df['seconds_played'] >= min_seconds]
-        else:
-            df = df[df['minutes_played'] >= min_seconds]
-    if max_seconds is not None and isinstance(max_seconds, int):
-        if max_seconds >= 60:
-            df = df[df['seconds_played'] <= max_seconds]
-        else:
-            df = df[df['minutes_played'] <= max_seconds]
+        box_filter.teams(teams)
+    add_seconds_filter(box_filter, min_seconds, max_seconds)
+    df = box_filter.apply(df)
     temp_df = df[[x_key, y_key]]
 
     # find outliers
     series_size = temp_df[y_key].shape[0]
     if series_size > num_outliers:
-        thresh = sorted(temp_df[y_key].to_list())[-num_outliers]
+        thresh = top_k.get_kth_value(temp_df[y_key], num_outliers)
     else:
         thresh = 0
 
@@ -441,9 +1166,27 @@ def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
                                        series_size)
 
     outlier_df = temp_df[temp_df[y_key] >= thresh]
+    cache_key = get_plot_cache_key('scatter_%s_%s' % (x_key, y_key), temp_df, kwargs)
+    if cache_key is not None:
+        plot_path = plot_cache.get(cache_key)
+        if plot_path is not None:
+            return plot_path, outlier_df_full, df
     # plot main df and outliers
     fig, ax = plt.subplots(figsize=(10, 6))
-    main_df.plot(kind='scatter', x=x_key, y=y_key, grid=grid, ax=ax)
+    if mode == 'density':
+        counts, x_edges, y_edges = np.histogram2d(main_df[x_key].to_numpy(dtype=np.float64),
+                                                  main_df[y_key].to_numpy(dtype=np.float64), bins=bins)
+        mesh = ax.pcolormesh(x_edges, y_edges, np.ma.masked_equal(counts.T, 0), cmap='Blues')
+        plt.colorbar(mesh, ax=ax, label='Rows')
+        if grid:
+            ax.grid()
+    else:
+        if max_points is not None and main_df.shape[0] > max_points:
+            # a fixed seed keeps the same rows, and the same plot, for the same data
+            sample = np.sort(np.random.RandomState(0).choice(main_df.shape[0], max_points, replace=False))
+            main_df = main_df.iloc[sample]
+            title = '%s, %s shown)' % (title[0:-1], max_points + outlier_df.shape[0])
+        main_df.plot(kind='scatter', x=x_key, y=y_key, grid=grid, ax=ax)
     outlier_df.plot(kind='scatter', x=x_key, y=y_key, grid=grid, ax=ax)
 
     ax.set_xlabel(x_key.title().replace('_', ' '))
@@ -469,28 +1212,9 @@ def create_scatter_plot_with_trend_line(x_key, y_key, df, **kwargs):
     plt.tight_layout()
 
     # handle output
-    plot_path = None
-    if save_path is not None:
-        if os.path.isdir(save_path):
-            if not os.path.exists(os.path.join(save_path, 'plots')):
-                os.mkdir(os.path.join(save_path, 'plots'))
-            ymd = datetime.datetime.now().strftime("%y%m%d")
-            plot_path = os.path.join(save_path, 'plots', '%s_VS_%s_%s' % (x_key, y_key, ymd))
-            plt.savefig(plot_path)
-        else:
-            if save_path == 'svg_buffer':
-                fig_file = io.StringIO()
-                plt.savefig(fig_file, format='svg', bbox_inches='tight')
-                fig_data_svg = '<svg' + fig_file.getvalue().split('<svg')[1]
-                fig_file.close()
-                plot_path = fig_data_svg
-            else:
-                # save at the path given
-                plt.savefig(save_path)
-                plot_path = save_path
-            plt.clf()
-            plt.cla()
-            plt.close('all')
+    plot_path = save_plot(save_path, '%s_VS_%s' % (x_key, y_key))
+    if cache_key is not None:
+        plot_cache.put(cache_key, plot_path)
     if show_plot:
         plt.show()
     return plot_path, outlier_df_full, df
@@ -502,7 +1226,7 @@ def create_date_plot(y_key, player, df, **kwargs):
 
     :param y_key: The stat to filter on
     :param str player: The name of the player to search for
-    :param pandas.DataFrame df: The pandas.DataFrame object to search in
+    :param df: The pandas.DataFrame object to search in, or a BoxScoreQuery to look the player up in its indexes
 
     Supported kwargs:
         save_path: The path to save the plot to or the type of plot to save
@@ -526,35 +1250,34 @@ def create_date_plot(y_key, player, df, **kwargs):
     plot_path = None
     outlier_df = None
 
-    # filters
+    # filters, selected together
     perform_plot = True
+    box_filter = BoxScoreFilter()
+    query = df if isinstance(df, BoxScoreQuery) else None
     if player is not None and isinstance(player, str):
-        if np.any(df.index.isin([player])):
-            df = df[df.index.isin([player])]
+        if not (query.has_player(player) if query is not None else np.any(df.index.isin([player]))):
+            # fall back to the same name without accents or case
+            player = resolve_player_name(player, df, fuzzy=False) or player
+        if query.has_player(player) if query is not None else np.any(df.index.isin([player])):
+            box_filter.players([player])
         else:
             # we don't want to try if the player name is invalid
             perform_plot = False
             plot_path = 'Invalid player name of %s' % player
     if isinstance(min_seconds, int) and isinstance(max_seconds, int):
         if max_seconds > min_seconds:
-            if min_seconds >= 60:
-                df = df[df['seconds_played'] >= min_seconds]
-            else:
-                df = df[df['minutes_played'] >= min_seconds]
-            if max_seconds >= 60:
-                df = df[df['seconds_played'] <= max_seconds]
-            else:
-                df = df[df['minutes_played'] <= max_seconds]
+            add_seconds_filter(box_filter, min_seconds, max_seconds)
         else:
             plot_path = 'Max seconds < Min seconds'
             perform_plot = False
     else:
         plot_path = 'Max/Min seconds incorrect type %s %s' % (type(min_seconds), type(max_seconds))
         perform_plot = False
+    # the plot adds a column, so it works on its own copy
+    df = box_filter.apply(df, copy=perform_plot)
 
     if perform_plot and df.shape[0] > 0:
-        outlier_df = df.sort_values(by=[y_key], ascending=False)
-        outlier_df = outlier_df.head(n=num_outliers)
+        outlier_df = top_k.get_top_k(df, y_key, num_outliers)
 
         df['datetime'] = pd.to_datetime(df['date'], format='%y_%m_%d')
         x_key = 'datetime'
@@ -564,6 +1287,11 @@ def create_date_plot(y_key, player, df, **kwargs):
                                          y_key.title().replace('_', ' '),
                                          series_size)
         data_mean = np.mean(temp_df[y_key])
+        cache_key = get_plot_cache_key('date_%s_%s' % (y_key, player), temp_df, kwargs)
+        if cache_key is not None:
+            cached = plot_cache.get(cache_key)
+            if cached is not None:
+                return cached, outlier_df, df
         fig, ax = plt.subplots(figsize=(10, 6))
         temp_df.plot(kind='line', x=x_key, y=y_key, style='.', ms=10, ax=ax)
         if mean_line:
@@ -606,28 +1334,10 @@ def create_date_plot(y_key, player, df, **kwargs):
         plt.tight_layout()
 
         # handle output
-
         if save_path is not None:
-            if os.path.isdir(save_path):
-                if not os.path.exists(os.path.join(save_path, 'plots')):
-                    os.mkdir(os.path.join(save_path, 'plots'))
-                ymd = datetime.datetime.now().strftime("%y%m%d")
-                plot_path = os.path.join(save_path, 'plots', '%s_VS_%s_%s' % (x_key, y_key, ymd))
-                plt.savefig(plot_path)
-            else:
-                if save_path == 'svg_buffer':
-                    fig_file = io.StringIO()
-                    plt.savefig(fig_file, format='svg', bbox_inches='tight')
-                    fig_data_svg = '<svg' + fig_file.getvalue().split('<svg')[1]
-                    fig_file.close()
-                    plot_path = fig_data_svg
-                else:
-                    # save at the path given
-                    plt.savefig(save_path)
-                    plot_path = save_path
-                plt.clf()
-                plt.cla()
-                plt.close('all')
+            plot_path = save_plot(save_path, '%s_VS_%s' % (x_key, y_key))
+        if cache_key is not None:
+            plot_cache.put(cache_key, plot_path)
         if show_plot:
             plt.show()
     return plot_path, outlier_df, df
@@ -639,12 +1349,18 @@ def create_bar_plot(df, bar_items, save_path=None, show_plot=False, team=None, d
 
     :param pandas.DataFrame df: Data frame to use.
     :param list bar_items: Column names within the data frame.
-    :param str save_path: The path to save the png file created.
+    :param str save_path: The path to save the plot to or the type of plot to save, see `save_plot`.
     :param bool show_plot: Indicates if the png should be shown during execution.
     :param str team: Optional team name to add to plot title.
     :param datetime.datetime date: Optional date to add to plot title.
-    :return: Save path if save successful.
+    :return: The path of the created plot, the svg text or the png bytes
     """
+    cache_key = get_plot_cache_key('bar_%s' % '_'.join(bar_items), df[bar_items],
+                                   {'save_path': save_path, 'show_plot': show_plot, 'team': team, 'date': date})
+    if cache_key is not None:
+        plot_path = plot_cache.get(cache_key)
+        if plot_path is not None:
+            return plot_path
     fig, ax = plt.subplots(figsize=(10, 8))
     margin_bottom = np.zeros(df.shape[0])
     colors = ['#17408B', '#C9082A', '#552084', '#FDBA21']
@@ -667,17 +1383,9 @@ def create_bar_plot(df, bar_items, save_path=None, show_plot=False, team=None, d
     plt.tight_layout()
 
     # handle output
-    plot_path = None
-    if save_path is not None:
-        if os.path.isdir(save_path):
-            if not os.path.exists(os.path.join(save_path, 'plots')):
-                os.mkdir(os.path.join(save_path, 'plots'))
-            if date is None:
-                ymd = datetime.datetime.now().strftime("%y%m%d")
-                plot_path = os.path.join(save_path, 'plots', '%s_%s' % (title.replace(' ', '_'), ymd))
-            else:
-                plot_path = os.path.join(save_path, 'plots', title.replace(' ', '_'))
-            plt.savefig(plot_path)
+    plot_path = save_plot(save_path, title.replace(' ', '_'), add_date=date is None)
+    if cache_key is not None:
+        plot_cache.put(cache_key, plot_path)
     if show_plot:
         plt.show()
     return plot_path
@@ -6,34 +6,210 @@
 import datetime
 import logging
 import os
+import time
+# third party imports
+import requests
+from basketball_reference_web_scraper.errors import InvalidDate, InvalidSeason
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+# relative imports
 from . import analytics_API as Api
+from . import backfill
+from .cache import ResponseCache
+from .game_results import GameResults
+from .schedule import GameCalendar
+
+
+# errors of a poll that are retried at the next poll, any other error stops the daemon
+POLL_ERRORS = (requests.exceptions.RequestException, InvalidDate, InvalidSeason)
+if aiohttp is not None:
+    POLL_ERRORS += (aiohttp.ClientError,)
 
 
 class Application(object):
     """
     This class handles running the application
     """
-    def __init__(self):
+    def __init__(self, cache_dir='response_cache', calendar_path='game_calendar.json',
+                 data_path='player_box_scores.csv'):
         """
         Setup for the application.
+
+        :param str cache_dir: Directory for the scraper response cache, None disables caching.
+        :param str calendar_path: Path of the game calendar used to skip days without games, None disables it.
+        :param str data_path: Path of the player box score csv, or of a box score store directory.
         """
         self.player = 'LeBron James'.lower()
         self.logger = logging.getLogger(__name__)
+        self.data_path = data_path
+        if cache_dir is not None:
+            Api.set_response_cache(ResponseCache(cache_dir))
+        # results of every game in the data kept in memory by `run_daemon`, updated by `poll`
+        self.game_results = GameResults()
+        self.calendar = None
+        if calendar_path is not None:
+            self.calendar = GameCalendar(calendar_path)
+
+    def get_dates_to_fetch(self, start, end):
+        """
+        Gets the dates that need to be fetched from the start date up to, but not including, the end date.
+
+        :param datetime.datetime start: The first date.
+        :param datetime.datetime end: The end date, exclusive.
+        :return: The dates in increasing order, only game days if a game calendar is used.
+        :rtype: list
+        """
+        if self.calendar is not None:
+            return self.calendar.get_game_dates_in_range(start, end)
+        return backfill.get_dates_in_range(start, end)
 
-    def run_with_date_range(self, start_date, end_date):
+    def run_with_date_range(self, start_date, end_date, csv_path=None, max_workers=4, requests_per_second=1.0):
         """
         Create a csv file of player box scores from a date range.
 
         :param str start_date: The date to begin searching.
         :param str end_date: The date to end searching, exclusive, meaning this date will not be searched
             and will only trigger ending.
+        :param str csv_path: The csv or box score store to write, defaults to start_end_box_scores.csv.
+        :param int max_workers: Maximum number of days fetched at the same time.
+        :param float requests_per_second: Maximum request rate to basketball reference.
+        :return: The pandas.DataFrame object written
         """
         logging.basicConfig(filename='date_range_log.ini', level=logging.INFO)
         start_split = start_date.split('_')
         start = datetime.datetime(year=int(start_split[0]),
                                   month=int(start_split[1]), day=int(start_split[2]))
+        end_split = end_date.split('_')
+        end = datetime.datetime(year=int(end_split[0]),
+                                month=int(end_split[1]), day=int(end_split[2]))
+        if csv_path is None:
+            csv_path = '%s_%s_box_scores.csv' % (start_date, end_date)
+
+        dates = self.get_dates_to_fetch(start, end)
+        self.logger.info('Backfilling %s dates with %s workers' % (len(dates), max_workers))
+        daily_box_scores, failed = backfill.fetch_days(dates, Api.fetch_player_box_scores, self.logger,
+                                                       max_workers=max_workers,
+                                                       requests_per_second=requests_per_second)
+        for date_obj in failed:
+            self.logger.info('-- Missing date: %s', date_obj)
+        df = Api.create_data_frame_from_daily_box_scores(daily_box_scores, self.logger)
+        self.logger.info('Writing data frame of shape %s to %s' % (df.shape, csv_path))
+        Api.save_data_frame(df, csv_path)
+        return df
+
+    def is_game_night(self, date_obj):
+        """
+        Determines if games may be in progress or just finished, on a game day or early the morning after one.
+
+        :param datetime.datetime date_obj: The current date and time.
+        :return: True if games may be in progress, always True without a game calendar
+        :rtype: bool
+        """
+        if self.calendar is None:
+            return True
+        if self.calendar.is_game_day(date_obj):
+            return True
+        # late games end after midnight
+        return date_obj.hour < 6 and self.calendar.is_game_day(date_obj - datetime.timedelta(days=1))
+
+    def poll(self, df, date, max_workers=4, requests_per_second=1.0):
+        """
+        Fetches the player box scores from the last fetched date up to a date, merges them into the data in memory,
+        then persists only if any row was added or changed. The last fetched date is fetched again since its games may
+        have been in progress. The game results of the fetched dates are replaced.
+
+        :param pandas.DataFrame df: The data in memory, None if there is none.
+        :param datetime.datetime date: The last date to fetch, usually now.
+        :param int max_workers: Maximum number of days fetched at the same time.
+        :param float requests_per_second: Maximum request rate to basketball reference.
+        :return: The updated data and the number of rows added or changed
+        :rtype: tuple
+        """
+        end = datetime.datetime(year=date.year, month=date.month, day=date.day) + datetime.timedelta(days=1)
+        start = end - datetime.timedelta(days=1)
+        if df is not None and df.shape[0] > 0:
+            start = min(start, Api.get_most_recent_update_date(df))
+        dates = self.get_dates_to_fetch(start, end)
+        if not dates:
+            return df, 0
+        daily_box_scores, failed = backfill.fetch_days(dates, Api.fetch_player_box_scores, self.logger,
+                                                       max_workers=max_workers,
+                                                       requests_per_second=requests_per_second)
+        for date_obj in failed:
+            self.logger.info('-- Missing date: %s', date_obj)
+        new_df = Api.create_data_frame_from_daily_box_scores(daily_box_scores, self.logger)
+        if new_df.shape[0] == 0:
+            return df, 0
+        changed = Api.get_changed_row_count(df, new_df)
+        if changed == 0:
+            return df, 0
+        self.logger.info('-- %s new or changed rows' % changed)
+        df = Api.save_merged_data_frame(df, new_df, self.data_path, self.logger)
+        self.game_results.update(new_df)
+        return df, changed
+
+    def get_team_result(self, team, date):
+        """
+        Gets the score of a team's game from the data kept in memory by `run_daemon`.
+
+        :param str team: Team name, ex: Los Angeles Lakers.
+        :param datetime.datetime date: The date of the game.
+        :return: The score, ex: 97-88. The team's score is always first. None if the team did not play on the date.
+        :rtype: str
+        """
+        return self.game_results.get_result(team, date)
+
+    def run_daemon(self, poll_seconds=900, max_poll_seconds=3600, idle_seconds=21600, backoff=2.0, max_polls=None,
+                   should_log=False, max_workers=4, requests_per_second=1.0, sleep_func=time.sleep,
+                   now_func=datetime.datetime.now):
+        """
+        Runs the application as a long running process. The data is loaded once and kept in memory, new games are
+        polled for and merged into it, and only changes are persisted.
+
+        On game nights polls start every poll_seconds and back off up to max_poll_seconds while nothing changes,
+        other days are polled every idle_seconds. Network and scraper errors are logged and retried at the next poll,
+        any other error is raised.
+
+        :param int poll_seconds: Seconds between polls on game nights after a poll found changes.
+        :param int max_poll_seconds: Maximum seconds between polls on game nights.
+        :param int idle_seconds: Seconds between polls on other days.
+        :param float backoff: Factor the time between polls grows by after a poll without changes.
+        :param int max_polls: Optional number of polls before returning, runs forever if None.
+        :param bool should_log: Indicates if logging should be used.
+        :param int max_workers: Maximum number of days fetched at the same time.
+        :param float requests_per_second: Maximum request rate to basketball reference.
+        :param sleep_func: Function called with the number of seconds to wait between polls.
+        :param now_func: Function returning the current datetime.datetime.
+        :return: The data in memory after the last poll
+        :rtype: pd.DataFrame
+        """
+        if should_log:
+            logging.basicConfig(filename='log.ini', level=logging.INFO)
+        df = Api.get_existing_data_frame(self.data_path, self.logger)
+        self.game_results = GameResults(df)
+        interval = poll_seconds
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            now = now_func()
+            self.logger.info("---------- Polling datetime: %s ----------" % now)
+            try:
+                df, changed = self.poll(df, now, max_workers=max_workers, requests_per_second=requests_per_second)
+            except POLL_ERRORS:
+                self.logger.exception('Poll failed, retrying at the next poll')
+                changed = 0
+            polls += 1
+            if changed > 0:
+                interval = poll_seconds
+            else:
+                interval = min(interval * backoff, max_poll_seconds)
+            if max_polls is not None and polls >= max_polls:
+                break
+            sleep_func(interval if self.is_game_night(now) else idle_seconds)
+        return df
 
-    def run(self, date=False, should_log=False, plot=True, gather_new=False):
+    def run(self, date=False, should_log=False, plot=True, gather_new=False, append_only=False):
         """
         Runs the application.
 
@@ -41,6 +217,7 @@ class Application(object):
         :param bool should_log: Indicates if logging should be used.
         :param bool plot: Indicates if plots should be created.
         :param bool gather_new: Indicates if new player box score data should be searched for.
+        :param bool append_only: Indicates if new rows should only be appended instead of rewriting all data.
         """
         if should_log:
             logging.basicConfig(filename='log.ini', level=logging.INFO)
@@ -49,19 +226,18 @@ class Application(object):
             date = datetime.datetime.now()
         self.logger.info("---------- Executing datetime: %s ----------" % date)
 
-        my_csv = 'player_box_scores.csv'
+        my_csv = self.data_path
         # my_csv = 'small_data_set.csv'
         df = Api.get_existing_data_frame(my_csv, self.logger)
         if gather_new:
             if gather_new == 'update_to_current':
-                current_date = date
                 last_update_date = Api.get_most_recent_update_date(df)
                 self.logger.info('Last fetched date: %s', last_update_date)
-                while current_date.strftime('%y_%m_%d') != last_update_date.strftime('%y_%m_%d'):
-                    self.logger.info('-- Attempting to add date: %s', current_date)
-                    df = Api.gather_new_on_date(current_date, my_csv, self.logger)
-                    current_date -= datetime.timedelta(days=1)
-                    # todo, get older csv to test with, and write unit tests?
+                end = datetime.datetime(year=date.year, month=date.month, day=date.day) + datetime.timedelta(days=1)
+                missing_dates = self.get_dates_to_fetch(last_update_date + datetime.timedelta(days=1), end)
+                if missing_dates:
+                    self.logger.info('-- Attempting to add dates: %s to %s', missing_dates[0], missing_dates[-1])
+                    df = Api.gather_new_on_dates(missing_dates, my_csv, self.logger, df=df, append_only=append_only)
 
         if plot:
             x_key = 'minutes_played'
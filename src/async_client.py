@@ -0,0 +1,266 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Async Client
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import asyncio
+import datetime
+import time
+from collections import OrderedDict
+from urllib.parse import urlparse
+
+# third party imports
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+from lxml import html
+from basketball_reference_web_scraper.data import TeamTotal
+from basketball_reference_web_scraper.html import DailyLeadersPage, DailyBoxScoresPage, BoxScoresPage
+from basketball_reference_web_scraper.parser_service import ParserService
+
+# relative imports
+from . import analytics_API as Api
+from .player_index import PlayerIndex
+
+BASE_URL = 'https://www.basketball-reference.com'
+
+
+class AsyncRateLimiter(object):
+    """
+    Class for spacing out requests made from many coroutines of one event loop.
+    """
+    def __init__(self, requests_per_second):
+        """
+        Setup for the AsyncRateLimiter class.
+
+        :param float requests_per_second: Maximum number of requests per second, None or <= 0 disables limiting.
+        """
+        self.interval = 0.0
+        if requests_per_second is not None and requests_per_second > 0:
+            self.interval = 1.0 / requests_per_second
+        self.next_time = 0.0
+
+    async def wait(self):
+        """
+        Waits until the caller is allowed to make its next request.
+        """
+        if self.interval <= 0:
+            return
+        now = time.monotonic()
+        scheduled = max(now, self.next_time)
+        self.next_time = scheduled + self.interval
+        if scheduled > now:
+            await asyncio.sleep(scheduled - now)
+
+
+class AsyncClient(object):
+    """
+    Class for fetching basketball reference pages over one pooled session. Use as an async context manager.
+    """
+    def __init__(self, base_url=BASE_URL, max_connections=8, requests_per_second=1.0):
+        """
+        Setup for the AsyncClient class.
+
+        :param str base_url: The site to fetch from, can point at a local stand in server for testing.
+        :param int max_connections: Maximum number of requests in flight and pooled connections.
+        :param float requests_per_second: Maximum request rate per host.
+        """
+        if aiohttp is None:
+            raise ImportError('The aiohttp package is required to use the async client.')
+        self.base_url = base_url.rstrip('/')
+        self.max_connections = max_connections
+        self.requests_per_second = requests_per_second
+        self.parser = ParserService()
+        self.rate_limiters = {}
+        self.semaphore = None
+        self.session = None
+
+    async def __aenter__(self):
+        self.semaphore = asyncio.Semaphore(self.max_connections)
+        connector = aiohttp.TCPConnector(limit=self.max_connections)
+        self.session = aiohttp.ClientSession(connector=connector)
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.session.close()
+        self.session = None
+
+    async def get(self, path, params=None):
+        """
+        Requests a page, waiting on the concurrency limit and the rate limit of the host.
+
+        :param str path: The path of the page, or a full url.
+        :param dict params: Optional query parameters.
+        :return: The response body
+        :rtype: bytes
+        """
+        url = path if path.startswith('http') else '%s/%s' % (self.base_url, path.lstrip('/'))
+        host = urlparse(url).netloc
+        if host not in self.rate_limiters:
+            self.rate_limiters[host] = AsyncRateLimiter(self.requests_per_second)
+        async with self.semaphore:
+            await self.rate_limiters[host].wait()
+            async with self.session.get(url, params=params, allow_redirects=False) as response:
+                response.raise_for_status()
+                return await response.read()
+
+    async def player_box_scores(self, date_obj):
+        """
+        Gets every player box score for a single day, using the analytics API response cache if one is set.
+
+        :param datetime.datetime date_obj: The date to fetch.
+        :return: Player box score dictionaries in the scraper client format.
+        :rtype: list
+        """
+        if Api.response_cache is not None:
+            found, value = Api.response_cache.get('player_box_scores', date_obj)
+            if found:
+                return value
+        content = await self.get('friv/dailyleaders.cgi', params={'month': date_obj.month, 'day': date_obj.day,
+                                                                  'year': date_obj.year})
+        page = DailyLeadersPage(html=html.fromstring(content))
+        value = self.parser.parse_player_box_scores(box_scores=page.daily_leaders)
+        if Api.response_cache is not None:
+            Api.response_cache.put('player_box_scores', date_obj, value)
+        return value
+
+    async def team_box_scores(self, date_obj):
+        """
+        Gets every team box score for a single day, fetching the game pages concurrently.
+
+        :param datetime.datetime date_obj: The date to fetch.
+        :return: Team box score dictionaries in the scraper client format.
+        :rtype: list
+        """
+        if Api.response_cache is not None:
+            found, value = Api.response_cache.get('team_box_scores', date_obj)
+            if found:
+                return value
+        content = await self.get('boxscores/', params={'day': date_obj.day, 'month': date_obj.month,
+                                                       'year': date_obj.year})
+        page = DailyBoxScoresPage(html=html.fromstring(content))
+        games = await asyncio.gather(*[self.team_box_score(game_url_path) for game_url_path in page.game_url_paths])
+        value = [box_score for game in games for box_score in game]
+        if Api.response_cache is not None:
+            Api.response_cache.put('team_box_scores', date_obj, value)
+        return value
+
+    async def team_box_score(self, game_url_path):
+        """
+        Gets the team totals of a single game.
+
+        :param str game_url_path: Path of the game box score page.
+        :return: Team box score dictionaries of both teams.
+        :rtype: list
+        """
+        content = await self.get(game_url_path)
+        tables = BoxScoresPage(html.fromstring(content)).statistics_tables
+        totals = [TeamTotal(basic_statistics_table=basic, advanced_statistics_table=advanced)
+                  for basic, advanced in zip(tables[::2], tables[1::2])]
+        return self.parser.parse_team_totals(first_team_totals=totals[0], second_team_totals=totals[1])
+
+
+async def get_player_box_score(async_client, name, logger, date_obj=None, timeout=3, calendar=None):
+    """
+    Gets the box score for the desired player, requesting every searched date concurrently.
+
+    :param AsyncClient async_client: The open async client.
+    :param str name: Name of the player to search for.
+    :param logger: Logging object.
+    :param datetime.datetime date_obj: Datetime object for starting day to search.
+    :param int timeout: Number of days to search before giving up.
+    :param src.schedule.GameCalendar calendar: Optional game calendar used to skip days without games.
+    :return: Box score for the player if found, and the date it was found on.
+    :rtype: tuple
+    """
+    name = PlayerIndex.normalize(name)
+    if date_obj is None:
+        date_obj = datetime.datetime.today()
+    search_dates = Api.get_search_dates(date_obj, timeout, calendar=calendar)
+    results = await asyncio.gather(*[async_client.player_box_scores(search_date) for search_date in search_dates])
+    for search_date, box_scores in zip(search_dates, results):
+        for box_score in box_scores:
+            if name in PlayerIndex.normalize(box_score['name']):
+                return box_score, search_date
+    logger.info("Timeout reached.")
+    if search_dates:
+        date_obj = search_dates[-1] - datetime.timedelta(days=1)
+    return None, date_obj
+
+
+async def get_daily_box_scores(async_client, date_obj=None, timeout=1, calendar=None):
+    """
+    Gets all player box scores for a specific day grouped by team, using a single request per day.
+
+    :param AsyncClient async_client: The open async client.
+    :param datetime.datetime date_obj: Datetime object for starting day to search.
+    :param int timeout: Number of days to search before giving up.
+    :param src.schedule.GameCalendar calendar: Optional game calendar used to skip days without games.
+    :return: All box scores sorted by team, and the date they were found on.
+    :rtype: tuple
+    """
+    if date_obj is None:
+        date_obj = datetime.datetime.today()
+    search_dates = Api.get_search_dates(date_obj, timeout, calendar=calendar)
+    for search_date in search_dates:
+        box_scores = await async_client.player_box_scores(search_date)
+        if len(box_scores) > 0:
+            return Api.group_box_scores_by_game(box_scores), search_date
+    if search_dates:
+        date_obj = search_dates[-1] - datetime.timedelta(days=1)
+    return OrderedDict(), date_obj
+
+
+async def get_teams_played_on_date(async_client, date_obj=None, timeout=1):
+    """
+    Gets a list of all teams that played on the provided date.
+
+    :param AsyncClient async_client: The open async client.
+    :param datetime.datetime date_obj: Datetime object for starting day to search.
+    :param int timeout: Number of days to search before giving up.
+    :return: The active teams on the given date.
+    :rtype: list
+    """
+    if date_obj is None:
+        date_obj = datetime.datetime.today()
+    for search_date in Api.get_search_dates(date_obj, timeout):
+        team_box_scores = await async_client.team_box_scores(search_date)
+        if len(team_box_scores) > 1:
+            return [entry['team'].name for entry in team_box_scores]
+    return []
+
+
+async def gather_daily_box_scores(async_client, dates):
+    """
+    Gets the player box scores of many dates concurrently.
+
+    :param AsyncClient async_client: The open async client.
+    :param list dates: The datetime.datetime objects to fetch.
+    :return: Player box score dictionaries keyed by date, in the order given.
+    :rtype: OrderedDict
+    """
+    results = await asyncio.gather(*[async_client.player_box_scores(date_obj) for date_obj in dates])
+    return OrderedDict(zip(dates, results))
+
+
+def run_gather_daily_box_scores(dates, base_url=BASE_URL, max_connections=8, requests_per_second=1.0):
+    """
+    Gets the player box scores of many dates concurrently from a new event loop.
+
+    :param list dates: The datetime.datetime objects to fetch.
+    :param str base_url: The site to fetch from.
+    :param int max_connections: Maximum number of requests in flight.
+    :param float requests_per_second: Maximum request rate per host.
+    :return: Player box score dictionaries keyed by date, in the order given.
+    :rtype: OrderedDict
+    """
+    async def gather():
+        async with AsyncClient(base_url=base_url, max_connections=max_connections,
+                               requests_per_second=requests_per_second) as async_client:
+            return await gather_daily_box_scores(async_client, dates)
+    return asyncio.run(gather())
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,93 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Backfill
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import datetime
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class RateLimiter(object):
+    """
+    Class for spacing out requests made from any number of threads.
+    """
+    def __init__(self, requests_per_second):
+        """
+        Setup for the RateLimiter class.
+
+        :param float requests_per_second: Maximum number of requests per second, None or <= 0 disables limiting.
+        """
+        self.interval = 0.0
+        if requests_per_second is not None and requests_per_second > 0:
+            self.interval = 1.0 / requests_per_second
+        self.next_time = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        """
+        Blocks until the caller is allowed to make its next request.
+        """
+        if self.interval <= 0:
+            return
+        with self.lock:
+            now = time.monotonic()
+            scheduled = max(now, self.next_time)
+            self.next_time = scheduled + self.interval
+        delay = scheduled - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+def get_dates_in_range(start, end):
+    """
+    Gets every date from the start date up to, but not including, the end date.
+
+    :param datetime.datetime start: The first date.
+    :param datetime.datetime end: The end date, exclusive.
+    :return: The dates in increasing order.
+    :rtype: list
+    """
+    dates = []
+    current = start
+    while current < end:
+        dates.append(current)
+        current += datetime.timedelta(days=1)
+    return dates
+
+
+def fetch_days(dates, fetch_func, logger, max_workers=4, requests_per_second=1.0):
+    """
+    Fetches data for many days over a bounded pool of worker threads.
+
+    :param list dates: The datetime.datetime objects to fetch.
+    :param fetch_func: Function called as fetch_func(date_obj, rate_limiter) for each date.
+    :param logger: Logging object.
+    :param int max_workers: Maximum number of concurrent requests.
+    :param float requests_per_second: Maximum request rate shared by all workers.
+    :return: Results keyed by date in increasing date order, and the dates that failed.
+    :rtype: tuple
+    """
+    rate_limiter = RateLimiter(requests_per_second)
+    results = {}
+    failed = []
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = {executor.submit(fetch_func, date_obj, rate_limiter): date_obj for date_obj in dates}
+        for future in as_completed(futures):
+            date_obj = futures[future]
+            try:
+                results[date_obj] = future.result()
+                logger.info('Fetched date: %s' % date_obj.strftime('%y_%m_%d'))
+            except Exception as e:
+                logger.info('Failed to fetch date %s: %s' % (date_obj.strftime('%y_%m_%d'), e))
+                failed.append(date_obj)
+    ordered = OrderedDict()
+    for date_obj in sorted(results.keys()):
+        ordered[date_obj] = results[date_obj]
+    return ordered, sorted(failed)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -8,14 +8,26 @@
 class BoxScore(object):
     """
     Class for a box score object.
+
+    Box scores are created by the hundred thousand during backfills, so the attributes are slotted instead of kept in a
+    per instance dictionary. Use `from_dicts` to create the box scores of a whole day.
     """
-    def __init__(self, bs_dict, date):
+    __slots__ = ['player_name', 'made_fg', 'made_threes', 'made_ft', 'points', 'offensive_rebounds',
+                 'defensive_rebounds', 'rebounds', 'assists', 'player_team', 'date', 'location', 'opponent', 'outcome',
+                 'seconds_played', 'attempted_threes', 'attempted_ft', 'attempted_fg', 'steals', 'blocks', 'turnovers',
+                 'personal_fouls', 'game_score']
+
+    def __init__(self, bs_dict, date, enum_names=None):
         """
         Setup for the BoxScore class.
 
         :param dict bs_dict: Dictionary result from the analytics API.
         :param datetime.datetime date: The data from the box score.
+        :param dict enum_names: Optional names of the team, location and outcome enum members already resolved,
+            shared by the box scores of a batch. Filled in as new members are seen.
         """
+        if enum_names is None:
+            enum_names = {}
         self.player_name = bs_dict['name']
         self.made_fg = bs_dict['made_field_goals']
         self.made_threes = bs_dict['made_three_point_field_goals']
@@ -28,11 +40,11 @@ class BoxScore(object):
         self.rebounds = self.__calculate_rebounds(o_reb=self.offensive_rebounds,
                                                   d_reb=self.defensive_rebounds)
         self.assists = bs_dict['assists']
-        self.player_team = bs_dict['team'].name
+        self.player_team = self.__get_name(bs_dict['team'], enum_names)
         self.date = date
-        self.location = bs_dict['location'].name
-        self.opponent = bs_dict['opponent'].name
-        self.outcome = bs_dict['outcome'].name
+        self.location = self.__get_name(bs_dict['location'], enum_names)
+        self.opponent = self.__get_name(bs_dict['opponent'], enum_names)
+        self.outcome = self.__get_name(bs_dict['outcome'], enum_names)
         self.seconds_played = bs_dict['seconds_played']
         self.attempted_threes = bs_dict['attempted_three_point_field_goals']
         self.attempted_ft = bs_dict['attempted_free_throws']
@@ -43,6 +55,19 @@ class BoxScore(object):
         self.personal_fouls = bs_dict['personal_fouls']
         self.game_score = bs_dict['game_score']
 
+    @classmethod
+    def from_dicts(cls, box_scores, date):
+        """
+        Creates the box scores of a day, resolving the name of each enum member once for the whole batch.
+
+        :param list box_scores: Dictionary results from the analytics API.
+        :param datetime.datetime date: The date of the box scores.
+        :return: The box scores, in the same order
+        :rtype: list
+        """
+        enum_names = {}
+        return [cls(bs_dict, date, enum_names) for bs_dict in box_scores]
+
     def to_string(self):
         """
         Converts the box score object into an easily readable string.
@@ -58,6 +83,22 @@ class BoxScore(object):
         box_score += 'Assists: %s\n' % self.assists
         return box_score
 
+    @staticmethod
+    def __get_name(member, enum_names):
+        """
+        Gets the name of an enum member, ex: LOS_ANGELES_LAKERS.
+
+        :param member: The enum member.
+        :param dict enum_names: Names of the members already resolved.
+        :return: The name
+        :rtype: str
+        """
+        name = enum_names.get(member)
+        if name is None:
+            name = member.name
+            enum_names[member] = name
+        return name
+
     @staticmethod
     def __calculate_points(made_fg, made_three, made_ft):
         """
@@ -0,0 +1,188 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Response Cache
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import datetime
+import os
+import pickle
+import tempfile
+import threading
+import time
+
+
+class ResponseCache(object):
+    """
+    Class for a date keyed, on disk cache of scraper responses.
+
+    Responses stored after their date, and its late games, had finished never change and are kept until evicted by
+    the size budget. Any other response, ex: one fetched before or during the games of its date, is only trusted for
+    a short time to live, even once the date has passed.
+    """
+    def __init__(self, cache_dir, today_ttl=900, max_bytes=256 * 1024 * 1024, final_margin=6 * 3600):
+        """
+        Setup for the ResponseCache class.
+
+        :param str cache_dir: Directory the cached responses are stored in. Created on first write.
+        :param int today_ttl: Number of seconds a response that is not final is considered valid.
+        :param int max_bytes: Size budget of the cache directory. Least recently used entries are evicted beyond it.
+        :param int final_margin: Number of seconds after the end of a date before its responses are final, so games
+            that end after midnight are included.
+        """
+        self.cache_dir = cache_dir
+        self.today_ttl = today_ttl
+        self.max_bytes = max_bytes
+        self.final_margin = final_margin
+        self.lock = threading.Lock()
+
+    def get_path(self, kind, date_obj):
+        """
+        Gets the file path of a cache entry.
+
+        :param str kind: The type of response, ex: player_box_scores.
+        :param datetime.datetime date_obj: The date the response is for.
+        :return: Path of the cache entry
+        :rtype: str
+        """
+        return os.path.join(self.cache_dir, '%s_%s.pickle' % (kind, date_obj.strftime('%Y_%m_%d')))
+
+    def is_final(self, date_obj, stored):
+        """
+        Determines if a response for a date can no longer change.
+
+        :param datetime.datetime date_obj: The date the response is for.
+        :param float stored: The time the response was stored, in seconds since the epoch.
+        :return: True if the response was stored after the end of the date plus the final margin.
+        :rtype: bool
+        """
+        end = datetime.datetime(year=date_obj.year, month=date_obj.month, day=date_obj.day) + datetime.timedelta(days=1)
+        return stored >= time.mktime(end.timetuple()) + self.final_margin
+
+    def get(self, kind, date_obj):
+        """
+        Gets a cached response.
+
+        :param str kind: The type of response, ex: player_box_scores.
+        :param datetime.datetime date_obj: The date the response is for.
+        :return: Whether the entry was found, and the cached response.
+        :rtype: tuple
+        """
+        path = self.get_path(kind, date_obj)
+        try:
+            with open(path, 'rb') as f:
+                entry = pickle.load(f)
+        except (IOError, OSError, EOFError, pickle.UnpicklingError):
+            return False, None
+        if not self.is_final(date_obj, entry['stored']) and time.time() - entry['stored'] > self.today_ttl:
+            return False, None
+        try:
+            # the modified time doubles as the last access time for eviction
+            os.utime(path, None)
+        except OSError:
+            pass
+        return True, entry['value']
+
+    def put(self, kind, date_obj, value):
+        """
+        Stores a response, then evicts the least recently used entries if the size budget is exceeded.
+
+        :param str kind: The type of response, ex: player_box_scores.
+        :param datetime.datetime date_obj: The date the response is for.
+        :param value: The response to store. Must be picklable.
+        """
+        if not os.path.exists(self.cache_dir):
+            os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.get_path(kind, date_obj)
+        # write to a temporary file first so readers never see a partial entry
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pickle.dump({'stored': time.time(), 'value': value}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self.evict()
+
+    def fetch(self, kind, date_obj, fetch_func):
+        """
+        Gets a cached response, calling the fetch function and storing its result on a miss.
+
+        :param str kind: The type of response, ex: player_box_scores.
+        :param datetime.datetime date_obj: The date the response is for.
+        :param fetch_func: Function taking no arguments that returns the response.
+        :return: The response
+        """
+        found, value = self.get(kind, date_obj)
+        if not found:
+            value = fetch_func()
+            self.put(kind, date_obj, value)
+        return value
+
+    def get_size(self):
+        """
+        Gets the total size of all cache entries.
+
+        :return: Size in bytes
+        :rtype: int
+        """
+        return sum([entry[2] for entry in self.__list_entries()])
+
+    def evict(self):
+        """
+        Removes the least recently used entries until the cache fits in the size budget.
+
+        :return: Number of entries removed
+        :rtype: int
+        """
+        removed = 0
+        with self.lock:
+            entries = sorted(self.__list_entries(), key=lambda x: x[1])
+            total = sum([entry[2] for entry in entries])
+            for path, _, size in entries:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except OSError:
+                    continue
+                total -= size
+                removed += 1
+        return removed
+
+    def clear(self):
+        """
+        Removes every cache entry.
+        """
+        with self.lock:
+            for path, _, _ in self.__list_entries():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+
+    def __list_entries(self):
+        """
+        Lists the cache entries on disk.
+
+        :return: Tuples of path, last access time, and size.
+        :rtype: list
+        """
+        entries = []
+        if not os.path.isdir(self.cache_dir):
+            return entries
+        for file_name in os.listdir(self.cache_dir):
+            if not file_name.endswith('.pickle'):
+                continue
+            path = os.path.join(self.cache_dir, file_name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((path, stat.st_mtime, stat.st_size))
+        return entries
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
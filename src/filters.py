@@ -0,0 +1,161 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Box Score Filters
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import operator
+import numpy as np
+
+# relative imports
+from . import schema
+from .query import BoxScoreQuery, PLAYER
+
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+
+class BoxScoreFilter(object):
+    """
+    Class for building a filter of player box scores that is only evaluated when the rows are needed.
+
+    Lookups on player, team, opponent and date are resolved through the indexes of a BoxScoreQuery when one is given,
+    every other predicate is combined into a single mask over the remaining rows. The matching rows are selected
+    once, instead of once per predicate.
+    """
+    def __init__(self):
+        """
+        Setup for the BoxScoreFilter class.
+        """
+        self.lookups = []
+        self.comparisons = []
+
+    def players(self, players):
+        """
+        Keeps the rows of any of the given players.
+
+        :param list players: Player names.
+        :return: The filter, for chaining
+        :rtype: BoxScoreFilter
+        """
+        self.lookups.append((PLAYER, list(players)))
+        return self
+
+    def teams(self, teams):
+        """
+        Keeps the rows of any of the given teams.
+
+        :param list teams: Team names, ex: Los Angeles Lakers or LOS_ANGELES_LAKERS.
+        :return: The filter, for chaining
+        :rtype: BoxScoreFilter
+        """
+        self.lookups.append(('team', [BoxScoreQuery.convert_team(team) for team in teams]))
+        return self
+
+    def opponents(self, opponents):
+        """
+        Keeps the rows against any of the given teams.
+
+        :param list opponents: Team names.
+        :return: The filter, for chaining
+        :rtype: BoxScoreFilter
+        """
+        self.lookups.append(('opponent', [BoxScoreQuery.convert_team(team) for team in opponents]))
+        return self
+
+    def dates(self, dates):
+        """
+        Keeps the rows of any of the given dates.
+
+        :param list dates: datetime.datetime objects or 'year_month_day' strings.
+        :return: The filter, for chaining
+        :rtype: BoxScoreFilter
+        """
+        self.lookups.append(('date', list(dates)))
+        return self
+
+    def where(self, column, op, value):
+        """
+        Keeps the rows where a column compares to a value.
+
+        :param str column: The column name, ex: seconds_played.
+        :param str op: One of the keys of `OPERATORS`, ex: >=.
+        :param value: The value to compare to.
+        :return: The filter, for chaining
+        :rtype: BoxScoreFilter
+        """
+        self.comparisons.append((column, OPERATORS[op], value))
+        return self
+
+    def is_empty(self):
+        """
+        Determines if the filter has no predicates.
+
+        :return: True if every row is kept
+        :rtype: bool
+        """
+        return not self.lookups and not self.comparisons
+
+    def find(self, df):
+        """
+        Evaluates the filter.
+
+        :param df: The pandas.DataFrame, or a BoxScoreQuery to use its indexes for the lookups.
+        :return: Sorted positions of the matching rows, None if the filter has no predicates
+        :rtype: numpy.ndarray
+        """
+        if self.is_empty():
+            return None
+        query = df if isinstance(df, BoxScoreQuery) else None
+        frame = query.df if query is not None else df
+        positions = None
+        if query is not None:
+            for column, values in self.lookups:
+                if column == 'date':
+                    values = [query.convert_date(value) for value in values]
+                found = query.get_positions(column, values)
+                positions = found if positions is None else np.intersect1d(positions, found, assume_unique=True)
+        mask = None
+        if query is None:
+            mask = np.ones(frame.shape[0], dtype=bool)
+            for column, values in self.lookups:
+                if column == PLAYER:
+                    mask &= frame.index.isin(values)
+                else:
+                    if column == 'date':
+                        values = [schema.convert_date(value, schema.is_compact(frame)) for value in values]
+                    mask &= frame[column].isin(values).to_numpy()
+        for column, func, value in self.comparisons:
+            # only the rows left by the lookups are compared
+            values = frame[column].to_numpy()
+            if positions is not None:
+                values = values[positions]
+            matched = np.asarray(func(values, value), dtype=bool)
+            mask = matched if mask is None else mask & matched
+        if mask is not None:
+            positions = np.flatnonzero(mask) if positions is None else positions[mask]
+        return positions
+
+    def apply(self, df, copy=False):
+        """
+        Evaluates the filter and selects the matching rows once.
+
+        :param df: The pandas.DataFrame, or a BoxScoreQuery to use its indexes for the lookups.
+        :param bool copy: Indicates if the result must be a new data frame, even for a contiguous run of rows.
+        :return: The matching rows, in the order of the data frame
+        :rtype: pd.DataFrame
+        """
+        query = df if isinstance(df, BoxScoreQuery) else BoxScoreQuery(df)
+        positions = self.find(df)
+        if copy:
+            return query.df.take(positions) if positions is not None else query.df.copy()
+        return query.take(positions)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
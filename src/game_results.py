@@ -0,0 +1,144 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Game Results
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import numpy as np
+import pandas as pd
+
+# relative imports
+from . import schema
+
+COLUMNS = ['opponent', 'location', 'outcome', 'team_score', 'opponent_score']
+
+
+class GameResults(object):
+    """
+    Class for the result of every game, one row per (date, team), built from player box scores.
+
+    The table is built with one groupby over the box scores and updated one day at a time as new days are ingested.
+    Scores are looked up in a dictionary keyed by (date, team).
+    """
+    def __init__(self, df=None):
+        """
+        Setup for the GameResults class.
+
+        :param pandas.DataFrame df: Optional player box scores to build the table from.
+        """
+        self.compact = False
+        self.table = pd.DataFrame(columns=COLUMNS, index=pd.MultiIndex.from_arrays([[], []], names=['date', 'team']))
+        self.scores = {}
+        if df is not None:
+            self.update(df)
+
+    @staticmethod
+    def create_table(df):
+        """
+        Creates the game results of player box scores.
+
+        :param pandas.DataFrame df: The player box scores of whole days.
+        :return: Game results indexed by (date, team)
+        :rtype: pd.DataFrame
+        """
+        keys = [df['date'], df['team'].astype(str)]
+        grouped = df.groupby(keys, sort=False)
+        table = pd.DataFrame({
+            'opponent': grouped['opponent'].first().astype(str),
+            'location': grouped['location'].first().astype(str),
+            'outcome': grouped['outcome'].first().astype(str),
+            'team_score': grouped['points'].sum().astype(np.int64),
+        })
+        table.index.names = ['date', 'team']
+        # the opponent score is the score of the opponent's own row on the same date
+        opponent_keys = pd.MultiIndex.from_arrays([table.index.get_level_values('date'), table['opponent']])
+        opponent_scores = table['team_score'].reindex(opponent_keys).fillna(0)
+        table['opponent_score'] = opponent_scores.to_numpy().astype(np.int64)
+        return table[COLUMNS]
+
+    def update(self, df):
+        """
+        Adds the games of newly ingested player box scores, replacing the games of every date they hold.
+
+        :param pandas.DataFrame df: The player box scores of whole days.
+        """
+        if df.shape[0] == 0:
+            return
+        self.compact = schema.is_compact(df)
+        new_table = self.create_table(df)
+        dates = new_table.index.get_level_values('date').unique()
+        if self.table.shape[0] > 0:
+            replaced = self.table.index.get_level_values('date').isin(dates)
+            for key in self.table.index[replaced]:
+                del self.scores[key]
+            self.table = pd.concat([self.table[~replaced], new_table])
+        else:
+            self.table = new_table
+        self.scores.update(zip(new_table.index, zip(new_table['team_score'].tolist(),
+                                                    new_table['opponent_score'].tolist())))
+
+    def get_key(self, team, date):
+        """
+        Gets the table key of a team on a date.
+
+        :param str team: Team name, ex: Los Angeles Lakers.
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :return: The (date, team) key
+        :rtype: tuple
+        """
+        return schema.convert_date(date, self.compact), team.upper().replace(' ', '_')
+
+    def get_score(self, team, date):
+        """
+        Gets the score of a team's game.
+
+        :param str team: Team name, ex: Los Angeles Lakers.
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :return: The team score and the opponent score, None if the team did not play on the date.
+        :rtype: tuple
+        """
+        return self.scores.get(self.get_key(team, date))
+
+    def get_result(self, team, date):
+        """
+        Gets the score of a team's game as a string.
+
+        :param str team: Team name, ex: Los Angeles Lakers.
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :return: The score, ex: 97-88. The team's score is always first. None if the team did not play on the date.
+        :rtype: str
+        """
+        score = self.get_score(team, date)
+        if score is None:
+            return None
+        return '%s-%s' % score
+
+    def get_team_games(self, team):
+        """
+        Gets every game of a team in date order.
+
+        :param str team: Team name, ex: Los Angeles Lakers.
+        :return: The games indexed by date
+        :rtype: pd.DataFrame
+        """
+        team = team.upper().replace(' ', '_')
+        games = self.table[self.table.index.get_level_values('team') == team]
+        return games.droplevel('team').sort_index()
+
+    def get_standings(self):
+        """
+        Gets the wins, losses and point differential of every team.
+
+        :return: The standings, sorted by wins
+        :rtype: pd.DataFrame
+        """
+        teams = self.table.index.get_level_values('team')
+        standings = pd.DataFrame({
+            'wins': (self.table['outcome'] == 'WIN').groupby(teams).sum(),
+            'losses': (self.table['outcome'] == 'LOSS').groupby(teams).sum(),
+            'point_differential': (self.table['team_score'] - self.table['opponent_score']).groupby(teams).sum(),
+        })
+        return standings.sort_values(['wins', 'point_differential'], ascending=False, kind='mergesort')
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,113 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Columnar Ingest
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import numpy as np
+import pandas as pd
+
+# relative imports
+from .constants import Vars
+
+# column name: scraper key of the counting stats read as integers
+INTEGER_KEYS = [
+    ('made_field_goals', 'made_field_goals'),
+    ('made_three_point_field_goals', 'made_three_point_field_goals'),
+    ('made_free_throws', 'made_free_throws'),
+    ('offensive_rebounds', 'offensive_rebounds'),
+    ('defensive_rebounds', 'defensive_rebounds'),
+    ('assists', 'assists'),
+    ('seconds_played', 'seconds_played'),
+    ('attempted_three_point_field_goals', 'attempted_three_point_field_goals'),
+    ('attempted_free_throws', 'attempted_free_throws'),
+    ('attempted_field_goals', 'attempted_field_goals'),
+    ('steals', 'steals'),
+    ('blocks', 'blocks'),
+    ('turnovers', 'turnovers'),
+    ('personal_fouls', 'personal_fouls'),
+]
+# column name: scraper key of the enum columns, stored by enum name
+ENUM_KEYS = [
+    ('team', 'team'),
+    ('location', 'location'),
+    ('opponent', 'opponent'),
+    ('outcome', 'outcome'),
+]
+
+
+def get_enum_names(box_scores, key, enum_names):
+    """
+    Gets the names of the enum members of a column, resolving each member once.
+
+    :param list box_scores: Player box score dictionaries from the scraper client.
+    :param str key: The scraper key, ex: team.
+    :param dict enum_names: Names of the members already resolved, filled in as new members are seen.
+    :return: The names
+    :rtype: numpy.ndarray
+    """
+    names = np.empty(len(box_scores), dtype=object)
+    for i, box_score in enumerate(box_scores):
+        member = box_score[key]
+        name = enum_names.get(member)
+        if name is None:
+            name = member.name
+            enum_names[member] = name
+        names[i] = name
+    return names
+
+
+def create_columns(box_scores, date_obj, enum_names=None):
+    """
+    Converts the player box scores of a day straight into typed column arrays, without creating an object per player.
+    Points and rebounds are calculated on whole columns. Rows are grouped by team in order of first appearance and
+    sorted by player name within each team, the same order as `create_data_frame_from_daily_box_scores`.
+
+    :param list box_scores: Player box score dictionaries from the scraper client.
+    :param datetime.datetime date_obj: The date of the box scores.
+    :param dict enum_names: Optional names of enum members already resolved, shared across days.
+    :return: Arrays keyed by column name, the player names under 'player' followed by `Vars.supported_stats`
+    :rtype: dict
+    """
+    if enum_names is None:
+        enum_names = {}
+    count = len(box_scores)
+    players = np.array([box_score['name'] for box_score in box_scores], dtype=object)
+    columns = {}
+    for column, key in INTEGER_KEYS:
+        columns[column] = np.fromiter((box_score[key] for box_score in box_scores), dtype=np.int64, count=count)
+    for column, key in ENUM_KEYS:
+        columns[column] = get_enum_names(box_scores, key, enum_names)
+    columns['game_score'] = np.fromiter((box_score['game_score'] for box_score in box_scores), dtype=np.float64,
+                                        count=count)
+    # every made field goal is worth 2, made threes add 1 more
+    columns['points'] = (2 * columns['made_field_goals'] + columns['made_three_point_field_goals'] +
+                         columns['made_free_throws'])
+    columns['rebounds'] = columns['offensive_rebounds'] + columns['defensive_rebounds']
+    columns['date'] = np.full(count, date_obj.strftime('%y_%m_%d'), dtype=object)
+    team_codes, _ = pd.factorize(columns['team'])
+    order = np.lexsort((players.astype(str), team_codes)) if count > 0 else np.arange(0)
+    ordered = {'player': players[order]}
+    for stat in Vars.supported_stats:
+        ordered[stat] = columns[stat][order]
+    return ordered
+
+
+def create_data_frame(daily_box_scores):
+    """
+    Creates a data frame of player box scores from the scraper results of many days, through column arrays.
+
+    :param dict daily_box_scores: Player box score dictionaries keyed by datetime.datetime date.
+    :return: The player box scores, indexed by player name, with the columns of `Vars.supported_stats`
+    :rtype: pd.DataFrame
+    """
+    enum_names = {}
+    days = [create_columns(box_scores, date_obj, enum_names) for date_obj, box_scores in daily_box_scores.items()
+            if box_scores]
+    if not days:
+        return pd.DataFrame({stat: [] for stat in Vars.supported_stats}, index=[], columns=Vars.supported_stats)
+    data = {stat: np.concatenate([day[stat] for day in days]) for stat in Vars.supported_stats}
+    return pd.DataFrame(data, index=np.concatenate([day['player'] for day in days]), columns=Vars.supported_stats)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,170 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Derived Metrics
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import json
+import os
+import tempfile
+from collections import OrderedDict
+
+# relative imports
+from .storage import BoxScoreStore
+
+# version assumed for a metric column that exists without a recorded version, the version of the columns written
+# before versions were recorded
+DEFAULT_VERSION = 1
+
+
+class Metric(object):
+    """
+    Class for a derived player box score stat, calculated from other columns of the same row.
+    """
+    def __init__(self, name, func, inputs, version=DEFAULT_VERSION):
+        """
+        Setup for the Metric class.
+
+        :param str name: Name of the column the metric is stored in.
+        :param func: Function taking a data frame and returning the metric of every row as an array or series. Must
+            operate on whole columns.
+        :param list inputs: Columns the function reads, ex: ['steals', 'blocks'].
+        :param int version: Version of the definition. Increase it when the function changes to recalculate the
+            stored values.
+        """
+        self.name = name
+        self.func = func
+        self.inputs = inputs
+        self.version = version
+
+    def compute(self, df):
+        """
+        Calculates the metric for every row of a data frame.
+
+        :param pandas.DataFrame df: The player box scores.
+        :return: The metric values
+        :rtype: numpy.ndarray
+        """
+        return self.func(df)
+
+
+class MetricRegistry(object):
+    """
+    Class for the derived metrics added to player box scores. Metrics are only calculated for rows that do not have
+    them yet, or for every row when a metric is new or its version changed.
+    """
+    def __init__(self):
+        """
+        Setup for the MetricRegistry class.
+        """
+        self.metrics = OrderedDict()
+
+    def register(self, name, func, inputs, version=DEFAULT_VERSION):
+        """
+        Adds a metric, replacing a metric with the same name.
+
+        :param str name: Name of the column the metric is stored in.
+        :param func: Function taking a data frame and returning the metric of every row.
+        :param list inputs: Columns the function reads.
+        :param int version: Version of the definition.
+        :return: The registered metric
+        :rtype: Metric
+        """
+        self.metrics[name] = Metric(name, func, inputs, version=version)
+        return self.metrics[name]
+
+    def get_versions(self):
+        """
+        Gets the version of every registered metric.
+
+        :return: Versions keyed by metric name
+        :rtype: dict
+        """
+        return {name: metric.version for name, metric in self.metrics.items()}
+
+    def get_stale(self, df, versions):
+        """
+        Gets the metrics that have to be calculated for every row of a data frame, because the column is missing or
+        was calculated with another version.
+
+        :param pandas.DataFrame df: The player box scores.
+        :param dict versions: Versions of the stored metric columns, None if none of the rows have metrics yet.
+        :return: Names of the stale metrics
+        :rtype: list
+        """
+        stale = []
+        for name, metric in self.metrics.items():
+            if not set(metric.inputs).issubset(df.columns):
+                continue
+            if versions is None or name not in df.columns or versions.get(name, DEFAULT_VERSION) != metric.version:
+                stale.append(name)
+        return stale
+
+    def materialize(self, df, versions=None):
+        """
+        Adds the registered metrics to a data frame, in place. Stale metrics are calculated for every row, the
+        others only for the rows missing a value, ex: rows appended since the last update.
+
+        :param pandas.DataFrame df: The player box scores.
+        :param dict versions: Versions of the metric columns already in the data frame. None calculates every metric
+            for every row.
+        :return: Names of the metrics calculated for every row
+        :rtype: list
+        """
+        stale = self.get_stale(df, versions)
+        for name, metric in self.metrics.items():
+            if not set(metric.inputs).issubset(df.columns):
+                continue
+            if name in stale:
+                df[name] = metric.compute(df)
+            elif name in df.columns:
+                missing = df[name].isna().to_numpy()
+                if missing.any():
+                    df.loc[missing, name] = metric.compute(df[missing])
+        return stale
+
+    @staticmethod
+    def get_versions_path(data_path):
+        """
+        Gets the file the metric versions of a csv or box score store are recorded in.
+
+        :param str data_path: Path of the csv file, or of a box score store directory.
+        :return: Path of the json file
+        :rtype: str
+        """
+        if BoxScoreStore.is_store(data_path):
+            return os.path.join(data_path, 'metrics.json')
+        return '%s.metrics.json' % os.path.splitext(data_path)[0]
+
+    def load_versions(self, data_path):
+        """
+        Loads the versions of the metrics stored with a csv or box score store.
+
+        :param str data_path: Path of the csv file, or of a box score store directory.
+        :return: Versions keyed by metric name, empty if none were recorded
+        :rtype: dict
+        """
+        path = self.get_versions_path(data_path)
+        if not os.path.exists(path):
+            return {}
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def save_versions(self, data_path):
+        """
+        Records the versions of the registered metrics for a csv or box score store, once every row was written with
+        them. The file is only written when the versions changed.
+
+        :param str data_path: Path of the csv file, or of a box score store directory.
+        """
+        versions = self.get_versions()
+        if self.load_versions(data_path) == versions:
+            return
+        path = self.get_versions_path(data_path)
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(path)), suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(versions, f, indent=1, sort_keys=True)
+        os.replace(temp_path, path)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
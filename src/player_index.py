@@ -0,0 +1,173 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Player Name Index
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import bisect
+import re
+import threading
+import unicodedata
+from collections import defaultdict
+
+NGRAM_SIZE = 3
+# minimum similarity of a fuzzy match used by `resolve`
+MIN_SCORE = 0.5
+
+
+class PlayerIndex(object):
+    """
+    Class for looking up player names by normalized name, by prefix and by n-gram similarity.
+
+    Names are normalized by stripping accents, case folding and dropping punctuation, so "luka doncic" finds
+    "Luka Dončić" and "pj tucker" finds "P.J. Tucker". Names can be added and looked up from many threads, ex: the
+    backfill workers.
+    """
+    def __init__(self, names=None):
+        """
+        Setup for the PlayerIndex class.
+
+        :param names: Optional player names to add, ex: the index of a player box score data frame.
+        """
+        self.names = []
+        self.ids = {}
+        self.exact = defaultdict(list)
+        self.prefixes = []
+        self.ngrams = defaultdict(set)
+        self.ngram_counts = []
+        self.lock = threading.Lock()
+        if names is not None:
+            self.add(names)
+
+    @staticmethod
+    def normalize(name):
+        """
+        Normalizes a player name for comparison.
+
+        :param str name: The player name, ex: Luka Dončić.
+        :return: The normalized name, ex: luka doncic
+        :rtype: str
+        """
+        name = unicodedata.normalize('NFKD', name)
+        name = ''.join([c for c in name if not unicodedata.combining(c)]).casefold()
+        name = re.sub(r"[.'`’]", '', name)
+        name = re.sub(r'[^0-9a-z]+', ' ', name)
+        return name.strip()
+
+    @staticmethod
+    def get_ngrams(normalized):
+        """
+        Gets the n-grams of a normalized name, padded so the start and end of each word count.
+
+        :param str normalized: The normalized name.
+        :return: The n-grams
+        :rtype: set
+        """
+        padded = ' %s ' % normalized
+        return set([padded[i:i + NGRAM_SIZE] for i in range(len(padded) - NGRAM_SIZE + 1)])
+
+    def add(self, names):
+        """
+        Adds player names to the index. Names already in the index are skipped.
+
+        :param names: The player names, ex: the names of fetched box scores.
+        """
+        with self.lock:
+            for name in names:
+                if not isinstance(name, str) or name in self.ids:
+                    continue
+                name_id = len(self.names)
+                self.names.append(name)
+                self.ids[name] = name_id
+                normalized = self.normalize(name)
+                self.exact[normalized].append(name_id)
+                # prefixes of the full name and of every later word, so "doncic" finds "Luka Doncic"
+                words = normalized.split(' ')
+                for i in range(len(words)):
+                    bisect.insort(self.prefixes, (' '.join(words[i:]), name_id))
+                ngrams = self.get_ngrams(normalized)
+                for ngram in ngrams:
+                    self.ngrams[ngram].add(name_id)
+                self.ngram_counts.append(len(ngrams))
+
+    def get_exact(self, name):
+        """
+        Gets the names that are equal to a name once normalized.
+
+        :param str name: The name to look up.
+        :return: The matching names
+        :rtype: list
+        """
+        normalized = self.normalize(name)
+        with self.lock:
+            return [self.names[name_id] for name_id in self.exact.get(normalized, [])]
+
+    def get_prefix(self, prefix, limit=10):
+        """
+        Gets the names where the full name, or one of its later words, starts with a prefix.
+
+        :param str prefix: The prefix to look up, ex: lebr.
+        :param int limit: Maximum number of names returned.
+        :return: The matching names, in alphabetical order of the matched text
+        :rtype: list
+        """
+        prefix = self.normalize(prefix)
+        if not prefix:
+            return []
+        matches = []
+        with self.lock:
+            start = bisect.bisect_left(self.prefixes, (prefix, -1))
+            for key, name_id in self.prefixes[start:]:
+                if not key.startswith(prefix) or len(matches) >= limit:
+                    break
+                if self.names[name_id] not in matches:
+                    matches.append(self.names[name_id])
+        return matches
+
+    def get_fuzzy(self, name, limit=5):
+        """
+        Ranks names by n-gram similarity, the dice coefficient of their n-gram sets.
+
+        :param str name: The name to look up, can be misspelled.
+        :param int limit: Maximum number of names returned.
+        :return: (name, score) tuples, best first. Ties are sorted by name.
+        :rtype: list
+        """
+        ngrams = self.get_ngrams(self.normalize(name))
+        shared = defaultdict(int)
+        ranked = []
+        with self.lock:
+            for ngram in ngrams:
+                for name_id in self.ngrams.get(ngram, ()):
+                    shared[name_id] += 1
+            for name_id, count in shared.items():
+                score = 2.0 * count / (len(ngrams) + self.ngram_counts[name_id])
+                ranked.append((-score, self.names[name_id]))
+        ranked.sort()
+        return [(candidate, round(-score, 3)) for score, candidate in ranked[0:limit]]
+
+    def resolve(self, name, fuzzy=True):
+        """
+        Resolves a name typed by a user into a name of the index: an exact match, else the only prefix match, else
+        the best fuzzy match that is similar enough.
+
+        :param str name: The name to look up.
+        :param bool fuzzy: Indicates if prefix and fuzzy matches are allowed, only normalized exact matches otherwise.
+        :return: The player name, None if nothing matches
+        :rtype: str
+        """
+        exact = self.get_exact(name)
+        if exact:
+            return exact[0]
+        if not fuzzy:
+            return None
+        prefix = self.get_prefix(name, limit=2)
+        if len(prefix) == 1:
+            return prefix[0]
+        fuzzy = self.get_fuzzy(name, limit=1)
+        if fuzzy and fuzzy[0][1] >= MIN_SCORE:
+            return fuzzy[0][0]
+        return None
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
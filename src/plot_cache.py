@@ -0,0 +1,109 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Plot Cache
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import hashlib
+import threading
+from collections import OrderedDict
+
+# third party imports
+import pandas as pd
+
+
+class PlotCache(object):
+    """
+    Class for an in memory cache of rendered plots, keyed by a hash of the plotted data and the plot arguments.
+
+    Only plots rendered to a buffer are cached, so a hit returns the svg text or png bytes without rendering. The
+    least recently used plots are evicted beyond the size budget.
+    """
+    def __init__(self, max_bytes=64 * 1024 * 1024):
+        """
+        Setup for the PlotCache class.
+
+        :param int max_bytes: Size budget of the cached plots. Least recently used plots are evicted beyond it.
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def get_key(name, df, kwargs):
+        """
+        Gets the key of a plot, a hash of its data and arguments.
+
+        :param str name: Name of the plot and of its positional arguments, ex: scatter_minutes_played_points.
+        :param pandas.DataFrame df: The plotted data, after filtering.
+        :param dict kwargs: The keyword arguments of the plot.
+        :return: The key
+        :rtype: str
+        """
+        hasher = hashlib.sha256()
+        hasher.update(name.encode('utf-8'))
+        hasher.update(repr(sorted([(key, repr(value)) for key, value in kwargs.items()])).encode('utf-8'))
+        hasher.update(repr([str(column) for column in df.columns]).encode('utf-8'))
+        hasher.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return hasher.hexdigest()
+
+    @staticmethod
+    def get_entry_size(value):
+        """
+        Gets the size of a cached plot.
+
+        :param value: The svg text or png bytes.
+        :return: Size in bytes
+        :rtype: int
+        """
+        return len(value.encode('utf-8')) if isinstance(value, str) else len(value)
+
+    def get(self, key):
+        """
+        Gets a cached plot.
+
+        :param str key: The key of the plot, see `get_key`.
+        :return: The svg text or png bytes, None if not cached
+        """
+        with self.lock:
+            value = self.entries.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key, value):
+        """
+        Stores a plot, then evicts the least recently used plots if the size budget is exceeded. Plots larger than the
+        size budget are not stored.
+
+        :param str key: The key of the plot, see `get_key`.
+        :param value: The svg text or png bytes.
+        """
+        size = self.get_entry_size(value)
+        if size > self.max_bytes:
+            return
+        with self.lock:
+            if key in self.entries:
+                self.size -= self.get_entry_size(self.entries.pop(key))
+            self.entries[key] = value
+            self.size += size
+            while self.size > self.max_bytes:
+                _, evicted = self.entries.popitem(last=False)
+                self.size -= self.get_entry_size(evicted)
+
+    def clear(self):
+        """
+        Removes every cached plot.
+        """
+        with self.lock:
+            self.entries.clear()
+            self.size = 0
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,189 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Box Score Query
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import numpy as np
+import pandas as pd
+
+# relative imports
+from . import schema
+from .game_results import GameResults
+from .player_index import PlayerIndex
+
+PLAYER = 'player'
+# columns that can be looked up, the player is the index of the data frame
+INDEXED_COLUMNS = [PLAYER, 'team', 'opponent', 'date']
+
+
+class BoxScoreQuery(object):
+    """
+    Class for looking up player box scores by player, team, opponent and date without scanning every row.
+
+    Each lookup column gets a hash index from value to the sorted row positions holding it, built the first time the
+    column is queried. The data frame must not be modified while it is being queried, create a new query instead.
+    """
+    def __init__(self, df):
+        """
+        Setup for the BoxScoreQuery class.
+
+        :param pandas.DataFrame df: The player box scores, indexed by player name.
+        """
+        self.df = df
+        self.indexes = {}
+        self.game_results = None
+        self.player_index = None
+
+    def get_index(self, column):
+        """
+        Gets the index of a column, building it on first use.
+
+        :param str column: One of `INDEXED_COLUMNS`.
+        :return: Sorted row positions keyed by column value
+        :rtype: dict
+        """
+        if column not in self.indexes:
+            values = self.df.index if column == PLAYER else self.df[column]
+            codes, uniques = pd.factorize(values)
+            order = np.argsort(codes, kind='stable')
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            # rows with missing values sort first and are not indexed
+            order = order[np.count_nonzero(codes < 0):]
+            self.indexes[column] = dict(zip(list(uniques), np.split(order, np.cumsum(counts)[:-1])))
+        return self.indexes[column]
+
+    def convert_date(self, date):
+        """
+        Converts a date into the representation used by the date column.
+
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :return: A pd.Timestamp for the compact schema, a 'year_month_day' string otherwise.
+        """
+        return schema.convert_date(date, schema.is_compact(self.df))
+
+    @staticmethod
+    def convert_team(team):
+        """
+        Converts a team name into the enum name used by the team columns, ex: Los Angeles Lakers.
+
+        :param str team: The team name.
+        :return: The enum name, ex: LOS_ANGELES_LAKERS
+        :rtype: str
+        """
+        return team.upper().replace(' ', '_')
+
+    def get_positions(self, column, values):
+        """
+        Gets the row positions holding any of the values of a column.
+
+        :param str column: One of `INDEXED_COLUMNS`.
+        :param list values: The values to look up.
+        :return: Sorted row positions
+        :rtype: numpy.ndarray
+        """
+        index = self.get_index(column)
+        found = [index[value] for value in values if value in index]
+        if not found:
+            return np.array([], dtype=np.int64)
+        if len(found) == 1:
+            return found[0]
+        return np.sort(np.concatenate(found))
+
+    def find(self, player=None, team=None, opponent=None, date=None, teams=None):
+        """
+        Gets the row positions matching every given predicate.
+
+        :param str player: The player name.
+        :param str team: The team name.
+        :param str opponent: The opponent team name.
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :param list teams: Team names, rows of any of them match.
+        :return: Sorted row positions, None if no predicate was given
+        :rtype: numpy.ndarray
+        """
+        lookups = []
+        if player is not None:
+            lookups.append((PLAYER, [player]))
+        if team is not None:
+            lookups.append(('team', [self.convert_team(team)]))
+        if teams is not None:
+            lookups.append(('team', [self.convert_team(entry) for entry in teams]))
+        if opponent is not None:
+            lookups.append(('opponent', [self.convert_team(opponent)]))
+        if date is not None:
+            lookups.append(('date', [self.convert_date(date)]))
+        positions = None
+        for column, values in lookups:
+            found = self.get_positions(column, values)
+            if positions is None:
+                positions = found
+            else:
+                positions = np.intersect1d(positions, found, assume_unique=True)
+        return positions
+
+    def take(self, positions):
+        """
+        Gets the rows at the given positions. A contiguous run of rows is returned as a slice of the data frame,
+        without copying the values.
+
+        :param numpy.ndarray positions: Sorted row positions.
+        :return: The rows
+        :rtype: pd.DataFrame
+        """
+        if positions is None:
+            return self.df
+        if len(positions) == 0:
+            return self.df.iloc[0:0]
+        if positions[-1] - positions[0] + 1 == len(positions):
+            return self.df.iloc[positions[0]:positions[-1] + 1]
+        return self.df.iloc[positions]
+
+    def select(self, player=None, team=None, opponent=None, date=None, teams=None):
+        """
+        Gets the player box scores matching every given predicate.
+
+        :param str player: The player name.
+        :param str team: The team name.
+        :param str opponent: The opponent team name.
+        :param date: A datetime.datetime object or a 'year_month_day' string.
+        :param list teams: Team names, rows of any of them match.
+        :return: The matching rows, in the order of the data frame
+        :rtype: pd.DataFrame
+        """
+        return self.take(self.find(player=player, team=team, opponent=opponent, date=date, teams=teams))
+
+    def has_player(self, player):
+        """
+        Determines if a player has any box scores.
+
+        :param str player: The player name.
+        :return: True if found
+        :rtype: bool
+        """
+        return player in self.get_index(PLAYER)
+
+    def get_game_results(self):
+        """
+        Gets the game results of the data frame, building them on first use.
+
+        :return: The game results
+        :rtype: GameResults
+        """
+        if self.game_results is None:
+            self.game_results = GameResults(self.df)
+        return self.game_results
+
+    def get_player_index(self):
+        """
+        Gets the name index of the players in the data frame, building it on first use.
+
+        :return: The player name index
+        :rtype: PlayerIndex
+        """
+        if self.player_index is None:
+            self.player_index = PlayerIndex(self.get_index(PLAYER).keys())
+        return self.player_index
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,105 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Batch Plot Rendering
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# third party imports
+import matplotlib
+import matplotlib.pyplot as plt
+
+# relative imports
+from . import analytics_API as Api
+from . import ez_plot
+from .query import BoxScoreQuery
+
+# plot name: (function, position of the shared data frame in its arguments, None if it takes no data frame)
+PLOTS = {
+    'date': (Api.create_date_plot, 2),
+    'scatter': (Api.create_scatter_plot_with_trend_line, 2),
+    'bar': (Api.create_bar_plot, 0),
+    'time_series': (Api.create_time_series_plot, None),
+    'bar_graph': (ez_plot.create_bar_graph, None),
+}
+
+# data frame shared by the plots rendered in a worker process, set once per worker
+worker_df = None
+
+
+def init_worker(df):
+    """
+    Sets up a worker process: switches to the headless Agg backend and keeps the shared data frame.
+
+    :param pandas.DataFrame df: The data frame given to every plot that takes one, can be None.
+    """
+    global worker_df
+    matplotlib.use('Agg')
+    plt.switch_backend('Agg')
+    worker_df = df
+
+
+def render_plot(spec, df=None):
+    """
+    Renders a single plot specification.
+
+    A specification is a dictionary with the name of the plot in `PLOTS`, its positional 'args' without the data
+    frame, and its 'kwargs'. A bar plot given a 'team' and a 'date' kwarg only draws the rows of that team on that
+    date, see `get_team_date_df`. The ez_plot bar graph does not save itself, its 'save_path' and 'name' are used to
+    save it.
+
+    :param dict spec: The plot specification, ex: {'plot': 'date', 'args': ['points', 'LeBron James'],
+        'kwargs': {'save_path': 'svg_buffer'}}.
+    :param pandas.DataFrame df: The data frame of the plot, the worker's shared data frame if None.
+    :return: The path of the plot, the svg text or the png bytes
+    """
+    func, df_position = PLOTS[spec['plot']]
+    args = list(spec.get('args', []))
+    kwargs = dict(spec.get('kwargs', {}))
+    if df_position is not None:
+        plot_df = df if df is not None else worker_df
+        if spec['plot'] == 'bar' and kwargs.get('team') is not None and kwargs.get('date') is not None:
+            plot_df = Api.get_team_date_df(plot_df, BoxScoreQuery.convert_team(kwargs['team']), kwargs['date'])
+        args.insert(df_position, plot_df)
+    try:
+        result = func(*args, **kwargs)
+        if spec['plot'] == 'bar_graph':
+            return Api.save_plot(spec.get('save_path'), spec.get('name', 'bar_graph'))
+        # the data frames returned with the path are not sent back to the caller
+        return result[0] if isinstance(result, tuple) else result
+    finally:
+        plt.close('all')
+
+
+def render_plots(specs, logger, df=None, max_workers=4):
+    """
+    Renders many plots in parallel worker processes on the Agg backend. The data frame is sent once to each worker
+    instead of once per plot.
+
+    :param list specs: The plot specifications, see `render_plot`. Use 'svg_buffer' or 'png_buffer' as save_path to
+        get the plots in memory.
+    :param logger: Logging object.
+    :param pandas.DataFrame df: The data frame shared by every plot that takes one.
+    :param int max_workers: Maximum number of worker processes.
+    :return: The result of every specification in order, None for the ones that failed, and the failed positions.
+    :rtype: tuple
+    """
+    results = [None] * len(specs)
+    failed = []
+    if not specs:
+        return results, failed
+    with ProcessPoolExecutor(max_workers=max(1, min(max_workers, len(specs))), initializer=init_worker,
+                             initargs=(df,)) as executor:
+        futures = {executor.submit(render_plot, spec): position for position, spec in enumerate(specs)}
+        for future in as_completed(futures):
+            position = futures[future]
+            try:
+                results[position] = future.result()
+            except Exception as e:
+                logger.info('Failed to render plot %s: %s' % (position, e))
+                failed.append(position)
+    return results, sorted(failed)
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
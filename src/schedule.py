@@ -0,0 +1,193 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Game Calendar
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import bisect
+import datetime
+import json
+import os
+import tempfile
+import time
+
+# third party imports
+from basketball_reference_web_scraper import client
+from basketball_reference_web_scraper.errors import InvalidSeason
+
+# basketball reference start times are eastern, games never start close enough to midnight for daylight savings
+# to move them to another day, so a fixed offset is enough to find the local date of a game
+EASTERN_OFFSET = datetime.timezone(datetime.timedelta(hours=-5))
+
+
+class GameCalendar(object):
+    """
+    Class for a locally persisted index of the dates games are played on, built from the season schedules.
+    """
+    def __init__(self, path='game_calendar.json', refresh_seconds=86400, fetch_schedule=None):
+        """
+        Setup for the GameCalendar class.
+
+        :param str path: Path of the json file the schedules are persisted to, None keeps them in memory only.
+        :param int refresh_seconds: How long the schedule of a season that is not over yet is trusted.
+        :param fetch_schedule: Function taking a season end year and returning the scraper season schedule,
+            defaults to the scraper client.
+        """
+        self.path = path
+        self.refresh_seconds = refresh_seconds
+        self.fetch_schedule = fetch_schedule
+        if self.fetch_schedule is None:
+            self.fetch_schedule = lambda season_end_year: client.season_schedule(season_end_year=season_end_year)
+        self.seasons = {}
+        if self.path is not None and os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                self.seasons = json.load(f)
+
+    @staticmethod
+    def get_season_end_year(date_obj):
+        """
+        Gets the year a season containing the given date ends in.
+
+        :param datetime.datetime date_obj: The date.
+        :return: The season end year
+        :rtype: int
+        """
+        if date_obj.month >= 8:
+            return date_obj.year + 1
+        return date_obj.year
+
+    @staticmethod
+    def convert_date(date_obj):
+        """
+        Converts a date into the key format used by the calendar.
+
+        :param datetime.datetime date_obj: The date.
+        :return: The date as 'year_month_day'.
+        :rtype: str
+        """
+        return date_obj.strftime('%y_%m_%d')
+
+    def is_final(self, season_end_year):
+        """
+        Determines if a season is over, meaning its schedule can no longer change.
+
+        :param int season_end_year: The season end year.
+        :return: True if the season is over
+        :rtype: bool
+        """
+        return season_end_year < self.get_season_end_year(datetime.datetime.now())
+
+    def load_season(self, season_end_year):
+        """
+        Gets the games of a season keyed by date, fetching and persisting the schedule when needed.
+
+        :param int season_end_year: The season end year.
+        :return: Lists of [away team, home team] keyed by date.
+        :rtype: dict
+        """
+        key = str(season_end_year)
+        season = self.seasons.get(key)
+        if season is not None:
+            if self.is_final(season_end_year) or time.time() - season['fetched'] < self.refresh_seconds:
+                return season['games']
+        games = {}
+        try:
+            schedule = self.fetch_schedule(season_end_year)
+        except InvalidSeason:
+            # the schedule is not published yet
+            schedule = []
+        for game in schedule:
+            start_time = game['start_time']
+            if start_time.tzinfo is not None:
+                start_time = start_time.astimezone(EASTERN_OFFSET)
+            games.setdefault(self.convert_date(start_time), []).append([game['away_team'].name,
+                                                                        game['home_team'].name])
+        self.seasons[key] = {'fetched': time.time(), 'games': games}
+        self.save()
+        return games
+
+    def save(self):
+        """
+        Writes the schedules to the json file.
+        """
+        if self.path is None:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.seasons, f)
+        os.replace(temp_path, self.path)
+
+    def get_games_on_date(self, date_obj):
+        """
+        Gets the games played on a date.
+
+        :param datetime.datetime date_obj: The date.
+        :return: Lists of [away team, home team]
+        :rtype: list
+        """
+        converted_date = self.convert_date(date_obj)
+        season_end_year = self.get_season_end_year(date_obj)
+        games = self.load_season(season_end_year).get(converted_date, [])
+        if not games and date_obj.month in (8, 9, 10):
+            # seasons have run late into the fall before (2020), check the prior season too
+            games = self.load_season(season_end_year - 1).get(converted_date, [])
+        return games
+
+    def is_game_day(self, date_obj):
+        """
+        Determines if any games are played on a date.
+
+        :param datetime.datetime date_obj: The date.
+        :return: True if at least one game is played
+        :rtype: bool
+        """
+        return len(self.get_games_on_date(date_obj)) > 0
+
+    def get_game_dates(self, season_end_year):
+        """
+        Gets every date of a season with at least one game.
+
+        :param int season_end_year: The season end year.
+        :return: The game dates in increasing order.
+        :rtype: list
+        """
+        return sorted([datetime.datetime.strptime(key, '%y_%m_%d')
+                       for key in self.load_season(season_end_year).keys()])
+
+    def get_game_dates_in_range(self, start, end):
+        """
+        Gets every date with at least one game from the start date up to, but not including, the end date.
+
+        :param datetime.datetime start: The first date.
+        :param datetime.datetime end: The end date, exclusive.
+        :return: The game dates in increasing order.
+        :rtype: list
+        """
+        start_day = datetime.datetime(year=start.year, month=start.month, day=start.day)
+        dates = set()
+        for season_end_year in range(self.get_season_end_year(start) - 1, self.get_season_end_year(end) + 1):
+            for date_obj in self.get_game_dates(season_end_year):
+                if start_day <= date_obj < end:
+                    dates.add(date_obj)
+        return sorted(dates)
+
+    def get_previous_game_dates(self, date_obj, count):
+        """
+        Gets the most recent game dates on or before a date, looking back at most into the prior season.
+
+        :param datetime.datetime date_obj: The date to start from.
+        :param int count: The maximum number of dates to return.
+        :return: The game dates in decreasing order.
+        :rtype: list
+        """
+        day = datetime.datetime(year=date_obj.year, month=date_obj.month, day=date_obj.day)
+        season_end_year = self.get_season_end_year(day)
+        dates = sorted(set(self.get_game_dates(season_end_year - 1) + self.get_game_dates(season_end_year)))
+        index = bisect.bisect_right(dates, day)
+        previous = dates[max(0, index - count):index]
+        previous.reverse()
+        return previous
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,181 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Box Score Schema
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import datetime
+import numpy as np
+import pandas as pd
+
+# third party imports
+from basketball_reference_web_scraper.data import Team, Location, Outcome
+
+# relative imports
+from .constants import Vars
+
+DATE_FORMAT = '%y_%m_%d'
+DATE_COLUMN = 'date'
+# enum like columns, kept as categoricals over every name of the scraper enum so frames from different workers share
+# the same categories and concatenate without falling back to object columns
+CATEGORIES = {
+    'team': [team.name for team in Team],
+    'opponent': [team.name for team in Team],
+    'location': [location.name for location in Location],
+    'outcome': [outcome.name for outcome in Outcome],
+}
+# stats with fractional values
+FLOAT_STATS = ['game_score', 'minutes_played', 'true_shooting', 'assist_turnover_ratio']
+# counting stats, every other supported stat
+INTEGER_STATS = [stat for stat in Vars.supported_stats
+                 if stat not in CATEGORIES and stat not in FLOAT_STATS and stat != DATE_COLUMN]
+# integer types tried in order, a column is widened until its values fit. Signed and at least 16 bits so adding or
+# subtracting a few stats, ex: points + rebounds + assists, cannot wrap around
+INTEGER_DTYPES = [np.int16, np.int32, np.int64]
+
+
+def is_compact(df):
+    """
+    Determines if a data frame uses the compact schema.
+
+    :param pandas.DataFrame df: The player box scores.
+    :return: True if the date column holds datetime64 values.
+    :rtype: bool
+    """
+    return df is not None and DATE_COLUMN in df.columns and pd.api.types.is_datetime64_dtype(df[DATE_COLUMN])
+
+
+def convert_date(date, compact):
+    """
+    Converts a date into the representation used by the date column of a data frame.
+
+    :param date: A datetime.datetime object or a 'year_month_day' string.
+    :param bool compact: Indicates if the data frame uses the compact schema.
+    :return: A pd.Timestamp for the compact schema, a 'year_month_day' string otherwise.
+    """
+    if compact:
+        if isinstance(date, datetime.datetime):
+            return pd.Timestamp(date.year, date.month, date.day)
+        return pd.Timestamp(datetime.datetime.strptime(date, DATE_FORMAT))
+    if isinstance(date, datetime.datetime):
+        return date.strftime(DATE_FORMAT)
+    return date
+
+
+def get_integer_dtype(values):
+    """
+    Gets the smallest integer type that can hold every value of a column.
+
+    :param numpy.ndarray values: The column values, without missing values.
+    :return: The integer type, or None if the values are not whole numbers.
+    :rtype: type
+    """
+    if values.size == 0:
+        return INTEGER_DTYPES[0]
+    if not np.array_equal(values, np.round(values)):
+        return None
+    low = values.min()
+    high = values.max()
+    for dtype in INTEGER_DTYPES:
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return None
+
+
+def get_categorical_dtype(column, values):
+    """
+    Gets the categorical type of an enum like column. Values that are not enum names are added as extra categories.
+
+    :param str column: The column name, one of the keys of `CATEGORIES`.
+    :param pandas.Series values: The column values.
+    :return: The categorical type
+    :rtype: pandas.CategoricalDtype
+    """
+    categories = CATEGORIES[column]
+    extra = sorted(set(values.dropna().astype(str).unique()).difference(categories))
+    return pd.CategoricalDtype(categories=categories + extra)
+
+
+def to_compact(df):
+    """
+    Converts player box scores into the compact schema: the smallest integer type that fits each counting stat,
+    float32 for fractional stats, categoricals for the enum like columns and a datetime64 date. Columns that are not
+    part of the schema are kept as is. A counting stat with missing values is stored as float32.
+
+    :param pandas.DataFrame df: The player box scores in the csv schema.
+    :return: A new data frame in the compact schema
+    :rtype: pd.DataFrame
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if column == DATE_COLUMN:
+            if not pd.api.types.is_datetime64_dtype(series):
+                series = pd.to_datetime(series, format=DATE_FORMAT)
+        elif column in CATEGORIES:
+            series = series.astype(get_categorical_dtype(column, series))
+        elif column in INTEGER_STATS and pd.api.types.is_numeric_dtype(series):
+            dtype = None
+            if not series.isna().any():
+                dtype = get_integer_dtype(series.to_numpy())
+            series = series.astype(dtype if dtype is not None else np.float32)
+        elif column in FLOAT_STATS and pd.api.types.is_numeric_dtype(series):
+            series = series.astype(np.float32)
+        columns[column] = series
+    return pd.DataFrame(columns, index=df.index, columns=df.columns)
+
+
+def to_legacy(df):
+    """
+    Converts player box scores from the compact schema back into the csv schema: float64 stats, text for the enum like
+    columns and 'year_month_day' date strings.
+
+    :param pandas.DataFrame df: The player box scores in the compact schema.
+    :return: A new data frame in the csv schema
+    :rtype: pd.DataFrame
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if column == DATE_COLUMN and pd.api.types.is_datetime64_dtype(series):
+            # format each distinct date once
+            codes, uniques = pd.factorize(series)
+            series = pd.Series(np.asarray(uniques.strftime(DATE_FORMAT), dtype=object)[codes], index=df.index)
+        elif pd.api.types.is_categorical_dtype(series):
+            series = series.astype(object)
+        elif column in INTEGER_STATS or column in FLOAT_STATS:
+            if pd.api.types.is_numeric_dtype(series):
+                series = series.astype(np.float64)
+                if column in FLOAT_STATS:
+                    # float32 values printed with float64 precision would not match the csv
+                    series = series.round(3)
+        columns[column] = series
+    return pd.DataFrame(columns, index=df.index, columns=df.columns)
+
+
+def read_csv(csv_path):
+    """
+    Reads a player box score csv directly into the compact schema. The enum like columns are parsed as categoricals
+    while reading, so the text values are never held as separate objects.
+
+    :param str csv_path: Path of the csv file.
+    :return: The player box scores in the compact schema
+    :rtype: pd.DataFrame
+    """
+    dtypes = {column: 'category' for column in CATEGORIES}
+    return to_compact(pd.read_csv(csv_path, index_col=0, dtype=dtypes))
+
+
+def get_memory_usage(df):
+    """
+    Gets the memory used by a data frame, including the text it references.
+
+    :param pandas.DataFrame df: The data frame.
+    :return: Number of bytes
+    :rtype: int
+    """
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
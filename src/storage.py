@@ -0,0 +1,370 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Box Score Store
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import datetime
+import json
+import os
+import struct
+import tempfile
+import numpy as np
+import pandas as pd
+
+# relative imports
+from . import schema
+
+MANIFEST_NAME = 'manifest.json'
+INDEX_KEY = '__index__'
+
+
+class BoxScoreStore(object):
+    """
+    Class for a columnar store of player box scores partitioned by date.
+
+    Every date is kept in its own binary file holding a json header followed by the raw values of each column, text
+    columns dictionary encoded. A json manifest records the partitions, their row counts and the teams in each.
+    Reads only open the partitions, and only read the columns, a query needs.
+    """
+    def __init__(self, path):
+        """
+        Setup for the BoxScoreStore class.
+
+        :param str path: Directory of the store. Created on first write.
+        """
+        self.path = path
+        self.manifest_path = os.path.join(path, MANIFEST_NAME)
+        self.manifest = {'version': 1, 'generation': 0, 'columns': [], 'partitions': {}}
+        if os.path.exists(self.manifest_path):
+            with open(self.manifest_path, 'r') as f:
+                self.manifest = json.load(f)
+
+    @staticmethod
+    def is_store(path):
+        """
+        Determines if a path is a box score store.
+
+        :param str path: The path to check.
+        :return: True if the path is a store directory, or a directory that does not exist yet without a suffix.
+        :rtype: bool
+        """
+        if os.path.isdir(path):
+            return os.path.exists(os.path.join(path, MANIFEST_NAME))
+        return not os.path.exists(path) and os.path.splitext(path)[1] == ''
+
+    @staticmethod
+    def convert_date(date):
+        """
+        Converts a box score date into a partition key. Partition keys sort in date order across centuries.
+
+        :param date: A 'year_month_day' string as used in the data frame, or a datetime.datetime object as used in the
+            compact schema.
+        :return: The partition key, 'YYYY-MM-DD'.
+        :rtype: str
+        """
+        if not isinstance(date, datetime.datetime):
+            date = datetime.datetime.strptime(date, '%y_%m_%d')
+        return date.strftime('%Y-%m-%d')
+
+    def exists(self):
+        """
+        Determines if the store has any data.
+
+        :return: True if at least one partition was written.
+        :rtype: bool
+        """
+        return len(self.manifest['partitions']) > 0
+
+    def get_dates(self):
+        """
+        Gets the dates of every partition.
+
+        :return: The dates in increasing order.
+        :rtype: list
+        """
+        return [datetime.datetime.strptime(key, '%Y-%m-%d') for key in sorted(self.manifest['partitions'].keys())]
+
+    def get_row_count(self):
+        """
+        Gets the number of rows in the store.
+
+        :return: Row count
+        :rtype: int
+        """
+        return sum([partition['rows'] for partition in self.manifest['partitions'].values()])
+
+    def write(self, df, dates=None):
+        """
+        Writes a data frame to the store, replacing the partitions of every date written.
+
+        :param pandas.DataFrame df: The player box scores, indexed by player name.
+        :param list dates: Optional 'year_month_day' dates to limit the write to. Other partitions are not touched.
+        :return: Number of partitions written
+        :rtype: int
+        """
+        if dates is not None:
+            if schema.is_compact(df):
+                dates = [datetime.datetime.strptime(self.convert_date(date), '%Y-%m-%d') for date in dates]
+            df = df[df['date'].isin(dates)]
+        generation = self.manifest.get('generation', 0) + 1
+        replaced = []
+        for date, date_df in df.groupby('date', sort=False):
+            replaced.append(self.write_partition(date, date_df, generation))
+        for column in df.columns:
+            if column not in self.manifest['columns']:
+                self.manifest['columns'].append(column)
+        self.commit(generation, replaced)
+        return len(replaced)
+
+    def append(self, df):
+        """
+        Appends player box scores to the store, skipping rows whose (player, date) key is already stored.
+        Only the partitions of the dates in the given data frame are read and rewritten.
+
+        :param pandas.DataFrame df: The new player box scores, indexed by player name.
+        :return: The rows that were appended
+        :rtype: pd.DataFrame
+        """
+        if schema.is_compact(df):
+            df = schema.to_legacy(df)
+        generation = self.manifest.get('generation', 0) + 1
+        replaced = []
+        appended = []
+        for date, date_df in df.groupby('date', sort=False):
+            partition = self.manifest['partitions'].get(self.convert_date(date))
+            if partition is None:
+                new_rows = date_df[~date_df.index.duplicated(keep='first')]
+                partition_df = new_rows
+            else:
+                existing = self.read_partition(partition['file'], [INDEX_KEY] + list(self.manifest['columns']))
+                existing_df = pd.DataFrame({column: existing[column] for column in self.manifest['columns']},
+                                           index=pd.Index(existing[INDEX_KEY], dtype=object),
+                                           columns=self.manifest['columns'])
+                new_rows = date_df[~date_df.index.isin(existing_df.index) & ~date_df.index.duplicated(keep='first')]
+                partition_df = pd.concat([existing_df, new_rows], sort=False)
+            if new_rows.shape[0] == 0:
+                continue
+            replaced.append(self.write_partition(date, partition_df, generation))
+            appended.append(new_rows)
+        for column in df.columns:
+            if column not in self.manifest['columns']:
+                self.manifest['columns'].append(column)
+        self.commit(generation, replaced)
+        if not appended:
+            return df.iloc[0:0]
+        return pd.concat(appended, sort=False)
+
+    def commit(self, generation, replaced):
+        """
+        Commits newly written partitions by writing the manifest that references them, then removes the partition
+        files they replaced. A crash before the manifest is replaced leaves the previous state untouched.
+
+        :param int generation: The generation of the new partitions.
+        :param list replaced: Files of the replaced partitions, relative to the store directory, or None.
+        """
+        self.manifest['generation'] = generation
+        # the renamed partition files must be on disk before the manifest that references them
+        self.fsync_directory(os.path.join(self.path, 'partitions'))
+        self.save_manifest()
+        for file_name in replaced:
+            if file_name is not None and os.path.exists(os.path.join(self.path, file_name)):
+                os.remove(os.path.join(self.path, file_name))
+
+    def write_partition(self, date, df, generation):
+        """
+        Writes a single date partition to a new file. The partition is only visible after `commit` is called.
+
+        :param str date: The 'year_month_day' date of the rows.
+        :param pandas.DataFrame df: The player box scores of that date.
+        :param int generation: The generation of the write, part of the file name.
+        :return: The file of the partition that is being replaced, or None
+        :rtype: str
+        """
+        if not os.path.exists(os.path.join(self.path, 'partitions')):
+            os.makedirs(os.path.join(self.path, 'partitions'), exist_ok=True)
+        key = self.convert_date(date)
+        file_name = os.path.join('partitions', '%s.%s.bin' % (key, generation))
+        columns = [(INDEX_KEY, df.index.to_series())] + [(column, df[column]) for column in df.columns]
+        header = {'rows': int(df.shape[0]), 'columns': {}}
+        buffers = []
+        offset = 0
+        for column, series in columns:
+            values, categories = self.__encode(series)
+            data = values.tobytes()
+            header['columns'][column] = {'dtype': values.dtype.str, 'offset': offset, 'nbytes': len(data)}
+            if categories is not None:
+                header['columns'][column]['categories'] = categories
+            buffers.append(data)
+            offset += len(data)
+        header_bytes = json.dumps(header).encode('utf-8')
+        fd, temp_path = tempfile.mkstemp(dir=os.path.join(self.path, 'partitions'), suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(struct.pack('<Q', len(header_bytes)))
+                f.write(header_bytes)
+                for data in buffers:
+                    f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, os.path.join(self.path, file_name))
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        teams = sorted(set(df['team'].astype(str))) if 'team' in df.columns else []
+        old_partition = self.manifest['partitions'].get(key)
+        self.manifest['partitions'][key] = {'file': file_name, 'rows': int(df.shape[0]), 'teams': teams}
+        return old_partition['file'] if old_partition is not None else None
+
+    def save_manifest(self):
+        """
+        Writes the manifest atomically. The manifest is always written after the partitions it references.
+        """
+        if not os.path.exists(self.path):
+            os.makedirs(self.path, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.path, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.manifest_path)
+        # the new manifest must be on disk before the partitions it replaced are removed
+        self.fsync_directory(self.path)
+
+    @staticmethod
+    def fsync_directory(path):
+        """
+        Flushes the entries of a directory to disk, so files renamed into it survive a system crash. Does nothing on
+        platforms that cannot open directories, ex: Windows.
+
+        :param str path: The directory.
+        """
+        if not hasattr(os, 'O_DIRECTORY') or not os.path.isdir(path):
+            return
+        fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def get_partition_keys(self, start_date=None, end_date=None, teams=None):
+        """
+        Gets the partitions that can hold rows matching the date and team predicates, using only the manifest.
+
+        :param datetime.datetime start_date: Optional first date, inclusive.
+        :param datetime.datetime end_date: Optional last date, inclusive.
+        :param list teams: Optional team names, ex: LOS_ANGELES_LAKERS.
+        :return: Partition keys in date order.
+        :rtype: list
+        """
+        start_key = self.convert_date(start_date) if start_date is not None else None
+        end_key = self.convert_date(end_date) if end_date is not None else None
+        team_set = set(teams) if teams is not None else None
+        keys = []
+        for key in sorted(self.manifest['partitions'].keys()):
+            if start_key is not None and key < start_key:
+                continue
+            if end_key is not None and key > end_key:
+                continue
+            if team_set is not None and team_set.isdisjoint(self.manifest['partitions'][key]['teams']):
+                continue
+            keys.append(key)
+        return keys
+
+    def read(self, columns=None, start_date=None, end_date=None, teams=None):
+        """
+        Reads player box scores from the store.
+
+        :param list columns: Optional columns to load, all columns if None.
+        :param datetime.datetime start_date: Optional first date, inclusive.
+        :param datetime.datetime end_date: Optional last date, inclusive.
+        :param list teams: Optional team names to keep, ex: LOS_ANGELES_LAKERS.
+        :return: The player box scores indexed by player name, None if the store is empty.
+        :rtype: pd.DataFrame
+        """
+        if not self.exists():
+            return None
+        if columns is None:
+            columns = list(self.manifest['columns'])
+        load_columns = list(columns)
+        if teams is not None and 'team' not in load_columns:
+            load_columns.append('team')
+        data = {column: [] for column in [INDEX_KEY] + load_columns}
+        for key in self.get_partition_keys(start_date=start_date, end_date=end_date, teams=teams):
+            partition = self.read_partition(self.manifest['partitions'][key]['file'], [INDEX_KEY] + load_columns)
+            mask = None
+            if teams is not None:
+                mask = np.isin(partition['team'], teams)
+            for column, values in partition.items():
+                data[column].append(values if mask is None else values[mask])
+        for column in data.keys():
+            data[column] = np.concatenate(data[column]) if data[column] else np.array([], dtype=object)
+        index = pd.Index(data.pop(INDEX_KEY), dtype=object)
+        df = pd.DataFrame(data, index=index, columns=load_columns)
+        return df[columns]
+
+    def read_partition(self, file_name, columns):
+        """
+        Reads columns of a single partition file, seeking past the columns that are not needed.
+
+        :param str file_name: The partition file, relative to the store directory.
+        :param list columns: The columns to load. Columns the partition does not have are filled with NaN.
+        :return: Column arrays keyed by column name
+        :rtype: dict
+        """
+        arrays = {}
+        with open(os.path.join(self.path, file_name), 'rb') as f:
+            header_size = struct.unpack('<Q', f.read(8))[0]
+            header = json.loads(f.read(header_size).decode('utf-8'))
+            data_start = 8 + header_size
+            for column in columns:
+                info = header['columns'].get(column)
+                if info is None:
+                    # column added after this partition was written
+                    arrays[column] = np.full(header['rows'], np.nan)
+                    continue
+                f.seek(data_start + info['offset'])
+                values = np.frombuffer(f.read(info['nbytes']), dtype=np.dtype(info['dtype']))
+                if 'categories' in info:
+                    values = np.asarray(info['categories'], dtype=object)[values]
+                arrays[column] = values
+        return arrays
+
+    def import_csv(self, csv_path):
+        """
+        Imports a player box score csv into the store.
+
+        :param str csv_path: Path of the csv file.
+        :return: Number of partitions written
+        :rtype: int
+        """
+        return self.write(pd.read_csv(csv_path, index_col=0))
+
+    @staticmethod
+    def __encode(series):
+        """
+        Converts a column into raw values. Text, categorical and date columns are dictionary encoded, dates as
+        'year_month_day' strings so every partition reads back the same way.
+
+        :param pandas.Series series: The column.
+        :return: The values, and the categories of a text column or None.
+        :rtype: tuple
+        """
+        if pd.api.types.is_datetime64_dtype(series):
+            codes, uniques = pd.factorize(series)
+            return codes.astype(np.int32), [str(date) for date in uniques.strftime(schema.DATE_FORMAT)]
+        if pd.api.types.is_categorical_dtype(series):
+            categories = [str(category) for category in series.cat.categories]
+            codes = series.cat.codes.to_numpy().astype(np.int32)
+            if (codes < 0).any():
+                categories.append('')
+                codes[codes < 0] = len(categories) - 1
+            return codes, categories
+        if series.dtype == object:
+            codes, categories = pd.factorize(series.fillna('').astype(str))
+            return codes.astype(np.int32), [str(category) for category in categories]
+        return np.ascontiguousarray(series.to_numpy()), None
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -3,13 +3,53 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 # imports
+from collections import OrderedDict
+
+# third party imports
+import numpy as np
+import pandas as pd
+
+# relative imports
 from .box_score import BoxScore
+from .constants import Vars
 from . import ez_plot
 
+# column name: BoxScore attribute, the date is converted with `BoxScore.get_date_string`
+ATTRIBUTES = OrderedDict([
+    ('player', 'player_name'),
+    ('points', 'points'),
+    ('rebounds', 'rebounds'),
+    ('assists', 'assists'),
+    ('date', 'date'),
+    ('made_field_goals', 'made_fg'),
+    ('made_three_point_field_goals', 'made_threes'),
+    ('made_free_throws', 'made_ft'),
+    ('offensive_rebounds', 'offensive_rebounds'),
+    ('defensive_rebounds', 'defensive_rebounds'),
+    ('team', 'player_team'),
+    ('location', 'location'),
+    ('opponent', 'opponent'),
+    ('outcome', 'outcome'),
+    ('seconds_played', 'seconds_played'),
+    ('attempted_three_point_field_goals', 'attempted_threes'),
+    ('attempted_free_throws', 'attempted_ft'),
+    ('attempted_field_goals', 'attempted_fg'),
+    ('steals', 'steals'),
+    ('blocks', 'blocks'),
+    ('turnovers', 'turnovers'),
+    ('personal_fouls', 'personal_fouls'),
+    ('game_score', 'game_score'),
+])
+# columns holding names instead of numbers
+STRING_COLUMNS = ['player', 'date', 'team', 'location', 'opponent', 'outcome']
+
 
 class TeamBoxScore(object):
     """
     Class for a team box score object
+
+    The player box scores are sorted by player name once, the first time a column is needed, and every stat is kept
+    as an array in that order. The player box scores must not be modified after that.
     """
     def __init__(self, box_scores, team_box_score, team_name, date):
         """
@@ -20,9 +60,10 @@ class TeamBoxScore(object):
         :param str team_name: The team name of the associated box scores.
         :param datetime.datetime date: The data from the box score.
         """
-        self.player_box_scores = [BoxScore(box_score, date) for box_score in box_scores]
+        self.player_box_scores = BoxScore.from_dicts(box_scores, date)
         self.team_box_score = team_box_score
         self.team = team_name.title().replace('_', ' ')
+        self.columns = None
 
     def to_string(self):
         """
@@ -44,6 +85,48 @@ class TeamBoxScore(object):
         ez_plot.create_bar_graph(x_data=self.get_players(), y_data=self.get_points(),
                                  x_lab='Players', y_lab='Points', title='%s Points' % self.team)
 
+    def to_columns(self):
+        """
+        Gets every stat of the player box scores as arrays in player name order, sorting the box scores once.
+
+        :return: Arrays keyed by column name, the player names under 'player' followed by `Vars.supported_stats`
+        :rtype: OrderedDict
+        """
+        if self.columns is None:
+            box_scores = sorted(self.player_box_scores, key=lambda x: x.player_name)
+            self.columns = OrderedDict()
+            for column, attribute in ATTRIBUTES.items():
+                if column == 'date':
+                    values = [bs.get_date_string() for bs in box_scores]
+                else:
+                    values = [getattr(bs, attribute) for bs in box_scores]
+                if column in STRING_COLUMNS:
+                    self.columns[column] = np.array(values, dtype=object)
+                else:
+                    self.columns[column] = np.array(values)
+        return self.columns
+
+    def to_frame(self):
+        """
+        Converts the player box scores into a data frame indexed by player name.
+
+        :return: The player box scores, with the columns of `Vars.supported_stats`
+        :rtype: pd.DataFrame
+        """
+        columns = self.to_columns()
+        return pd.DataFrame(OrderedDict([(stat, columns[stat]) for stat in Vars.supported_stats]),
+                            index=columns['player'])
+
+    def get_column(self, column):
+        """
+        Gets a column of the player box scores as a list in player name order.
+
+        :param str column: The column name, one of the keys of `ATTRIBUTES`.
+        :return: The values
+        :rtype: list
+        """
+        return self.to_columns()[column].tolist()
+
     # ------------------------------------------------------------------------------------------------------------------
     # Getters
     # ------------------------------------------------------------------------------------------------------------------
@@ -54,10 +137,7 @@ class TeamBoxScore(object):
         :return: Player names
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.player_name)
-        return players
+        return self.get_column('player')
 
     def get_points(self):
         """
@@ -66,10 +146,7 @@ class TeamBoxScore(object):
         :return: Player points
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.points)
-        return players
+        return self.get_column('points')
 
     def get_rebounds(self):
         """
@@ -78,10 +155,7 @@ class TeamBoxScore(object):
         :return: Player rebounds
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.rebounds)
-        return players
+        return self.get_column('rebounds')
 
     def get_dates(self):
         """
@@ -90,10 +164,7 @@ class TeamBoxScore(object):
         :return: Dates as strings.
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.get_date_string())
-        return players
+        return self.get_column('date')
 
     def get_assists(self):
         """
@@ -102,10 +173,7 @@ class TeamBoxScore(object):
         :return: Player assists
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.assists)
-        return players
+        return self.get_column('assists')
 
     def get_made_field_goals(self):
         """
@@ -114,10 +182,7 @@ class TeamBoxScore(object):
         :return: Player made field goals
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.made_fg)
-        return players
+        return self.get_column('made_field_goals')
 
     def get_made_three_point_field_goals(self):
         """
@@ -126,10 +191,7 @@ class TeamBoxScore(object):
         :return: Player made three point field goals
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.made_threes)
-        return players
+        return self.get_column('made_three_point_field_goals')
 
     def get_made_free_throws(self):
         """
@@ -138,10 +200,7 @@ class TeamBoxScore(object):
         :return: Player made free throws
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.made_ft)
-        return players
+        return self.get_column('made_free_throws')
 
     def get_offensive_rebounds(self):
         """
@@ -150,10 +209,7 @@ class TeamBoxScore(object):
         :return: Player offensive rebounds
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.offensive_rebounds)
-        return players
+        return self.get_column('offensive_rebounds')
 
     def get_defensive_rebounds(self):
         """
@@ -162,10 +218,7 @@ class TeamBoxScore(object):
         :return: Player defensive rebounds
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.defensive_rebounds)
-        return players
+        return self.get_column('defensive_rebounds')
 
     def get_teams(self):
         """
@@ -174,10 +227,7 @@ class TeamBoxScore(object):
         :return: Player teams
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.player_team)
-        return players
+        return self.get_column('team')
 
     def get_locations(self):
         """
@@ -186,10 +236,7 @@ class TeamBoxScore(object):
         :return: Player locations
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.location)
-        return players
+        return self.get_column('location')
 
     def get_opponents(self):
         """
@@ -198,10 +245,7 @@ class TeamBoxScore(object):
         :return: Player opponents
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.opponent)
-        return players
+        return self.get_column('opponent')
 
     def get_outcomes(self):
         """
@@ -210,10 +254,7 @@ class TeamBoxScore(object):
         :return: Player outcomes
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.outcome)
-        return players
+        return self.get_column('outcome')
 
     def get_seconds_played(self):
         """
@@ -222,10 +263,7 @@ class TeamBoxScore(object):
         :return: Player seconds played
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.seconds_played)
-        return players
+        return self.get_column('seconds_played')
 
     def get_attempted_three_point_field_goals(self):
         """
@@ -234,10 +272,7 @@ class TeamBoxScore(object):
         :return: Player attempted three point field goals
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.attempted_threes)
-        return players
+        return self.get_column('attempted_three_point_field_goals')
 
     def get_attempted_field_goals(self):
         """
@@ -246,10 +281,7 @@ class TeamBoxScore(object):
         :return: Player attempted field goals
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.attempted_fg)
-        return players
+        return self.get_column('attempted_field_goals')
 
     def get_attempted_free_throws(self):
         """
@@ -258,10 +290,7 @@ class TeamBoxScore(object):
         :return: Player attempted free throws
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.attempted_ft)
-        return players
+        return self.get_column('attempted_free_throws')
 
     def get_steals(self):
         """
@@ -270,10 +299,7 @@ class TeamBoxScore(object):
         :return: Player steals
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.steals)
-        return players
+        return self.get_column('steals')
 
     def get_blocks(self):
         """
@@ -282,10 +308,7 @@ class TeamBoxScore(object):
         :return: Player blocks
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.blocks)
-        return players
+        return self.get_column('blocks')
 
     def get_turnovers(self):
         """
@@ -294,10 +317,7 @@ class TeamBoxScore(object):
         :return: Player turnovers
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.turnovers)
-        return players
+        return self.get_column('turnovers')
 
     def get_personal_fouls(self):
         """
@@ -306,10 +326,7 @@ class TeamBoxScore(object):
         :return: Player personal fouls
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.personal_fouls)
-        return players
+        return self.get_column('personal_fouls')
 
     def get_game_scores(self):
         """
@@ -318,10 +335,7 @@ class TeamBoxScore(object):
         :return: Player game scores
         :rtype: list
         """
-        players = []
-        for bs in sorted(self.player_box_scores, key=lambda x: x.player_name):
-            players.append(bs.game_score)
-        return players
+        return self.get_column('game_score')
 
 # ----------------------------------------------------------------------------------------------------------------------
 # End
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------------------------------------------------------------------
+# Top K Selection
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import numpy as np
+import pandas as pd
+
+# relative imports
+from .query import PLAYER
+
+
+def get_sort_keys(values, largest=True):
+    """
+    Converts values into keys where smaller is better. Missing values are always last.
+
+    :param values: The values, an array or series.
+    :param bool largest: Indicates if the largest values are the best.
+    :return: The keys
+    :rtype: numpy.ndarray
+    """
+    keys = np.asarray(values, dtype=np.float64)
+    if largest:
+        keys = -keys
+    return np.where(np.isnan(keys), np.inf, keys)
+
+
+def get_top_k_positions(values, k, largest=True):
+    """
+    Gets the positions of the k best values using a partial selection instead of a full sort. Equal values are
+    ordered by position, so the result does not depend on the sort algorithm.
+
+    :param values: The values, an array or series.
+    :param int k: Number of positions to get.
+    :param bool largest: Indicates if the largest values are the best.
+    :return: The positions, best first
+    :rtype: numpy.ndarray
+    """
+    keys = get_sort_keys(values, largest=largest)
+    if k <= 0 or keys.size == 0:
+        return np.array([], dtype=np.int64)
+    if k < keys.size:
+        kth = np.partition(keys, k - 1)[k - 1]
+        # every value as good as the kth, ties included, in position order
+        candidates = np.flatnonzero(keys <= kth)
+    else:
+        candidates = np.arange(keys.size)
+    order = np.lexsort((candidates, keys[candidates]))
+    return candidates[order][0:k]
+
+
+def get_kth_value(values, k, largest=True):
+    """
+    Gets the kth best value using a partial selection, ex: the 5th largest.
+
+    :param values: The values, an array or series.
+    :param int k: The rank, 1 is the best value.
+    :param bool largest: Indicates if the largest values are the best.
+    :return: The value, None if there are less than k values
+    :rtype: float
+    """
+    keys = get_sort_keys(values, largest=largest)
+    if k <= 0 or k > keys.size:
+        return None
+    kth = np.partition(keys, k - 1)[k - 1]
+    return -kth if largest else kth
+
+
+def get_top_k(df, column, k, largest=True):
+    """
+    Gets the rows with the k best values of a column, best first. Equal values keep the order of the data frame.
+
+    :param pandas.DataFrame df: The data frame.
+    :param str column: The column to rank on.
+    :param int k: Number of rows to get.
+    :param bool largest: Indicates if the largest values are the best.
+    :return: The rows
+    :rtype: pd.DataFrame
+    """
+    return df.take(get_top_k_positions(df[column], k, largest=largest))
+
+
+def get_top_k_by_group(df, column, k, by='team', largest=True):
+    """
+    Gets the rows with the k best values of a column in every group, ex: the 3 best scorers of every team.
+
+    :param pandas.DataFrame df: The data frame.
+    :param str column: The column to rank on.
+    :param int k: Number of rows to get per group.
+    :param str by: The column to group on, ex: team, date or player for the index.
+    :param bool largest: Indicates if the largest values are the best.
+    :return: The rows, grouped in order of first appearance and best first in each group
+    :rtype: pd.DataFrame
+    """
+    groups = df.index if by == PLAYER else df[by]
+    codes, _ = pd.factorize(groups)
+    values = df[column].to_numpy()
+    positions = []
+    # row positions of each group, in row order
+    order = np.argsort(codes, kind='stable')
+    start = np.count_nonzero(codes < 0)
+    for end in start + np.cumsum(np.bincount(codes[codes >= 0])):
+        group = order[start:end]
+        positions.append(group[get_top_k_positions(values[group], k, largest=largest)])
+        start = end
+    if not positions:
+        return df.iloc[0:0]
+    return df.take(np.concatenate(positions))
+
+# ----------------------------------------------------------------------------------------------------------------------
+# End
+# ----------------------------------------------------------------------------------------------------------------------
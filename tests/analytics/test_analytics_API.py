@@ -10,13 +10,35 @@ import shutil
 import logging
 import datetime
 import sys
+from unittest import mock
 sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
 # third party imports
-from basketball_reference_web_scraper.data import Team
+from basketball_reference_web_scraper.data import Team, Location, Outcome
 # relative imports
 from src import analytics_API as Api
 
 
+def create_box_score_dict(name, team, opponent, location=Location.HOME, outcome=Outcome.WIN, **stats):
+    """
+    Creates a player box score dictionary in the same format as the scraper client.
+
+    :param str name: Name of the player.
+    :param Team team: Team of the player.
+    :param Team opponent: Opponent of the player.
+    :param Location location: Home or away.
+    :param Outcome outcome: Win or loss.
+    :return: The player box score
+    :rtype: dict
+    """
+    box_score = {'name': name, 'team': team, 'opponent': opponent, 'location': location, 'outcome': outcome,
+                 'made_field_goals': 4, 'made_three_point_field_goals': 1, 'made_free_throws': 2,
+                 'offensive_rebounds': 1, 'defensive_rebounds': 3, 'assists': 5, 'seconds_played': 1800,
+                 'attempted_three_point_field_goals': 3, 'attempted_free_throws': 2, 'attempted_field_goals': 9,
+                 'steals': 1, 'blocks': 0, 'turnovers': 2, 'personal_fouls': 3, 'game_score': 9.5}
+    box_score.update(stats)
+    return box_score
+
+
 class TestAnalyticsApi(unittest.TestCase):
     """
     Test functions for the Analytics API functions.
@@ -71,6 +93,24 @@ class TestAnalyticsApi(unittest.TestCase):
                                             date_obj=test_date)
         self.assertEqual(bs, None)
 
+    def test_get_player_box_score_calendar(self):
+        """
+        The function `get_player_box_score` shall only request the game days of the provided calendar, counting the
+        timeout in game days.
+        """
+        calendar = mock.Mock()
+        calendar.get_previous_game_dates.return_value = [datetime.datetime(year=2019, month=10, day=25),
+                                                         datetime.datetime(year=2019, month=10, day=22)]
+        box_scores = [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.LOS_ANGELES_CLIPPERS)]
+        with mock.patch.object(Api.client, 'player_box_scores', side_effect=[[], box_scores]) as player_box_scores:
+            bs, date = Api.get_player_box_score(name='LeBron James', logger=self.logger,
+                                                date_obj=datetime.datetime(year=2019, month=10, day=27),
+                                                timeout=2, calendar=calendar)
+        calendar.get_previous_game_dates.assert_called_once_with(datetime.datetime(year=2019, month=10, day=27), 2)
+        self.assertEqual(2, player_box_scores.call_count)
+        self.assertEqual('LeBron James', bs['name'])
+        self.assertEqual(datetime.datetime(year=2019, month=10, day=22), date)
+
     # ------------------------------------------------------------------------------------------------------------------
     # get_team_box_score tests
     # ------------------------------------------------------------------------------------------------------------------
@@ -90,6 +130,127 @@ class TestAnalyticsApi(unittest.TestCase):
         self.assertEqual(len(team_dict[keys[0]]), 10)
         self.assertEqual([date.day, date.month, date.year], [test_date.day, test_date.month, test_date.year])
 
+    def test_get_daily_box_scores_single_request(self):
+        """
+        The function `get_daily_box_scores` shall group the player box scores by game using only the player box score
+        request when `single_request` is set.
+        """
+        test_date = datetime.datetime(year=2019, month=10, day=22)
+        box_scores = [
+            create_box_score_dict('Kawhi Leonard', Team.LOS_ANGELES_CLIPPERS, Team.LOS_ANGELES_LAKERS),
+            create_box_score_dict('Pascal Siakam', Team.TORONTO_RAPTORS, Team.NEW_ORLEANS_PELICANS),
+            create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.LOS_ANGELES_CLIPPERS,
+                                  location=Location.AWAY, outcome=Outcome.LOSS),
+            create_box_score_dict('Anthony Davis', Team.LOS_ANGELES_LAKERS, Team.LOS_ANGELES_CLIPPERS,
+                                  location=Location.AWAY, outcome=Outcome.LOSS),
+            create_box_score_dict('Brandon Ingram', Team.NEW_ORLEANS_PELICANS, Team.TORONTO_RAPTORS,
+                                  location=Location.AWAY, outcome=Outcome.LOSS),
+        ]
+        with mock.patch.object(Api.client, 'player_box_scores', return_value=box_scores), \
+                mock.patch.object(Api.client, 'team_box_scores') as team_box_scores:
+            team_dict, date = Api.get_daily_box_scores(date_obj=test_date, single_request=True)
+        team_box_scores.assert_not_called()
+        self.assertEqual(['LOS_ANGELES_LAKERS', 'LOS_ANGELES_CLIPPERS', 'NEW_ORLEANS_PELICANS', 'TORONTO_RAPTORS'],
+                         list(team_dict.keys()))
+        self.assertEqual(2, len(team_dict['LOS_ANGELES_LAKERS']))
+        self.assertEqual(test_date, date)
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # create_data_frame_from_daily_box_scores tests
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_create_data_frame_from_daily_box_scores_nominal(self):
+        """
+        The function `create_data_frame_from_daily_box_scores` shall create one row per player box score of every
+        day, including the derived stat columns.
+        """
+        first = datetime.datetime(year=2019, month=10, day=22)
+        second = datetime.datetime(year=2019, month=10, day=23)
+        daily_box_scores = {
+            first: [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.LOS_ANGELES_CLIPPERS),
+                    create_box_score_dict('Kawhi Leonard', Team.LOS_ANGELES_CLIPPERS, Team.LOS_ANGELES_LAKERS)],
+            second: [create_box_score_dict('Zion Williamson', Team.NEW_ORLEANS_PELICANS, Team.TORONTO_RAPTORS)],
+        }
+        df = Api.create_data_frame_from_daily_box_scores(daily_box_scores, self.logger)
+        self.assertEqual(3, df.shape[0])
+        self.assertEqual(['19_10_22', '19_10_22', '19_10_23'], df['date'].to_list())
+        self.assertEqual(11, df.loc['LeBron James', 'points'])
+        self.assertEqual(30.0, df.loc['LeBron James', 'minutes_played'])
+        self.assertEqual(2.5, df.loc['LeBron James', 'assist_turnover_ratio'])
+
+    def test_create_data_frame_from_daily_box_scores_empty(self):
+        """
+        The function `create_data_frame_from_daily_box_scores` shall create an empty data frame when no games were
+        played.
+        """
+        df = Api.create_data_frame_from_daily_box_scores({datetime.datetime(year=2019, month=7, day=1): []},
+                                                         self.logger)
+        self.assertEqual(0, df.shape[0])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # gather_new_on_dates tests
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_gather_new_on_dates_nominal(self):
+        """
+        The function `gather_new_on_dates` shall merge the player box scores of every date into the existing data and
+        write the csv once.
+        """
+        csv = os.path.join(self.logs_dir, 'box_scores.csv')
+        shutil.copy('small_data_set.csv', csv)
+
+        def player_box_scores(day, month, year):
+            if day == 24:
+                return []
+            return [create_box_score_dict('Player %s' % day, Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS)]
+
+        dates = [datetime.datetime(year=2019, month=10, day=day) for day in range(23, 26)]
+        with mock.patch.object(Api.client, 'player_box_scores', side_effect=player_box_scores), \
+                mock.patch.object(Api.pd.DataFrame, 'to_csv', autospec=True,
+                                  side_effect=Api.pd.DataFrame.to_csv) as to_csv:
+            df = Api.gather_new_on_dates(dates, csv, self.logger, requests_per_second=None)
+        self.assertEqual(1, to_csv.call_count)
+        self.assertEqual(57, df.shape[0])
+        saved_df = Api.get_existing_data_frame(csv, logger=self.logger)
+        self.assertEqual(['19_10_23', '19_10_25'], saved_df.loc[['Player 23', 'Player 25'], 'date'].to_list())
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # append_to_csv tests
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_append_to_csv_nominal(self):
+        """
+        The function `append_to_csv` shall append only the rows whose (player, date) key is not in the csv, in the
+        column order of the csv.
+        """
+        csv = os.path.join(self.logs_dir, 'box_scores.csv')
+        shutil.copy('small_data_set.csv', csv)
+        df = Api.get_existing_data_frame(csv, logger=self.logger)
+        new_df = df.iloc[0:2].copy()
+        new_df.loc[:, 'date'] = ['19_10_22', '19_10_23']
+        new_df = new_df[list(reversed(new_df.columns))]
+        appended = Api.append_to_csv(new_df, csv)
+        self.assertEqual(1, appended.shape[0])
+        saved_df = Api.get_existing_data_frame(csv, logger=self.logger)
+        self.assertEqual(df.shape[0] + 1, saved_df.shape[0])
+        self.assertEqual(list(df.columns), list(saved_df.columns))
+        self.assertEqual('19_10_23', saved_df['date'].iloc[-1])
+
+    def test_append_to_csv_partial_row(self):
+        """
+        The function `append_to_csv` shall remove a row left partly written by a crash before appending.
+        """
+        csv = os.path.join(self.logs_dir, 'box_scores.csv')
+        shutil.copy('small_data_set.csv', csv)
+        df = Api.get_existing_data_frame(csv, logger=self.logger)
+        new_df = df.iloc[0:1].copy()
+        new_df.loc[:, 'date'] = ['19_10_23']
+        with open(csv, 'a') as f:
+            f.write(new_df.to_csv(header=False)[0:20])
+        appended = Api.append_to_csv(new_df, csv)
+        self.assertEqual(1, appended.shape[0])
+        saved_df = Api.get_existing_data_frame(csv, logger=self.logger)
+        self.assertEqual(df.shape[0] + 1, saved_df.shape[0])
+        self.assertEqual(list(new_df.iloc[0].fillna(0)), list(saved_df.iloc[-1].fillna(0)))
+        self.assertEqual(0, Api.truncate_partial_line(csv))
+
     # ------------------------------------------------------------------------------------------------------------------
     # get_assist_turnover_ratio tests
     # ------------------------------------------------------------------------------------------------------------------
@@ -111,6 +272,58 @@ class TestAnalyticsApi(unittest.TestCase):
         turnovers = 0
         self.assertEqual(10.0, Api.get_assist_turnover_ratio(assists, turnovers))
 
+    # ------------------------------------------------------------------------------------------------------------------
+    # add_derived_stats tests
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_add_derived_stats_matches_scalar(self):
+        """
+        The function `add_derived_stats` shall calculate the same values as the scalar functions for every row,
+        including rows without attempts or turnovers.
+        """
+        df = Api.get_existing_data_frame('player_box_scores.csv', logger=self.logger).iloc[0:200].copy()
+        df.loc[df.index[0], ['attempted_field_goals', 'attempted_three_point_field_goals',
+                             'attempted_free_throws', 'turnovers']] = 0
+        Api.add_derived_stats(df)
+        for _, row in df.iterrows():
+            self.assertEqual(Api.convert_to_minutes(row['seconds_played']), row['minutes_played'])
+            self.assertEqual(Api.get_true_shooting(row['points'], row['attempted_field_goals'],
+                                                   row['attempted_three_point_field_goals'],
+                                                   row['attempted_free_throws']), row['true_shooting'])
+            self.assertEqual(Api.get_assist_turnover_ratio(row['assists'], row['turnovers']),
+                             row['assist_turnover_ratio'])
+        self.assertEqual(0.0, df['true_shooting'].iloc[0])
+        self.assertEqual(df['assists'].iloc[0], df['assist_turnover_ratio'].iloc[0])
+
+    # ------------------------------------------------------------------------------------------------------------------
+    # upsert_data_frame tests
+    # ------------------------------------------------------------------------------------------------------------------
+    def test_upsert_data_frame_correction(self):
+        """
+        The function `upsert_data_frame` shall replace a corrected row in place, insert new rows and report both
+        counts.
+        """
+        df = Api.get_existing_data_frame('small_data_set.csv', logger=self.logger)
+        new_df = df.iloc[[1, 2]].copy()
+        new_df.loc[:, 'points'] = [10, 30]
+        new_df.loc[:, 'date'] = ['19_10_22', '19_10_23']
+        merged_df, inserted, updated = Api.upsert_data_frame(df, new_df)
+        self.assertEqual(1, inserted)
+        self.assertEqual(1, updated)
+        self.assertEqual(df.shape[0] + 1, merged_df.shape[0])
+        self.assertEqual('Avery Bradley', merged_df.index[1])
+        self.assertEqual(10, merged_df['points'].iloc[1])
+        self.assertEqual(8, df['points'].iloc[1])
+        self.assertEqual(30, merged_df['points'].iloc[-1])
+
+    def test_merge_new_data_frame_same_rows(self):
+        """
+        The function `merge_new_data_frame` shall not add rows that are already in the data.
+        """
+        df = Api.get_existing_data_frame('player_box_scores.csv', logger=self.logger)
+        new_df = df[df['date'] == '20_03_11'].copy()
+        merged_df = Api.merge_new_data_frame(df.copy(), new_df, self.logger)
+        self.assertEqual(df.shape[0], merged_df.shape[0])
+
     # ------------------------------------------------------------------------------------------------------------------
     # get_team_date_df tests
     # ------------------------------------------------------------------------------------------------------------------
@@ -159,7 +372,35 @@ class TestAnalyticsApi(unittest.TestCase):
         res = Api.get_team_result_on_date('Los Angeles Lakers', date, df)
         self.assertEqual('95-86', res)
 
-    # todo add test for team or date not found?
+    def test_get_team_result_on_date_compact(self):
+        """
+        The functions `get_team_result_on_date` and `get_team_date_df` shall find the rows of a compact data frame.
+        """
+        my_csv = 'player_box_scores.csv'
+        df = Api.get_existing_data_frame(my_csv, logger=self.logger)
+        compact_df = Api.get_existing_data_frame(my_csv, logger=self.logger, compact=True)
+        date = datetime.datetime(day=25, month=10, year=2019)
+        self.assertEqual('95-86', Api.get_team_result_on_date('Los Angeles Lakers', date, compact_df))
+        team_df = Api.get_team_date_df(df, 'LOS_ANGELES_LAKERS', date)
+        compact_team_df = Api.get_team_date_df(compact_df, 'LOS_ANGELES_LAKERS', date)
+        self.assertTrue(team_df.shape[0] > 0)
+        self.assertEqual(list(team_df.index), list(compact_team_df.index))
+
+    def test_get_team_result_on_date_not_found(self):
+        """
+        The function `get_team_result_on_date` shall return None when the team did not play on the date, and reuse
+        the game results of the same data frame.
+        """
+        my_csv = 'player_box_scores.csv'
+        df = Api.get_existing_data_frame(my_csv, logger=self.logger)
+        date = datetime.datetime(day=25, month=10, year=2019)
+        self.assertIsNone(Api.get_team_result_on_date('Los Angeles Lakers', datetime.datetime(2019, 10, 24), df))
+        game_results = Api.get_game_results(df)
+        self.assertTrue(game_results is Api.get_game_results(df))
+        with mock.patch.object(Api.GameResults, 'create_table') as create_table:
+            self.assertEqual('95-86', Api.get_team_result_on_date('Los Angeles Lakers', date, df))
+        create_table.assert_not_called()
+        self.assertFalse(game_results is Api.get_game_results(df.iloc[1:]))
 
     # ------------------------------------------------------------------------------------------------------------------
     # create_scatter_plot_with_trend_line tests
@@ -302,6 +543,35 @@ class TestAnalyticsApi(unittest.TestCase):
                                                                   save_path=self.logs_dir)
         self.assertTrue(os.path.exists('%s.png' % plot_path))
 
+    def test_create_scatter_plot_with_trend_line_density(self):
+        """
+        The function `create_scatter_plot_with_trend_line` shall draw a 2-D histogram in density mode, with the
+        outliers computed on every row.
+        """
+        my_csv = 'player_box_scores.csv'
+        df = Api.get_existing_data_frame(my_csv, logger=self.logger)
+        svg, outlier_df, _ = Api.create_scatter_plot_with_trend_line(x_key='minutes_played', y_key='points', df=df,
+                                                                     mode='density', save_path='svg_buffer')
+        _, expected_df, _ = Api.create_scatter_plot_with_trend_line(x_key='minutes_played', y_key='points', df=df)
+        self.assertTrue(svg.startswith('<svg'))
+        self.assertEqual(list(expected_df.index), list(outlier_df.index))
+        self.assertEqual(list(expected_df['points']), list(outlier_df['points']))
+
+    def test_create_scatter_plot_with_trend_line_max_points(self):
+        """
+        The function `create_scatter_plot_with_trend_line` shall draw a sample of the rows above max_points, which
+        makes a smaller svg.
+        """
+        my_csv = 'player_box_scores.csv'
+        df = Api.get_existing_data_frame(my_csv, logger=self.logger)
+        full_svg, _, _ = Api.create_scatter_plot_with_trend_line(x_key='minutes_played', y_key='points', df=df,
+                                                                 save_path='svg_buffer')
+        svg, _, filtered_df = Api.create_scatter_plot_with_trend_line(x_key='minutes_played', y_key='points', df=df,
+                                                                      max_points=1000, save_path='svg_buffer')
+        self.assertTrue(len(svg) < len(full_svg))
+        self.assertTrue('1005 shown' in svg)
+        self.assertTrue(filtered_df.shape[0] > 1000)
+
     # ------------------------------------------------------------------------------------------------------------------
     # create_date_plot tests
     # ------------------------------------------------------------------------------------------------------------------
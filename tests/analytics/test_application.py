@@ -0,0 +1,141 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Application tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import datetime
+import time
+import os
+import sys
+import shutil
+from unittest import mock
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+import requests
+from basketball_reference_web_scraper.data import Team
+# relative imports
+from src.application import Application
+from src import analytics_API as Api
+from tests.analytics.test_analytics_API import create_box_score_dict
+
+
+class TestApplication(unittest.TestCase):
+    """
+    Test functions for the Application class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logs_dir = tempfile.mkdtemp()
+        self.csv = os.path.join(self.logs_dir, 'box_scores.csv')
+        self.date = datetime.datetime(year=2020, month=1, day=5, hour=21)
+        self.box_scores = {
+            '20_01_05': [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS)],
+            '20_01_06': [create_box_score_dict('Kemba Walker', Team.BOSTON_CELTICS, Team.MIAMI_HEAT)],
+        }
+        self.fetched = []
+        self.times = []
+        self.now = None
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.logs_dir):
+            shutil.rmtree(self.logs_dir)
+
+    def get_now(self):
+        """
+        Stand in for the current time, moves to the next time of the test on each call.
+        """
+        self.now = self.times.pop(0)
+        return self.now
+
+    def get_time(self):
+        """
+        Stand in for the current time in seconds since the epoch, used by the response cache.
+        """
+        return time.mktime(self.now.timetuple())
+
+    def player_box_scores(self, day, month, year):
+        """
+        Stand in for the scraper client. LeBron James' game is in progress until midnight.
+        """
+        date_string = datetime.datetime(year=year, month=month, day=day).strftime('%y_%m_%d')
+        self.fetched.append(date_string)
+        if date_string == '20_01_05' and self.now.day > 5:
+            return [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS,
+                                          made_field_goals=11)]
+        return self.box_scores.get(date_string, [])
+
+    def test_run_daemon_backoff(self):
+        """
+        The function `run_daemon` shall keep the data in memory, persist only changes, back off while nothing
+        changes and correct the stats of a game that was in progress, with the response cache in use.
+        """
+        app = Application(cache_dir=os.path.join(self.logs_dir, 'response_cache'), calendar_path=None,
+                          data_path=self.csv)
+        self.times = [self.date, self.date + datetime.timedelta(minutes=5),
+                      self.date + datetime.timedelta(hours=4)]
+        sleep_func = mock.Mock()
+        try:
+            with mock.patch.object(Api.client, 'player_box_scores', side_effect=self.player_box_scores), \
+                    mock.patch.object(time, 'time', side_effect=self.get_time), \
+                    mock.patch.object(Api, 'save_data_frame', wraps=Api.save_data_frame) as save_data_frame:
+                df = app.run_daemon(poll_seconds=10, max_poll_seconds=30, max_polls=3, sleep_func=sleep_func,
+                                    now_func=self.get_now)
+        finally:
+            Api.set_response_cache(None)
+        self.assertEqual([10, 20], [call[0][0] for call in sleep_func.call_args_list])
+        self.assertEqual(2, save_data_frame.call_count)
+        # the second poll is served by the cache, the third fetches the game in progress again
+        self.assertEqual(['20_01_05', '20_01_05', '20_01_06'], sorted(self.fetched))
+        self.assertEqual(['LeBron James', 'Kemba Walker'], list(df.index))
+        self.assertEqual(25, df.loc['LeBron James', 'points'])
+        saved_df = pd.read_csv(self.csv, index_col=0)
+        self.assertEqual(['LeBron James', 'Kemba Walker'], list(saved_df.index))
+        self.assertEqual(25, saved_df.loc['LeBron James', 'points'])
+        # the game results follow every merge
+        self.assertEqual('25-0', app.get_team_result('Los Angeles Lakers', self.date))
+        self.assertEqual('11-0', app.get_team_result('Boston Celtics', self.date + datetime.timedelta(days=1)))
+        self.assertIsNone(app.get_team_result('Miami Heat', self.date))
+
+    def test_run_daemon_errors(self):
+        """
+        The function `run_daemon` shall retry after a network error and raise any other error.
+        """
+        app = Application(cache_dir=None, calendar_path=None, data_path=self.csv)
+        self.times = [self.date, self.date]
+        sleep_func = mock.Mock()
+        with mock.patch.object(app, 'poll', side_effect=requests.exceptions.ConnectionError('offline')) as poll, \
+                self.assertLogs('src.application', level='ERROR') as logs:
+            app.run_daemon(poll_seconds=10, max_poll_seconds=30, max_polls=2, sleep_func=sleep_func,
+                           now_func=self.get_now)
+        self.assertEqual(2, poll.call_count)
+        self.assertTrue('Traceback' in logs.output[0])
+        self.times = [self.date]
+        with mock.patch.object(app, 'poll', side_effect=KeyError('date')):
+            with self.assertRaises(KeyError):
+                app.run_daemon(max_polls=2, sleep_func=sleep_func, now_func=self.get_now)
+
+    def test_get_changed_row_count(self):
+        """
+        The function `get_changed_row_count` shall only count rows that are new or have different stats.
+        """
+        daily_box_scores = {self.date: self.box_scores['20_01_05']}
+        df = Api.create_data_frame_from_daily_box_scores(daily_box_scores, mock.Mock())
+        df.to_csv(self.csv)
+        df = pd.read_csv(self.csv, index_col=0)
+        new_df = Api.create_data_frame_from_daily_box_scores(daily_box_scores, mock.Mock())
+        self.assertEqual(0, Api.get_changed_row_count(df, new_df))
+        new_df.loc['LeBron James', 'assists'] = 11
+        self.assertEqual(1, Api.get_changed_row_count(df, new_df))
+        self.assertEqual(1, Api.get_changed_row_count(None, new_df))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,129 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Async Client tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import asyncio
+import logging
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+# relative imports
+from src import async_client
+
+
+def create_daily_leaders_page(day):
+    """
+    Creates a daily leaders page holding a single LeBron James box score on even days and no box scores otherwise.
+
+    :param int day: The requested day.
+    :return: The page html
+    :rtype: str
+    """
+    cells = {'player': '<a href="/players/j/jamesle01.html">LeBron James</a>', 'team_id': 'LAL',
+             'game_location': '@', 'opp_id': 'LAC', 'game_result': 'L', 'mp': '36:22', 'fg': '7', 'fga': '19',
+             'fg3': '1', 'fg3a': '5', 'ft': '3', 'fta': '4', 'orb': '1', 'drb': '9', 'ast': '8', 'stl': '1',
+             'blk': '1', 'tov': '5', 'pf': '3', 'plus_minus': '-8', 'game_score': '11.4'}
+    row = ''
+    if day % 2 == 0:
+        row = '<tr>%s</tr>' % ''.join(['<td data-stat="%s">%s</td>' % (k, v) for k, v in cells.items()])
+    return '<html><body><table id="stats"><tbody>%s</tbody></table></body></html>' % row
+
+
+@unittest.skipIf(web is None, 'aiohttp is not installed')
+class TestAsyncClient(unittest.TestCase):
+    """
+    Test functions for the async client against a local stand in server.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def daily_leaders(self, request):
+        """
+        Stand in for the basketball reference daily leaders page.
+        """
+        self.requests.append(int(request.query['day']))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return web.Response(text=create_daily_leaders_page(int(request.query['day'])), content_type='text/html')
+
+    def run_with_server(self, func):
+        """
+        Runs a coroutine function with the base url of a local stand in server.
+        """
+        async def run():
+            app = web.Application()
+            app.router.add_get('/friv/dailyleaders.cgi', self.daily_leaders)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            port = site._server.sockets[0].getsockname()[1]
+            try:
+                return await func('http://127.0.0.1:%s' % port)
+            finally:
+                await runner.cleanup()
+        return asyncio.run(run())
+
+    def test_gather_daily_box_scores_concurrent(self):
+        """
+        The function `gather_daily_box_scores` shall request every date concurrently without exceeding the
+        connection limit.
+        """
+        dates = [datetime.datetime(year=2019, month=11, day=day) for day in range(1, 25)]
+
+        async def gather(base_url):
+            async with async_client.AsyncClient(base_url=base_url, max_connections=4,
+                                                requests_per_second=None) as client:
+                return await async_client.gather_daily_box_scores(client, dates)
+
+        results = self.run_with_server(gather)
+        self.assertEqual(dates, list(results.keys()))
+        self.assertEqual(24, len(self.requests))
+        self.assertTrue(1 < self.max_in_flight <= 4)
+        self.assertEqual('LeBron James', results[dates[1]][0]['name'])
+        self.assertEqual([], results[dates[0]])
+
+    def test_get_player_box_score_nominal(self):
+        """
+        The function `get_player_box_score` shall search backwards from the given date until the player is found.
+        """
+        async def search(base_url):
+            async with async_client.AsyncClient(base_url=base_url, requests_per_second=None) as client:
+                return await async_client.get_player_box_score(client, 'LeBron James', self.logger,
+                                                               date_obj=datetime.datetime(year=2019, month=11, day=5))
+
+        bs, date = self.run_with_server(search)
+        self.assertEqual('LOS_ANGELES_LAKERS', bs['team'].name)
+        self.assertEqual(4, date.day)
+
+    def test_rate_limiter_spacing(self):
+        """
+        The class `AsyncRateLimiter` shall space out requests by the configured rate.
+        """
+        async def wait_all():
+            limiter = async_client.AsyncRateLimiter(requests_per_second=20)
+            start = asyncio.get_running_loop().time()
+            await asyncio.gather(*[limiter.wait() for _ in range(5)])
+            return asyncio.get_running_loop().time() - start
+
+        self.assertTrue(asyncio.run(wait_all()) >= 0.19)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,65 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Backfill tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import logging
+import datetime
+import time
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# relative imports
+from src import backfill
+
+
+class TestBackfill(unittest.TestCase):
+    """
+    Test functions for the backfill functions.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.start = datetime.datetime(year=2019, month=10, day=22)
+
+    def test_get_dates_in_range_end_exclusive(self):
+        """
+        The function `get_dates_in_range` shall return every date from the start date up to the end date, exclusive.
+        """
+        dates = backfill.get_dates_in_range(self.start, self.start + datetime.timedelta(days=3))
+        self.assertEqual(3, len(dates))
+        self.assertEqual(self.start, dates[0])
+        self.assertEqual(self.start + datetime.timedelta(days=2), dates[-1])
+
+    def test_rate_limiter_spacing(self):
+        """
+        The class `RateLimiter` shall space out calls to `wait` by the configured rate.
+        """
+        limiter = backfill.RateLimiter(requests_per_second=20)
+        start = time.monotonic()
+        for _ in range(5):
+            limiter.wait()
+        self.assertTrue(time.monotonic() - start >= 0.19)
+
+    def test_fetch_days_ordered_results(self):
+        """
+        The function `fetch_days` shall return results ordered by date and report the dates that failed.
+        """
+        dates = backfill.get_dates_in_range(self.start, self.start + datetime.timedelta(days=6))
+
+        def fetch(date_obj, rate_limiter):
+            rate_limiter.wait()
+            if date_obj.day == 24:
+                raise ValueError('bad date')
+            return date_obj.day
+
+        results, failed = backfill.fetch_days(dates, fetch, self.logger, max_workers=3, requests_per_second=None)
+        self.assertEqual([22, 23, 25, 26, 27], list(results.values()))
+        self.assertEqual([datetime.datetime(year=2019, month=10, day=24)], failed)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,60 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Box Score tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+from basketball_reference_web_scraper.data import Team, Location, Outcome
+# relative imports
+from src.box_score import BoxScore
+from tests.analytics.test_analytics_API import create_box_score_dict
+
+
+class TestBoxScore(unittest.TestCase):
+    """
+    Test functions for the BoxScore class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.date = datetime.datetime(year=2020, month=1, day=5)
+        self.box_scores = [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS),
+                           create_box_score_dict('Kemba Walker', Team.BOSTON_CELTICS, Team.LOS_ANGELES_LAKERS,
+                                                 location=Location.AWAY, outcome=Outcome.LOSS,
+                                                 made_field_goals=7, offensive_rebounds=0)]
+
+    def test_slots(self):
+        """
+        The class `BoxScore` shall keep its attributes in slots.
+        """
+        box_score = BoxScore(self.box_scores[0], self.date)
+        self.assertFalse(hasattr(box_score, '__dict__'))
+        with self.assertRaises(AttributeError):
+            box_score.unknown = 1
+
+    def test_from_dicts(self):
+        """
+        The function `from_dicts` shall create the same box scores as the constructor, in order.
+        """
+        box_scores = BoxScore.from_dicts(self.box_scores, self.date)
+        self.assertEqual(['LeBron James', 'Kemba Walker'], [bs.player_name for bs in box_scores])
+        for box_score, bs_dict in zip(box_scores, self.box_scores):
+            expected = BoxScore(bs_dict, self.date)
+            for attribute in BoxScore.__slots__:
+                self.assertEqual(getattr(expected, attribute), getattr(box_score, attribute))
+        self.assertEqual(17, box_scores[1].points)
+        self.assertEqual(3, box_scores[1].rebounds)
+        self.assertEqual('BOSTON_CELTICS', box_scores[1].player_team)
+        self.assertEqual('AWAY', box_scores[1].location)
+        self.assertEqual('LOSS', box_scores[1].outcome)
+        self.assertEqual('20_01_05', box_scores[1].get_date_string())
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,112 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Response Cache tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import shutil
+import datetime
+import time
+import sys
+from unittest import mock
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# relative imports
+from src.cache import ResponseCache
+
+
+class TestResponseCache(unittest.TestCase):
+    """
+    Test functions for the ResponseCache class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.cache_dir = tempfile.mkdtemp()
+        self.past_date = datetime.datetime(year=2019, month=10, day=22)
+        self.calls = 0
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.cache_dir):
+            shutil.rmtree(self.cache_dir)
+
+    def fetch(self):
+        """
+        Stand in for a scraper request that counts how many times it was called.
+        """
+        self.calls += 1
+        return [{'name': 'LeBron James', 'points': self.calls}]
+
+    def test_fetch_past_date_cached(self):
+        """
+        The function `fetch` shall only call the fetch function once for a date that has already finished.
+        """
+        cache = ResponseCache(self.cache_dir)
+        first = cache.fetch('player_box_scores', self.past_date, self.fetch)
+        second = ResponseCache(self.cache_dir).fetch('player_box_scores', self.past_date, self.fetch)
+        self.assertEqual(1, self.calls)
+        self.assertEqual(first, second)
+
+    def test_fetch_today_ttl_expired(self):
+        """
+        The function `fetch` shall call the fetch function again for today's date once the time to live has passed.
+        """
+        cache = ResponseCache(self.cache_dir, today_ttl=0)
+        today = datetime.datetime.now()
+        cache.fetch('player_box_scores', today, self.fetch)
+        time.sleep(0.01)
+        value = cache.fetch('player_box_scores', today, self.fetch)
+        self.assertEqual(2, self.calls)
+        self.assertEqual(2, value[0]['points'])
+
+    def test_fetch_today_ttl_valid(self):
+        """
+        The function `fetch` shall use the cached response for today's date within the time to live.
+        """
+        cache = ResponseCache(self.cache_dir, today_ttl=600)
+        today = datetime.datetime.now()
+        cache.fetch('player_box_scores', today, self.fetch)
+        cache.fetch('player_box_scores', today, self.fetch)
+        self.assertEqual(1, self.calls)
+
+    def test_fetch_stored_before_date_ended(self):
+        """
+        The function `fetch` shall call the fetch function again for a past date whose response was stored before the
+        date ended, once the time to live has passed. Ex: stored at 09:00 before the games and read the next day.
+        """
+        cache = ResponseCache(self.cache_dir, today_ttl=600)
+        yesterday = datetime.datetime.now() - datetime.timedelta(days=1)
+        morning = datetime.datetime(year=yesterday.year, month=yesterday.month, day=yesterday.day, hour=9)
+        with mock.patch.object(time, 'time', return_value=time.mktime(morning.timetuple())):
+            cache.put('player_box_scores', yesterday, [])
+        value = cache.fetch('player_box_scores', yesterday, self.fetch)
+        self.assertEqual(1, self.calls)
+        self.assertEqual(1, value[0]['points'])
+        # the new response is used from the cache
+        cache.fetch('player_box_scores', yesterday, self.fetch)
+        self.assertEqual(1, self.calls)
+
+    def test_evict_least_recently_used(self):
+        """
+        The function `evict` shall remove the least recently used entries once the size budget is exceeded.
+        """
+        cache = ResponseCache(self.cache_dir)
+        cache.put('player_box_scores', self.past_date, list(range(1000)))
+        entry_size = cache.get_size()
+        cache.max_bytes = entry_size * 2
+        old_time = time.time() - 100
+        os.utime(cache.get_path('player_box_scores', self.past_date), (old_time, old_time))
+        cache.put('player_box_scores', self.past_date + datetime.timedelta(days=1), list(range(1000)))
+        cache.put('player_box_scores', self.past_date + datetime.timedelta(days=2), list(range(1000)))
+        found, _ = cache.get('player_box_scores', self.past_date)
+        self.assertFalse(found)
+        self.assertTrue(cache.get_size() <= cache.max_bytes)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
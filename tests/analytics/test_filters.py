@@ -0,0 +1,73 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Box Score Filter tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.filters import BoxScoreFilter
+from src.query import BoxScoreQuery
+from src import analytics_API as Api
+
+
+class TestBoxScoreFilter(unittest.TestCase):
+    """
+    Test functions for the BoxScoreFilter class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+
+    def test_apply_matches_chained_selections(self):
+        """
+        The function `apply` shall select the same rows as chained selections, from a data frame or a query.
+        """
+        expected = self.df[self.df['team'].isin(['LOS_ANGELES_LAKERS', 'UTAH_JAZZ'])]
+        expected = expected[expected['seconds_played'] >= 600]
+        expected = expected[expected['minutes_played'] <= 40]
+        box_filter = BoxScoreFilter().teams(['Los Angeles Lakers', 'UTAH_JAZZ'])
+        box_filter.where('seconds_played', '>=', 600).where('minutes_played', '<=', 40)
+        pd.testing.assert_frame_equal(expected, box_filter.apply(self.df))
+        pd.testing.assert_frame_equal(expected, box_filter.apply(BoxScoreQuery(self.df)))
+
+    def test_apply_lookups(self):
+        """
+        The function `apply` shall combine player, opponent and date lookups.
+        """
+        box_filter = BoxScoreFilter().players(['LeBron James']).opponents(['UTAH_JAZZ'])
+        box_filter.dates([datetime.datetime(day=25, month=10, year=2019), '20_03_01'])
+        expected = self.df[(self.df.index == 'LeBron James') & (self.df['opponent'] == 'UTAH_JAZZ') &
+                           (self.df['date'].isin(['19_10_25', '20_03_01']))]
+        self.assertEqual(1, expected.shape[0])
+        pd.testing.assert_frame_equal(expected, box_filter.apply(self.df))
+        pd.testing.assert_frame_equal(expected, box_filter.apply(BoxScoreQuery(self.df)))
+
+    def test_apply_empty(self):
+        """
+        The function `apply` shall return the data frame itself when the filter has no predicates.
+        """
+        box_filter = BoxScoreFilter()
+        self.assertTrue(box_filter.is_empty())
+        self.assertTrue(box_filter.apply(self.df) is self.df)
+
+    def test_scatter_plot_with_query(self):
+        """
+        The function `create_scatter_plot_with_trend_line` shall filter a query like a data frame.
+        """
+        kwargs = {'teams': ['Los Angeles Lakers'], 'min_seconds': 600, 'max_seconds': 2400}
+        _, _, df = Api.create_scatter_plot_with_trend_line('minutes_played', 'points', self.df, **kwargs)
+        _, _, query_df = Api.create_scatter_plot_with_trend_line('minutes_played', 'points',
+                                                                 BoxScoreQuery(self.df), **kwargs)
+        pd.testing.assert_frame_equal(df, query_df)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,67 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Game Results tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.game_results import GameResults
+from src import analytics_API as Api
+from src import schema
+
+
+class TestGameResults(unittest.TestCase):
+    """
+    Test functions for the GameResults class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+        self.date = datetime.datetime(day=25, month=10, year=2019)
+
+    def test_get_result_matches_scan(self):
+        """
+        The function `get_result` shall give the same score as summing the box scores of both teams.
+        """
+        results = GameResults(self.df)
+        self.assertEqual('95-86', results.get_result('Los Angeles Lakers', self.date))
+        self.assertEqual('86-95', results.get_result('UTAH_JAZZ', self.date))
+        for date, team in results.table.index[0:200]:
+            date_obj = datetime.datetime.strptime(date, '%y_%m_%d')
+            self.assertEqual(Api.get_team_result_on_date(team, date_obj, self.df), results.get_result(team, date))
+        self.assertIsNone(results.get_result('LOS_ANGELES_LAKERS', datetime.datetime(day=1, month=7, year=2019)))
+
+    def test_update_incremental(self):
+        """
+        The function `update` shall give the same table as a full build when days are added one at a time.
+        """
+        dates = sorted(self.df['date'].unique())
+        results = GameResults(self.df[self.df['date'].isin(dates[0:-2])])
+        results.update(self.df[self.df['date'] == dates[-2]])
+        results.update(self.df[self.df['date'].isin(dates[-2:])])
+        expected = GameResults(self.df).table.sort_index()
+        pd.testing.assert_frame_equal(expected, results.table.sort_index())
+        self.assertEqual(expected.shape[0], len(results.scores))
+
+    def test_standings_compact_schema(self):
+        """
+        The function `get_standings` shall count the wins and losses of every team, also from the compact schema.
+        """
+        results = GameResults(schema.to_compact(self.df))
+        self.assertEqual('95-86', results.get_result('Los Angeles Lakers', self.date))
+        standings = results.get_standings()
+        self.assertEqual(standings['wins'].sum(), standings['losses'].sum())
+        lakers = results.get_team_games('Los Angeles Lakers')
+        self.assertEqual((lakers['outcome'] == 'WIN').sum(), standings.loc['LOS_ANGELES_LAKERS', 'wins'])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
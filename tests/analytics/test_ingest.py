@@ -0,0 +1,72 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Columnar Ingest tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import logging
+import datetime
+import os
+import sys
+from collections import OrderedDict
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+from basketball_reference_web_scraper.data import Team, Location
+# relative imports
+from src import ingest
+from src import analytics_API as Api
+from src.team_box_score import TeamBoxScore
+from tests.analytics.test_analytics_API import create_box_score_dict
+
+
+class TestIngest(unittest.TestCase):
+    """
+    Test functions for the columnar ingest functions.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.date = datetime.datetime(year=2020, month=1, day=5)
+        self.box_scores = [
+            create_box_score_dict('Kemba Walker', Team.BOSTON_CELTICS, Team.LOS_ANGELES_LAKERS, location=Location.AWAY),
+            create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS, made_field_goals=11),
+            create_box_score_dict('Anthony Davis', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS, game_score=3.25),
+            create_box_score_dict('Jayson Tatum', Team.BOSTON_CELTICS, Team.LOS_ANGELES_LAKERS, location=Location.AWAY,
+                                  offensive_rebounds=4),
+        ]
+
+    def test_create_columns(self):
+        """
+        The function `create_columns` shall calculate points and rebounds and order rows by team then player name.
+        """
+        columns = ingest.create_columns(self.box_scores, self.date)
+        self.assertEqual(['Jayson Tatum', 'Kemba Walker', 'Anthony Davis', 'LeBron James'], list(columns['player']))
+        self.assertEqual([11, 11, 11, 25], list(columns['points']))
+        self.assertEqual([7, 4, 4, 4], list(columns['rebounds']))
+        self.assertEqual(['AWAY', 'AWAY', 'HOME', 'HOME'], list(columns['location']))
+        self.assertEqual('int64', str(columns['points'].dtype))
+        self.assertEqual(0, len(ingest.create_columns([], self.date)['player']))
+
+    def test_create_data_frame_matches_team_box_scores(self):
+        """
+        The function `create_data_frame` shall create the same data frame as the team box score objects.
+        """
+        second_date = self.date + datetime.timedelta(days=1)
+        daily_box_scores = {self.date: self.box_scores, second_date: self.box_scores[1:3]}
+        team_box_scores = []
+        for date_obj, box_scores in daily_box_scores.items():
+            team_dict = OrderedDict()
+            for player in box_scores:
+                team_dict.setdefault(player['team'].name, []).append(player)
+            for team, team_players in team_dict.items():
+                team_box_scores.append(TeamBoxScore(team_players, [], team, date_obj))
+        expected = Api.create_data_frame_from_team_box_scores(team_box_scores, self.logger)
+        pd.testing.assert_frame_equal(expected, ingest.create_data_frame(daily_box_scores))
+        self.assertEqual(0, ingest.create_data_frame({self.date: []}).shape[0])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,99 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Derived Metrics tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import shutil
+import logging
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.metrics import MetricRegistry
+from src import analytics_API as Api
+
+
+class TestMetricRegistry(unittest.TestCase):
+    """
+    Test functions for the MetricRegistry class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.logs_dir = tempfile.mkdtemp()
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+        self.computed_rows = []
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.logs_dir):
+            shutil.rmtree(self.logs_dir)
+
+    def stocks(self, df):
+        """
+        Stand in metric that records how many rows it was calculated for.
+        """
+        self.computed_rows.append(df.shape[0])
+        return df['steals'] + df['blocks']
+
+    def test_materialize_new_rows_only(self):
+        """
+        The function `materialize` shall only calculate an up to date metric for the rows missing it.
+        """
+        registry = MetricRegistry()
+        registry.register('stocks', self.stocks, ['steals', 'blocks'])
+        df = self.df.iloc[0:100].copy()
+        self.assertEqual(['stocks'], registry.materialize(df))
+        df = pd.concat([df, self.df.iloc[100:110]], sort=False)
+        self.assertEqual([], registry.materialize(df, versions=registry.get_versions()))
+        self.assertEqual([100, 10], self.computed_rows)
+        expected = self.df['steals'].iloc[0:110] + self.df['blocks'].iloc[0:110]
+        self.assertEqual(list(expected), list(df['stocks']))
+
+    def test_materialize_new_version(self):
+        """
+        The function `materialize` shall calculate a metric for every row when its version changed.
+        """
+        registry = MetricRegistry()
+        registry.register('stocks', self.stocks, ['steals', 'blocks'])
+        df = self.df.iloc[0:100].copy()
+        registry.materialize(df)
+        versions = registry.get_versions()
+        registry.register('stocks', self.stocks, ['steals', 'blocks'], version=2)
+        self.assertEqual(['stocks'], registry.materialize(df, versions=versions))
+        self.assertEqual([100, 100], self.computed_rows)
+
+    def test_save_versions(self):
+        """
+        The function `save_versions` shall record the metric versions next to a csv.
+        """
+        registry = MetricRegistry()
+        registry.register('stocks', self.stocks, ['steals', 'blocks'], version=3)
+        csv_path = os.path.join(self.logs_dir, 'box_scores.csv')
+        self.assertEqual({}, registry.load_versions(csv_path))
+        registry.save_versions(csv_path)
+        self.assertTrue(os.path.exists(os.path.join(self.logs_dir, 'box_scores.metrics.json')))
+        self.assertEqual({'stocks': 3}, registry.load_versions(csv_path))
+
+    def test_merge_new_data_frame_without_existing(self):
+        """
+        The function `merge_new_data_frame` shall add the derived stats when there is no existing data.
+        """
+        new_df = self.df.iloc[0:10][Api.Vars.supported_stats].copy()
+        df = Api.merge_new_data_frame(None, new_df, self.logger)
+        for name in Api.metric_registry.metrics.keys():
+            self.assertTrue(name in df.columns)
+        self.assertEqual(list(self.df['true_shooting'].iloc[0:10]), list(df['true_shooting']))
+        self.assertEqual(self.df['steals'].iloc[0] + self.df['blocks'].iloc[0], df['stocks'].iloc[0])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
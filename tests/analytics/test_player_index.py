@@ -0,0 +1,92 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Player Name Index tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import time
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.player_index import PlayerIndex
+from src import analytics_API as Api
+
+
+class TestPlayerIndex(unittest.TestCase):
+    """
+    Test functions for the PlayerIndex class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+        self.index = PlayerIndex(list(self.df.index.unique()) + ['Luka Dončić', 'P.J. Tucker'])
+
+    def test_get_exact_accents(self):
+        """
+        The function `get_exact` shall match names regardless of accents, case and punctuation.
+        """
+        self.assertEqual(['Luka Dončić'], self.index.get_exact('Luka Doncic'))
+        self.assertEqual(['Luka Dončić'], self.index.get_exact('LUKA DONČIĆ'))
+        self.assertEqual(['P.J. Tucker'], self.index.get_exact('pj tucker'))
+        self.assertEqual([], self.index.get_exact('Luka'))
+
+    def test_get_prefix(self):
+        """
+        The function `get_prefix` shall match the start of the full name or of a later word.
+        """
+        self.assertEqual(['LeBron James'], self.index.get_prefix('lebr'))
+        self.assertTrue('Luka Dončić' in self.index.get_prefix('donc'))
+
+    def test_get_fuzzy_ranking(self):
+        """
+        The function `get_fuzzy` shall rank the closest names first and `resolve` shall use it for misspellings.
+        """
+        ranked = self.index.get_fuzzy('Giannis Antetokounpo')
+        self.assertEqual('Giannis Antetokounmpo', ranked[0][0])
+        self.assertTrue(ranked[0][1] > ranked[1][1])
+        self.assertEqual('Giannis Antetokounmpo', self.index.resolve('giannis antetokounpo'))
+        self.assertIsNone(self.index.resolve('zzzz qqqq'))
+
+    def test_resolve_speed(self):
+        """
+        The function `resolve` shall take less than a millisecond per name.
+        """
+        names = ['Luka Doncic', 'lebron', 'Jamal Muray', 'kawhi leonard']
+        start = time.perf_counter()
+        for _ in range(25):
+            for name in names:
+                self.index.resolve(name)
+        self.assertTrue((time.perf_counter() - start) / 100 < 0.001)
+
+    def test_add_from_threads(self):
+        """
+        The function `add` shall give every name its own id when called from many threads.
+        """
+        index = PlayerIndex()
+        names = ['Player %s' % i for i in range(2000)]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(index.add, [names[i::8] for i in range(8)] + [names] * 4))
+        self.assertEqual(len(names), len(index.names))
+        self.assertEqual(list(range(len(names))), sorted(index.ids.values()))
+        for name in names[0:50]:
+            self.assertEqual(name, index.names[index.ids[name]])
+            self.assertEqual(name, index.resolve(name.lower()))
+
+    def test_create_date_plot_resolves_name(self):
+        """
+        The function `create_date_plot` shall resolve a player name with a different case, but not a prefix.
+        """
+        _, _, df = Api.create_date_plot('points', 'lebron james', self.df)
+        self.assertEqual((self.df.index == 'LeBron James').sum(), df.shape[0])
+        self.assertEqual('LeBron James', Api.resolve_player_name('lebr', self.df))
+        self.assertIsNone(Api.resolve_player_name('lebr', self.df, fuzzy=False))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Plot Cache tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import datetime
+import os
+import sys
+from unittest import mock
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.plot_cache import PlotCache
+from src import analytics_API as Api
+
+
+class TestPlotCache(unittest.TestCase):
+    """
+    Test functions for the PlotCache class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('small_data_set.csv', index_col=0)
+        self.cache = PlotCache()
+        Api.set_plot_cache(self.cache)
+
+    def tearDown(self):
+        """
+        Cleanup test specific variables.
+        """
+        Api.set_plot_cache(None)
+
+    def test_get_key(self):
+        """
+        The function `get_key` shall change with the data and the arguments of the plot.
+        """
+        key = PlotCache.get_key('scatter', self.df, {'save_path': 'svg_buffer'})
+        self.assertEqual(key, PlotCache.get_key('scatter', self.df.copy(), {'save_path': 'svg_buffer'}))
+        self.assertNotEqual(key, PlotCache.get_key('scatter', self.df, {'save_path': 'png_buffer'}))
+        self.assertNotEqual(key, PlotCache.get_key('scatter', self.df.iloc[1:], {'save_path': 'svg_buffer'}))
+        changed = self.df.copy()
+        changed.iloc[0, changed.columns.get_loc('points')] += 1
+        self.assertNotEqual(key, PlotCache.get_key('scatter', changed, {'save_path': 'svg_buffer'}))
+
+    def test_put_evicts_least_recently_used(self):
+        """
+        The function `put` shall evict the least recently used plots beyond the size budget.
+        """
+        cache = PlotCache(max_bytes=10)
+        cache.put('a', b'1234')
+        cache.put('b', '1234')
+        self.assertEqual(b'1234', cache.get('a'))
+        cache.put('c', b'1234')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(b'1234', cache.get('a'))
+        self.assertEqual(8, cache.size)
+        cache.put('d', b'12345678901')
+        self.assertIsNone(cache.get('d'))
+
+    def test_scatter_plot_cache_hit(self):
+        """
+        The function `create_scatter_plot_with_trend_line` shall return a cached plot without rendering it again.
+        """
+        svg, outlier_df, _ = Api.create_scatter_plot_with_trend_line('minutes_played', 'points', self.df,
+                                                                     save_path='svg_buffer')
+        with mock.patch.object(Api.plt, 'subplots') as subplots:
+            cached, cached_outlier_df, _ = Api.create_scatter_plot_with_trend_line('minutes_played', 'points',
+                                                                                   self.df, save_path='svg_buffer')
+        subplots.assert_not_called()
+        self.assertEqual(svg, cached)
+        pd.testing.assert_frame_equal(outlier_df, cached_outlier_df)
+        self.assertEqual(1, self.cache.hits)
+        png, _, _ = Api.create_scatter_plot_with_trend_line('minutes_played', 'points', self.df,
+                                                            save_path='png_buffer')
+        self.assertTrue(png.startswith(b'\x89PNG'))
+        self.assertEqual(2, len(self.cache.entries))
+
+    def test_date_plot_cache_hit(self):
+        """
+        The function `create_date_plot` shall return a cached plot without rendering it again.
+        """
+        player = self.df.index[0]
+        svg, _, _ = Api.create_date_plot('points', player, self.df, save_path='svg_buffer')
+        with mock.patch.object(Api.plt, 'subplots') as subplots:
+            cached, _, df = Api.create_date_plot('points', player, self.df, save_path='svg_buffer')
+        subplots.assert_not_called()
+        self.assertEqual(svg, cached)
+        self.assertTrue('datetime' in df.columns)
+
+    def test_bar_plot_cache_hit(self):
+        """
+        The function `create_bar_plot` shall return a cached plot without rendering it again.
+        """
+        date = datetime.datetime(day=22, month=10, year=2019)
+        team_df = Api.get_team_date_df(self.df, 'LOS_ANGELES_LAKERS', date)
+        svg = Api.create_bar_plot(team_df, ['points', 'rebounds'], save_path='svg_buffer', team='LOS_ANGELES_LAKERS',
+                                  date=date)
+        with mock.patch.object(Api.plt, 'subplots') as subplots:
+            cached = Api.create_bar_plot(team_df.copy(), ['points', 'rebounds'], save_path='svg_buffer',
+                                         team='LOS_ANGELES_LAKERS', date=date)
+        subplots.assert_not_called()
+        self.assertEqual(svg, cached)
+        self.assertEqual(1, self.cache.hits)
+        Api.create_bar_plot(team_df, ['points'], save_path='svg_buffer', team='LOS_ANGELES_LAKERS', date=date)
+        self.assertEqual(2, len(self.cache.entries))
+
+    def test_time_series_plot_cache_hit(self):
+        """
+        The function `create_time_series_plot` shall return a cached plot without rendering it again.
+        """
+        players = list(self.df.index.unique()[0:2])
+        time_series = Api.get_time_series(self.df, ['points', 'assists'], players=players)
+        svg = Api.create_time_series_plot(time_series, 'points', save_path='svg_buffer')
+        with mock.patch.object(Api.plt, 'subplots') as subplots:
+            cached = Api.create_time_series_plot(Api.get_time_series(self.df, ['points', 'assists'], players=players),
+                                                 'points', save_path='svg_buffer')
+        subplots.assert_not_called()
+        self.assertEqual(svg, cached)
+        self.assertEqual(1, self.cache.hits)
+        Api.create_time_series_plot(time_series, 'assists', save_path='svg_buffer')
+        Api.create_time_series_plot(Api.get_time_series(self.df, ['points'], players=players[0:1]), 'points',
+                                    save_path='svg_buffer')
+        self.assertEqual(3, len(self.cache.entries))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
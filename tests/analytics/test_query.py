@@ -0,0 +1,78 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Box Score Query tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import logging
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import numpy as np
+import pandas as pd
+# relative imports
+from src.query import BoxScoreQuery
+from src import analytics_API as Api
+from src import schema
+
+
+class TestBoxScoreQuery(unittest.TestCase):
+    """
+    Test functions for the BoxScoreQuery class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+        self.query = BoxScoreQuery(self.df)
+        self.date = datetime.datetime(day=25, month=10, year=2019)
+
+    def test_select_matches_scan(self):
+        """
+        The function `select` shall return the same rows as a scan of the whole data frame.
+        """
+        expected = self.df[(self.df['team'] == 'LOS_ANGELES_LAKERS') & (self.df['date'] == '19_10_25')]
+        pd.testing.assert_frame_equal(expected, self.query.select(team='Los Angeles Lakers', date=self.date))
+        expected = self.df[self.df.index.isin(['LeBron James']) & (self.df['opponent'] == 'UTAH_JAZZ')]
+        pd.testing.assert_frame_equal(expected, self.query.select(player='LeBron James', opponent='UTAH_JAZZ'))
+        expected = self.df[self.df['team'].isin(['UTAH_JAZZ', 'BOSTON_CELTICS'])]
+        pd.testing.assert_frame_equal(expected, self.query.select(teams=['Utah Jazz', 'Boston Celtics']))
+        self.assertEqual(0, self.query.select(team='LOS_ANGELES_LAKERS', date='19_07_01').shape[0])
+
+    def test_select_contiguous_slice(self):
+        """
+        The function `select` shall return a contiguous run of rows as a slice of the data frame.
+        """
+        df = self.query.select(date=self.date)
+        self.assertTrue(np.shares_memory(df['points'].to_numpy(), self.df['points'].to_numpy()))
+        self.assertEqual((self.df['date'] == '19_10_25').sum(), df.shape[0])
+
+    def test_select_compact_schema(self):
+        """
+        The function `select` shall look up dates of a data frame in the compact schema.
+        """
+        query = BoxScoreQuery(schema.to_compact(self.df))
+        df = query.select(team='LOS_ANGELES_LAKERS', date=self.date)
+        self.assertEqual(self.query.select(team='LOS_ANGELES_LAKERS', date=self.date).shape[0], df.shape[0])
+
+    def test_analytics_api_lookups(self):
+        """
+        The analytics API lookups shall give the same results for a query as for the data frame.
+        """
+        self.assertEqual('95-86', Api.get_team_result_on_date('Los Angeles Lakers', self.date, self.query))
+        self.assertEqual(Api.get_team_date_df(self.df, 'LOS_ANGELES_LAKERS', self.date).shape,
+                         Api.get_team_date_df(self.query, 'LOS_ANGELES_LAKERS', self.date).shape)
+        self.assertEqual(Api.filter_df_on_team_names(self.df, ['Utah Jazz']).shape,
+                         Api.filter_df_on_team_names(self.query, ['Utah Jazz']).shape)
+        _, outlier_df, df = Api.create_date_plot('points', 'LeBron James', self.query)
+        self.assertEqual((self.df.index == 'LeBron James').sum(), df.shape[0])
+        plot_path, _, _ = Api.create_date_plot('points', 'Not A Player', self.query)
+        self.assertEqual('Invalid player name of Not A Player', plot_path)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,89 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Batch Plot Rendering tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import logging
+import datetime
+import tempfile
+import os
+import sys
+import shutil
+from unittest import mock
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src import render
+
+
+class TestRender(unittest.TestCase):
+    """
+    Test functions for the batch plot rendering functions.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.df = pd.read_csv('small_data_set.csv', index_col=0)
+        self.player = self.df.index[0]
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Cleanup test specific variables.
+        """
+        shutil.rmtree(self.temp_dir)
+
+    def test_render_plots_buffers_and_paths(self):
+        """
+        The function `render_plots` shall return the result of every specification in order.
+        """
+        specs = [
+            {'plot': 'date', 'args': ['points', self.player], 'kwargs': {'save_path': 'svg_buffer'}},
+            {'plot': 'scatter', 'args': ['minutes_played', 'points'],
+             'kwargs': {'save_path': 'png_buffer', 'trend_line': False}},
+            {'plot': 'bar_graph', 'args': [['a', 'b'], [3, 7]], 'save_path': os.path.join(self.temp_dir, 'bar.png')},
+        ]
+        results, failed = render.render_plots(specs, self.logger, df=self.df, max_workers=2)
+        self.assertEqual([], failed)
+        self.assertTrue(results[0].startswith('<svg'))
+        self.assertTrue(results[1].startswith(b'\x89PNG'))
+        self.assertEqual(os.path.join(self.temp_dir, 'bar.png'), results[2])
+        self.assertTrue(os.path.exists(results[2]))
+
+    def test_render_plots_bar(self):
+        """
+        The function `render_plots` shall draw a bar plot of the rows of a team on a date.
+        """
+        date = datetime.datetime(day=22, month=10, year=2019)
+        specs = [{'plot': 'bar', 'args': [['points', 'rebounds']],
+                  'kwargs': {'save_path': 'svg_buffer', 'team': 'Los Angeles Lakers', 'date': date}}]
+        results, failed = render.render_plots(specs, self.logger, df=self.df, max_workers=1)
+        self.assertEqual([], failed)
+        self.assertTrue(results[0].startswith('<svg'))
+        team_df = self.df[(self.df['team'] == 'LOS_ANGELES_LAKERS') & (self.df['date'] == '19_10_22')]
+        self.assertTrue(0 < team_df.shape[0] < self.df.shape[0])
+        create_bar_plot = mock.Mock(return_value='path')
+        with mock.patch.dict(render.PLOTS, {'bar': (create_bar_plot, 0)}):
+            self.assertEqual('path', render.render_plot(specs[0], df=self.df))
+        self.assertEqual(list(team_df.index), list(create_bar_plot.call_args[0][0].index))
+
+    def test_render_plots_failed(self):
+        """
+        The function `render_plots` shall report the specifications that failed without stopping the others.
+        """
+        specs = [
+            {'plot': 'date', 'args': ['not_a_stat', self.player], 'kwargs': {'save_path': 'svg_buffer'}},
+            {'plot': 'date', 'args': ['points', self.player], 'kwargs': {'save_path': 'svg_buffer'}},
+        ]
+        results, failed = render.render_plots(specs, self.logger, df=self.df, max_workers=2)
+        self.assertEqual([0], failed)
+        self.assertIsNone(results[0])
+        self.assertTrue(results[1].startswith('<svg'))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,95 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Game Calendar tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import shutil
+import datetime
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+from basketball_reference_web_scraper.data import Team
+# relative imports
+from src.schedule import GameCalendar
+
+
+class TestGameCalendar(unittest.TestCase):
+    """
+    Test functions for the GameCalendar class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logs_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.logs_dir, 'calendar.json')
+        self.requested = []
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.logs_dir):
+            shutil.rmtree(self.logs_dir)
+
+    def fetch_schedule(self, season_end_year):
+        """
+        Stand in for the scraper season schedule. Start times are in UTC like the scraper.
+        """
+        self.requested.append(season_end_year)
+        if season_end_year != 2020:
+            return []
+        utc = datetime.timezone.utc
+        return [
+            # 10:00 pm eastern on 10/22 is already 10/23 in UTC
+            {'start_time': datetime.datetime(2019, 10, 23, 2, 0, tzinfo=utc),
+             'away_team': Team.LOS_ANGELES_LAKERS, 'home_team': Team.LOS_ANGELES_CLIPPERS},
+            {'start_time': datetime.datetime(2019, 10, 22, 23, 30, tzinfo=utc),
+             'away_team': Team.NEW_ORLEANS_PELICANS, 'home_team': Team.TORONTO_RAPTORS},
+            {'start_time': datetime.datetime(2019, 10, 25, 23, 30, tzinfo=utc),
+             'away_team': Team.LOS_ANGELES_LAKERS, 'home_team': Team.UTAH_JAZZ},
+            {'start_time': datetime.datetime(2019, 10, 28, 0, 0, tzinfo=utc),
+             'away_team': Team.CHARLOTTE_HORNETS, 'home_team': Team.LOS_ANGELES_LAKERS},
+        ]
+
+    def test_get_games_on_date_eastern_date(self):
+        """
+        The function `get_games_on_date` shall key games on the eastern date they are played on.
+        """
+        calendar = GameCalendar(self.path, fetch_schedule=self.fetch_schedule)
+        games = calendar.get_games_on_date(datetime.datetime(2019, 10, 22))
+        self.assertEqual(2, len(games))
+        self.assertTrue(['LOS_ANGELES_LAKERS', 'LOS_ANGELES_CLIPPERS'] in games)
+        self.assertFalse(calendar.is_game_day(datetime.datetime(2019, 10, 23)))
+
+    def test_get_game_dates_in_range_skips_off_days(self):
+        """
+        The function `get_game_dates_in_range` shall only return the days with games, end date exclusive.
+        """
+        calendar = GameCalendar(self.path, fetch_schedule=self.fetch_schedule)
+        dates = calendar.get_game_dates_in_range(datetime.datetime(2019, 10, 22, 15), datetime.datetime(2019, 10, 27))
+        self.assertEqual([datetime.datetime(2019, 10, 22), datetime.datetime(2019, 10, 25)], dates)
+
+    def test_get_previous_game_dates(self):
+        """
+        The function `get_previous_game_dates` shall return the most recent game days first, counting game days.
+        """
+        calendar = GameCalendar(self.path, fetch_schedule=self.fetch_schedule)
+        dates = calendar.get_previous_game_dates(datetime.datetime(2019, 10, 26, 12), 2)
+        self.assertEqual([datetime.datetime(2019, 10, 25), datetime.datetime(2019, 10, 22)], dates)
+
+    def test_final_season_persisted(self):
+        """
+        The class `GameCalendar` shall not fetch a finished season again once it has been persisted.
+        """
+        GameCalendar(self.path, fetch_schedule=self.fetch_schedule).get_game_dates(2020)
+        calendar = GameCalendar(self.path, fetch_schedule=self.fetch_schedule)
+        self.assertEqual(3, len(calendar.get_game_dates(2020)))
+        self.assertEqual([2020], self.requested)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,87 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Box Score Schema tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import shutil
+import logging
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import numpy as np
+import pandas as pd
+# relative imports
+from src import schema
+from src import analytics_API as Api
+from src.storage import BoxScoreStore
+
+
+class TestSchema(unittest.TestCase):
+    """
+    Test functions for the box score schema.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.logs_dir = tempfile.mkdtemp()
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.logs_dir):
+            shutil.rmtree(self.logs_dir)
+
+    def test_read_csv_dtypes(self):
+        """
+        The function `read_csv` shall load integer stats, categorical enum columns and a datetime date in less memory.
+        """
+        df = schema.read_csv('player_box_scores.csv')
+        self.assertEqual(np.int16, df['points'].dtype)
+        self.assertEqual(np.float32, df['true_shooting'].dtype)
+        self.assertTrue(pd.api.types.is_categorical_dtype(df['team']))
+        self.assertTrue(schema.is_compact(df))
+        self.assertEqual(2019, df['date'].iloc[0].year)
+        self.assertTrue(schema.get_memory_usage(df) * 3 < schema.get_memory_usage(self.df))
+
+    def test_to_legacy_round_trip(self):
+        """
+        The function `to_legacy` shall restore the csv schema of a compact data frame.
+        """
+        df = schema.to_legacy(schema.to_compact(self.df))
+        pd.testing.assert_frame_equal(self.df, df)
+
+    def test_to_compact_missing_values(self):
+        """
+        The function `to_compact` shall keep counting stats with missing values as floats and add unknown enum values
+        as categories.
+        """
+        df = self.df.iloc[0:3].copy()
+        df.loc[df.index[0], 'steals'] = np.nan
+        df.loc[df.index[1], 'team'] = 'SEATTLE_STORM'
+        df = schema.to_compact(df)
+        self.assertEqual(np.float32, df['steals'].dtype)
+        self.assertEqual('SEATTLE_STORM', df['team'].iloc[1])
+
+    def test_save_compact_data_frame(self):
+        """
+        The function `save_data_frame` shall write a compact data frame in the csv schema, to a csv or a store.
+        """
+        df = Api.get_existing_data_frame('player_box_scores.csv', self.logger, compact=True)
+        csv_path = os.path.join(self.logs_dir, 'box_scores.csv')
+        Api.save_data_frame(df, csv_path)
+        pd.testing.assert_frame_equal(self.df, pd.read_csv(csv_path, index_col=0))
+        store_path = os.path.join(self.logs_dir, 'store')
+        Api.save_data_frame(df, store_path)
+        self.assertEqual(self.df['date'].nunique(), len(BoxScoreStore(store_path).get_dates()))
+        self.assertEqual(['19_10_22'], list(BoxScoreStore(store_path).read(columns=['date'])['date'].unique()[0:1]))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Box Score Store tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import shutil
+import logging
+import datetime
+import sys
+from unittest import mock
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src.storage import BoxScoreStore
+from src import analytics_API as Api
+
+
+class TestBoxScoreStore(unittest.TestCase):
+    """
+    Test functions for the BoxScoreStore class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.logs_dir = tempfile.mkdtemp()
+        self.store_path = os.path.join(self.logs_dir, 'store')
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+
+    def tearDown(self):
+        """
+        Performs any necessary clean up.
+        """
+        if os.path.exists(self.logs_dir):
+            shutil.rmtree(self.logs_dir)
+
+    def test_write_read_round_trip(self):
+        """
+        The class `BoxScoreStore` shall read back the same data that was written, one partition per date.
+        """
+        store = BoxScoreStore(self.store_path)
+        written = store.write(self.df)
+        self.assertEqual(self.df['date'].nunique(), written)
+        df = BoxScoreStore(self.store_path).read()
+        expected = self.df.sort_values('date', kind='mergesort')
+        pd.testing.assert_frame_equal(expected, df.loc[:, expected.columns], check_index_type=False)
+
+    def test_read_projection_and_predicates(self):
+        """
+        The function `read` shall only return the requested columns of rows matching the date and team predicates.
+        """
+        store = BoxScoreStore(self.store_path)
+        store.write(self.df)
+        start = datetime.datetime(year=2019, month=10, day=22)
+        end = datetime.datetime(year=2019, month=10, day=25)
+        df = store.read(columns=['points', 'date'], start_date=start, end_date=end, teams=['LOS_ANGELES_LAKERS'])
+        expected = self.df[(self.df['team'] == 'LOS_ANGELES_LAKERS') &
+                           (self.df['date'].isin(['19_10_22', '19_10_23', '19_10_24', '19_10_25']))]
+        self.assertEqual(['points', 'date'], list(df.columns))
+        self.assertEqual(expected.shape[0], df.shape[0])
+        self.assertEqual(expected['points'].sum(), df['points'].sum())
+
+    def test_get_partition_keys_team_pruning(self):
+        """
+        The function `get_partition_keys` shall skip the partitions of dates a team did not play on.
+        """
+        store = BoxScoreStore(self.store_path)
+        store.write(self.df)
+        keys = store.get_partition_keys(teams=['LOS_ANGELES_LAKERS'])
+        lakers_dates = self.df[self.df['team'] == 'LOS_ANGELES_LAKERS']['date'].nunique()
+        self.assertEqual(lakers_dates, len(keys))
+
+    def test_write_dates_only(self):
+        """
+        The function `write` shall only touch the partitions of the given dates.
+        """
+        store = BoxScoreStore(self.store_path)
+        store.write(self.df)
+        other = os.path.join(self.store_path, store.manifest['partitions']['2019-10-23']['file'])
+        modified = os.path.getmtime(other)
+        changed = self.df.copy()
+        changed.loc[changed['date'] == '19_10_22', 'points'] = 0
+        self.assertEqual(1, store.write(changed, dates=['19_10_22']))
+        self.assertEqual(modified, os.path.getmtime(other))
+        df = store.read(columns=['points'], end_date=datetime.datetime(year=2019, month=10, day=22))
+        self.assertEqual(0, df['points'].sum())
+
+    def test_append_skips_existing_keys(self):
+        """
+        The function `append` shall only append rows whose (player, date) key is not stored yet.
+        """
+        store = BoxScoreStore(self.store_path)
+        store.write(self.df[self.df['date'] != '20_03_11'])
+        new_df = self.df[self.df['date'].isin(['20_03_10', '20_03_11'])]
+        appended = store.append(new_df)
+        expected = (self.df['date'] == '20_03_11').sum()
+        self.assertEqual(expected, appended.shape[0])
+        self.assertEqual(self.df.shape[0], store.get_row_count())
+        self.assertEqual(0, store.append(new_df).shape[0])
+        self.assertEqual(self.df.shape[0], BoxScoreStore(self.store_path).read().shape[0])
+
+    def test_append_crash_keeps_history(self):
+        """
+        The function `append` shall leave the stored data unchanged when it fails before committing.
+        """
+        store = BoxScoreStore(self.store_path)
+        store.write(self.df)
+        changed = self.df[self.df['date'] == '19_10_22'].copy()
+        changed.index = changed.index + ' Jr.'
+        with mock.patch.object(BoxScoreStore, 'save_manifest', side_effect=IOError('disk full')):
+            with self.assertRaises(IOError):
+                store.append(changed)
+        df = BoxScoreStore(self.store_path).read()
+        self.assertEqual(self.df.shape[0], df.shape[0])
+
+    def test_get_existing_data_frame_store(self):
+        """
+        The function `get_existing_data_frame` shall load a box score store when given a store directory.
+        """
+        Api.save_data_frame(self.df, self.store_path)
+        df = Api.get_existing_data_frame(self.store_path, logger=self.logger)
+        self.assertEqual(self.df.shape, df.shape)
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,69 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Team Box Score tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import logging
+import datetime
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+from basketball_reference_web_scraper.data import Team, Location
+# relative imports
+from src.team_box_score import TeamBoxScore
+from src.constants import Vars
+from src import analytics_API as Api
+from tests.analytics.test_analytics_API import create_box_score_dict
+
+
+class TestTeamBoxScore(unittest.TestCase):
+    """
+    Test functions for the TeamBoxScore class.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.logger = logging.getLogger(__name__)
+        self.date = datetime.datetime(year=2020, month=1, day=5)
+        self.lakers = [create_box_score_dict('LeBron James', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS,
+                                             made_field_goals=11),
+                       create_box_score_dict('Anthony Davis', Team.LOS_ANGELES_LAKERS, Team.BOSTON_CELTICS,
+                                             made_three_point_field_goals=0, game_score=20.1)]
+        self.celtics = [create_box_score_dict('Kemba Walker', Team.BOSTON_CELTICS, Team.LOS_ANGELES_LAKERS,
+                                              location=Location.AWAY)]
+
+    def test_to_columns_sorted_once(self):
+        """
+        The function `to_columns` shall hold every stat in player name order, matching the getters.
+        """
+        tbs = TeamBoxScore(self.lakers, [], 'LOS_ANGELES_LAKERS', self.date)
+        columns = tbs.to_columns()
+        self.assertEqual(['Anthony Davis', 'LeBron James'], list(columns['player']))
+        self.assertEqual([10, 25], list(columns['points']))
+        self.assertEqual(['20_01_05', '20_01_05'], list(columns['date']))
+        self.assertEqual(tbs.get_points(), columns['points'].tolist())
+        self.assertEqual(tbs.get_game_scores(), [20.1, 9.5])
+        self.assertTrue(columns is tbs.to_columns())
+        df = tbs.to_frame()
+        self.assertEqual(Vars.supported_stats, list(df.columns))
+        self.assertEqual(25, df.loc['LeBron James', 'points'])
+
+    def test_create_data_frame_from_team_box_scores(self):
+        """
+        The function `create_data_frame_from_team_box_scores` shall join the columns of every team in order.
+        """
+        team_box_scores = [TeamBoxScore(self.lakers, [], 'LOS_ANGELES_LAKERS', self.date),
+                           TeamBoxScore(self.celtics, [], 'BOSTON_CELTICS', self.date)]
+        df = Api.create_data_frame_from_team_box_scores(team_box_scores, self.logger)
+        self.assertEqual(['Anthony Davis', 'LeBron James', 'Kemba Walker'], list(df.index))
+        self.assertEqual(Vars.supported_stats, list(df.columns))
+        self.assertEqual(['LOS_ANGELES_LAKERS', 'LOS_ANGELES_LAKERS', 'BOSTON_CELTICS'], list(df['team']))
+        self.assertEqual('int64', str(df['points'].dtype))
+        self.assertEqual(0, Api.create_data_frame_from_team_box_scores([], self.logger).shape[0])
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
@@ -0,0 +1,76 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Time Series tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import tempfile
+import os
+import sys
+import shutil
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import pandas as pd
+# relative imports
+from src import analytics_API as Api
+from src import schema
+
+
+class TestTimeSeries(unittest.TestCase):
+    """
+    Test functions for the batch time series functions.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+        self.players = ['LeBron James', 'Anthony Davis', 'Not A Player']
+        self.stats = ['points', 'assists']
+        self.temp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        """
+        Cleanup test specific variables.
+        """
+        shutil.rmtree(self.temp_dir)
+
+    def test_get_time_series_players(self):
+        """
+        The function `get_time_series` shall return a date indexed data frame per player, in the order given.
+        """
+        time_series = Api.get_time_series(self.df, self.stats, players=self.players)
+        self.assertEqual(['LeBron James', 'Anthony Davis'], list(time_series.keys()))
+        for player, series_df in time_series.items():
+            expected = self.df.loc[[player], ['date'] + self.stats]
+            self.assertEqual(self.stats, list(series_df.columns))
+            self.assertTrue(series_df.index.is_monotonic_increasing)
+            self.assertEqual(expected.shape[0], series_df.shape[0])
+            self.assertEqual(sorted(pd.to_datetime(expected['date'], format='%y_%m_%d')), list(series_df.index))
+            self.assertEqual(expected['points'].sum(), series_df['points'].sum())
+
+    def test_get_time_series_teams(self):
+        """
+        The function `get_time_series` shall sum the stats of a team's players per date.
+        """
+        time_series = Api.get_time_series(self.df, ['points'], teams=['Los Angeles Lakers'], by='team')
+        self.assertEqual(['LOS_ANGELES_LAKERS'], list(time_series.keys()))
+        lakers = self.df[self.df['team'] == 'LOS_ANGELES_LAKERS']
+        expected = lakers.groupby('date')['points'].sum()
+        self.assertEqual(list(expected), list(time_series['LOS_ANGELES_LAKERS']['points']))
+        compact = Api.get_time_series(schema.to_compact(self.df), ['points'], teams=['Los Angeles Lakers'], by='team')
+        self.assertEqual(list(expected), list(compact['LOS_ANGELES_LAKERS']['points']))
+
+    def test_create_time_series_plot(self):
+        """
+        The function `create_time_series_plot` shall save a plot with a line per series.
+        """
+        time_series = Api.get_time_series(self.df, self.stats, players=self.players[0:2])
+        plot_path = Api.create_time_series_plot(time_series, 'points', save_path=self.temp_dir)
+        self.assertTrue(os.path.exists(plot_path + '.png'))
+        svg = Api.create_time_series_plot(time_series, 'points', save_path='svg_buffer')
+        self.assertTrue(svg.startswith('<svg'))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------
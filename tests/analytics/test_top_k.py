@@ -0,0 +1,70 @@
+# ----------------------------------------------------------------------------------------------------------------------
+#    Top K Selection tests
+# ----------------------------------------------------------------------------------------------------------------------
+
+# imports
+import unittest
+import os
+import sys
+sys.path.append(os.getcwd())  # this was needed to run the coverage library outside of pycharm
+# third party imports
+import numpy as np
+import pandas as pd
+# relative imports
+from src import top_k
+from src import analytics_API as Api
+
+
+class TestTopK(unittest.TestCase):
+    """
+    Test functions for the top k selection functions.
+    """
+    def setUp(self):
+        """
+        Initialize test specific variables.
+        """
+        self.df = pd.read_csv('player_box_scores.csv', index_col=0)
+
+    def test_get_top_k_positions_ties(self):
+        """
+        The function `get_top_k_positions` shall order equal values by position and put missing values last.
+        """
+        values = np.array([3, 7, np.nan, 7, 1, 9, 7])
+        self.assertEqual([5, 1, 3], list(top_k.get_top_k_positions(values, 3)))
+        self.assertEqual([4, 0, 1], list(top_k.get_top_k_positions(values, 3, largest=False)))
+        self.assertEqual([5, 1, 3, 6, 0, 4, 2], list(top_k.get_top_k_positions(values, 10)))
+        self.assertEqual(7, top_k.get_kth_value(values, 4))
+        self.assertIsNone(top_k.get_kth_value(values, 8))
+
+    def test_get_top_k_matches_sort(self):
+        """
+        The function `get_top_k` shall return the same rows as a stable full sort.
+        """
+        expected = self.df.sort_values('points', ascending=False, kind='mergesort').head(25)
+        pd.testing.assert_frame_equal(expected, top_k.get_top_k(self.df, 'points', 25))
+
+    def test_get_top_k_by_group(self):
+        """
+        The function `get_top_k_by_group` shall return the best rows of every group.
+        """
+        df = top_k.get_top_k_by_group(self.df, 'points', 2, by='team')
+        self.assertEqual(2 * self.df['team'].nunique(), df.shape[0])
+        lakers = df[df['team'] == 'LOS_ANGELES_LAKERS']
+        expected = self.df[self.df['team'] == 'LOS_ANGELES_LAKERS']['points'].nlargest(2)
+        self.assertEqual(list(expected), list(lakers['points']))
+        df = top_k.get_top_k_by_group(self.df, 'points', 1, by='player')
+        self.assertEqual(self.df.index.nunique(), df.shape[0])
+        self.assertEqual(self.df.loc['LeBron James', 'points'].max(), df.loc['LeBron James', 'points'])
+
+    def test_scatter_plot_more_than_fifteen_outliers(self):
+        """
+        The function `create_scatter_plot_with_trend_line` shall label more than 15 outliers when asked to.
+        """
+        _, outlier_df, _ = Api.create_scatter_plot_with_trend_line('minutes_played', 'points', self.df,
+                                                                   num_outliers=20, trend_line=False)
+        self.assertTrue(outlier_df.shape[0] >= 20)
+        self.assertEqual(self.df['points'].nlargest(20).min(), outlier_df['points'].min())
+
+# ----------------------------------------------------------------------------------------------------------------------
+#    End
+# ----------------------------------------------------------------------------------------------------------------------